@@ -0,0 +1,18 @@
+"""
+Runs and times the yearly solvers, see `python -m aoc run --help`.
+"""
+
+from aoc.registry import PUZZLES, Puzzle, get_puzzle, list_puzzles
+from aoc.runner import RunResult, format_table, run_all, run_isolated, run_part
+
+__all__ = [
+    "PUZZLES",
+    "Puzzle",
+    "RunResult",
+    "format_table",
+    "get_puzzle",
+    "list_puzzles",
+    "run_all",
+    "run_isolated",
+    "run_part",
+]
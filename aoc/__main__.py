@@ -0,0 +1,92 @@
+"""
+python -m aoc run 2024 16 --part 2 --input path
+python -m aoc run --all [2024] [--processes 4]
+python -m aoc run 2024 6 --part 2 --stats stats.json --flamegraph day6.folded
+"""
+
+import argparse
+import json
+
+import instrument
+from aoc.registry import get_puzzle, list_puzzles
+from aoc.runner import (
+    RunResult,
+    folded_stacks,
+    format_table,
+    run_all,
+    run_isolated,
+    stats_json,
+)
+
+
+def print_results(results: list[RunResult]) -> None:
+    print(format_table(results))
+    for r in results:
+        if r.traceback is not None:
+            print(f"\n{r.year} day {r.day} part {r.part} crashed:\n{r.traceback}")
+
+
+def write_stats(args: argparse.Namespace, results: list[RunResult]) -> None:
+    if args.stats is not None:
+        with open(args.stats, "w") as f:
+            json.dump(stats_json(results), f, indent=1)
+    if args.flamegraph is not None:
+        with open(args.flamegraph, "w") as f:
+            f.write(folded_stacks(results))
+
+
+def run(args: argparse.Namespace) -> None:
+    parts = [1, 2] if args.part is None else [args.part]
+    if args.stats is not None or args.flamegraph is not None:
+        # before any solver is imported, the decorators are bound on import
+        instrument.enable()
+    if args.all:
+        if args.day is not None or args.input is not None:
+            raise SystemExit("--all runs every day with its default input")
+        results = run_all(list_puzzles(args.year), parts, args.processes)
+        print_results(results)
+        write_stats(args, results)
+        return
+
+    if args.year is None or args.day is None:
+        raise SystemExit("a year and day are needed without --all")
+    try:
+        puzzle = get_puzzle(args.year, args.day)
+    except KeyError as e:
+        raise SystemExit(e.args[0])
+    if args.part is not None and args.part not in puzzle.parts:
+        raise SystemExit(
+            f"part {args.part} is not registered for {args.year} day {args.day}"
+        )
+    # one fresh process per part so each peak RSS is its own
+    keys = [(args.year, args.day, part) for part in parts if part in puzzle.parts]
+    results = run_isolated(keys, processes=1, fname=args.input)
+    print_results(results)
+    write_stats(args, results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run and time solvers")
+    run_parser.add_argument("year", type=int, nargs="?")
+    run_parser.add_argument("day", type=int, nargs="?")
+    run_parser.add_argument("--part", type=int, choices=[1, 2])
+    run_parser.add_argument("--input", help="defaults to the year's data file")
+    run_parser.add_argument("--all", action="store_true", help="run every day")
+    run_parser.add_argument("--processes", type=int, help="pool size for --all")
+    run_parser.add_argument(
+        "--stats", help="write counters, cache hits and phase timings as json"
+    )
+    run_parser.add_argument(
+        "--flamegraph", help="write phase timings as collapsed stacks"
+    )
+    run_parser.set_defaults(fn=run)
+
+    args = parser.parse_args()
+    args.fn(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Every solver the runner knows about. Entries only name the module and its
+functions, nothing is imported until a puzzle is run.
+"""
+
+import importlib
+import os
+import sys
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True)
+class Puzzle:
+    year: int
+    day: int
+    # import name with the year directory on sys.path, e.g. "day16" for the
+    # 2024 scripts and "y2023.d17" for the 2023 package modules
+    module: str
+    # fname -> problem, None passes the input path straight to the parts
+    parse: str | None
+    # part number -> problem -> answer. Dotted names are looked up through
+    # attributes, so "Problem.solve" calls Problem.solve(problem).
+    parts: dict[int, str] = field(default_factory=dict)
+    # input file relative to the year directory, data/<module name>.txt by
+    # default
+    input: str | None = None
+
+    @property
+    def directory(self) -> str:
+        return os.path.join(REPO_ROOT, f"y{self.year}")
+
+    @property
+    def default_input(self) -> str:
+        fname = self.input or f"data/{self.module.rsplit('.', 1)[-1]}.txt"
+        return os.path.join(self.directory, fname)
+
+    def load(self) -> ModuleType:
+        # the 2024 scripts import their own `utils` and the 2023 modules the
+        # repo root `grid` and `utils`, so both directories are searched,
+        # the puzzle's own first even when the root is already on the path
+        for path in [REPO_ROOT, self.directory]:
+            if path in sys.path:
+                sys.path.remove(path)
+            sys.path.insert(0, path)
+        return importlib.import_module(self.module)
+
+    def get_parse(self, module: ModuleType) -> Callable[[str], Any]:
+        if self.parse is None:
+            return lambda fname: fname
+        return _lookup(module, self.parse)
+
+    def get_part(self, module: ModuleType, part: int) -> Callable[[Any], Any]:
+        return _lookup(module, self.parts[part])
+
+
+def _lookup(module: ModuleType, name: str):
+    obj = module
+    for attr in name.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+PUZZLES = [
+    Puzzle(2023, 1, "y2023.d1", None, {1: "part1", 2: "part2"}),
+    Puzzle(2023, 2, "y2023.d2", "parse_games", {1: "p1", 2: "p2"}),
+    Puzzle(2023, 3, "y2023.d3", None, {1: "p1", 2: "p2"}),
+    Puzzle(2023, 4, "y2023.d4", "parse_cards", {1: "p1", 2: "p2"}),
+    Puzzle(2023, 5, "y2023.d5", "parse_file", {1: "p1"}),
+    Puzzle(2023, 16, "y2023.d16", "read_grid", {1: "p1", 2: "p2"}),
+    Puzzle(2023, 17, "y2023.d17", "parse_heatmap", {1: "min_dist", 2: "min_dist_v2"}),
+    Puzzle(2023, 19, "y2023.d19", "parse", {1: "p1"}),
+    Puzzle(2023, 20, "y2023.d20", None, {1: "part_1"}),
+    Puzzle(2023, 21, "y2023.d21", "parse_garden", {1: "p1", 2: "p2"}),
+    Puzzle(2023, 22, "y2023.d22", "parse_file", {1: "p1", 2: "p2"}),
+    Puzzle(2023, 23, "y2023.d23", "parse_file", {1: "p1", 2: "p2"}),
+    Puzzle(2023, 24, "y2023.d24", "parse_file", {1: "p1"}),
+    Puzzle(2023, 25, "y2023.d25", None, {1: "part1"}),
+    Puzzle(2024, 1, "day1", "get_ids", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 2, "day2", "get_input", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 4, "day4", "parse_grid", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 5, "day5", "read_inputs", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 6, "day6", "parse_grid", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 7, "day7", "parse_problems", {1: "part_1"}),
+    Puzzle(2024, 8, "day8", "parse_grid", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 9, "day9", "read_disk_map", {1: "part_1", 2: "part_2"}),
+    Puzzle(
+        2024,
+        10,
+        "day10",
+        "parse_problem",
+        {1: "Problem.get_total_num_paths", 2: "Problem.get_total_num_paths_2"},
+    ),
+    Puzzle(2024, 11, "day11", "parse_stones", {1: "part_1", 2: "part_2"}),
+    Puzzle(
+        2024, 12, "day12", "read_grid_dense", {1: "solve_part_1", 2: "solve_part_2"}
+    ),
+    Puzzle(2024, 13, "day13", "parse_problems", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 14, "day14", "parse_problem", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 15, "day15", "parse_problem", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 16, "day16", "read_grid", {1: "part_1", 2: "run_part_2"}),
+    Puzzle(2024, 17, "day17", "parse_problem", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 18, "day18", "parse_blocked", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 19, "day19", "parse_problem", {1: "part_1", 2: "part_2"}),
+    Puzzle(2024, 20, "day20", "read_grid", {1: "part1", 2: "part2"}),
+    Puzzle(2024, 22, "day22", "parse_numbers", {1: "part1", 2: "part2"}),
+    Puzzle(2024, 23, "day23", "read_graph_from_file", {1: "part1", 2: "part2"}),
+    Puzzle(2024, 24, "day24", "parse_nodes", {1: "part_1"}),
+    Puzzle(2024, 25, "d25", "parse_file", {1: "part1"}),
+]
+
+
+def get_puzzle(year: int, day: int) -> Puzzle:
+    for puzzle in PUZZLES:
+        if puzzle.year == year and puzzle.day == day:
+            return puzzle
+    raise KeyError(f"no solver registered for {year} day {day}")
+
+
+def list_puzzles(year: int | None = None) -> list[Puzzle]:
+    return [p for p in PUZZLES if year is None or p.year == year]
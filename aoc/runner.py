@@ -0,0 +1,203 @@
+"""
+Runs registered puzzles and measures them. Every part is parsed from scratch
+since some solvers mutate their problem in place.
+"""
+
+import resource
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import instrument
+from aoc.registry import Puzzle, get_puzzle
+
+# what a solver may fail with on a given input: a missing or malformed file,
+# an unsolvable or unimplemented part, a failed check or a missing optional
+# dependency. Anything else is a bug and is raised.
+PUZZLE_ERRORS = (
+    ArithmeticError,
+    AssertionError,
+    ImportError,
+    LookupError,
+    NotImplementedError,
+    OSError,
+    RecursionError,
+    ValueError,
+)
+
+
+@dataclass
+class RunResult:
+    year: int
+    day: int
+    part: int
+    answer: str | None
+    parse_seconds: float
+    solve_seconds: float
+    # peak resident set size of the running process in KiB
+    peak_rss_kib: int
+    error: str | None = None
+    # instrument.snapshot() of the part when instrumentation is enabled
+    stats: dict | None = None
+    # set when the part crashed in a pool worker rather than failing with
+    # one of the PUZZLE_ERRORS
+    traceback: str | None = None
+
+
+def peak_rss_kib() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports KiB, macos bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_part(
+    puzzle: Puzzle,
+    part: int,
+    fname: str | None = None,
+    params: dict[str, Any] | None = None,
+) -> RunResult:
+    """
+    params are passed to the part function as keyword arguments, for the
+    sizes and step counts a puzzle fixes outside its input. PUZZLE_ERRORS
+    from the solver become the result's error, anything else is raised, as
+    are bad registry entries.
+    """
+    if fname is None:
+        fname = puzzle.default_input
+    answer, error = None, None
+    parse_seconds = solve_seconds = 0.0
+    instrument.reset()
+    try:
+        module = puzzle.load()
+    except ImportError as e:
+        module, error = None, f"{type(e).__name__}: {e}"
+    if module is not None:
+        parse_fn = puzzle.get_parse(module)
+        part_fn = puzzle.get_part(module, part)
+        try:
+            t0 = time.perf_counter()
+            with instrument.phase("parse"):
+                problem = parse_fn(fname)
+            parse_seconds = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            with instrument.phase("solve"):
+                answer = str(part_fn(problem, **(params or {})))
+            solve_seconds = time.perf_counter() - t0
+        except PUZZLE_ERRORS as e:
+            error = f"{type(e).__name__}: {e}"
+    return RunResult(
+        year=puzzle.year,
+        day=puzzle.day,
+        part=part,
+        answer=answer,
+        parse_seconds=parse_seconds,
+        solve_seconds=solve_seconds,
+        peak_rss_kib=peak_rss_kib(),
+        error=error,
+        stats=instrument.snapshot() if instrument.ENABLED else None,
+    )
+
+
+def _crash_result(year: int, day: int, part: int, e: BaseException) -> RunResult:
+    return RunResult(
+        year=year,
+        day=day,
+        part=part,
+        answer=None,
+        parse_seconds=0.0,
+        solve_seconds=0.0,
+        peak_rss_kib=peak_rss_kib(),
+        error=f"{type(e).__name__}: {e}",
+        traceback="".join(traceback.format_exception(e)),
+    )
+
+
+def _run_part_by_key(
+    year: int, day: int, part: int, fname: str | None = None
+) -> RunResult:
+    """run_part in a pool worker, where a crash only fails its own part"""
+    try:
+        return run_part(get_puzzle(year, day), part, fname)
+    except Exception as e:
+        return _crash_result(year, day, part, e)
+
+
+def run_isolated(
+    keys: list[tuple[int, int, int]],
+    processes: int | None = None,
+    fname: str | None = None,
+) -> list[RunResult]:
+    """
+    (year, day, part) keys in a process pool. Each part gets a fresh process,
+    so peak RSS is its own and the two years' `utils` modules never meet. A
+    part that crashes, or whose worker dies, is returned as a failed result
+    with its traceback instead of stopping the others.
+    """
+    results = []
+    with ProcessPoolExecutor(processes, max_tasks_per_child=1) as pool:
+        futures = [pool.submit(_run_part_by_key, *key, fname) for key in keys]
+        for key, future in zip(keys, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(_crash_result(*key, e))
+    return results
+
+
+def run_all(
+    puzzles: list[Puzzle],
+    parts: list[int],
+    processes: int | None = None,
+) -> list[RunResult]:
+    """every registered part of the puzzles, see run_isolated"""
+    keys = [(p.year, p.day, part) for p in puzzles for part in parts if part in p.parts]
+    return run_isolated(keys, processes)
+
+
+def format_table(results: list[RunResult]) -> str:
+    header = f"{'puzzle':<10} {'part':>4} {'parse':>9} {'solve':>9} {'rss':>9}  answer"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        if r.error is None:
+            answer = r.answer
+        elif r.traceback is None:
+            answer = f"error: {r.error}"
+        else:
+            answer = f"crash: {r.error}"
+        lines.append(
+            f"{r.year} {r.day:>2}    {r.part:>4} "
+            f"{format_seconds(r.parse_seconds):>9} "
+            f"{format_seconds(r.solve_seconds):>9} "
+            f"{r.peak_rss_kib / 1024:>7.1f}MB  {answer}"
+        )
+    total = sum(r.parse_seconds + r.solve_seconds for r in results)
+    lines.append(f"total {format_seconds(total)}")
+    return "\n".join(lines)
+
+
+def stats_json(results: list[RunResult]) -> list[dict]:
+    return [
+        {"year": r.year, "day": r.day, "part": r.part, **r.stats}
+        for r in results
+        if r.stats is not None
+    ]
+
+
+def folded_stacks(results: list[RunResult]) -> str:
+    """every part's phases under a year/day/part root frame"""
+    lines = []
+    for r in results:
+        if r.stats is not None:
+            root = f"{r.year}/day{r.day:02}/part{r.part}"
+            lines += instrument.to_folded(r.stats, root)
+    return "\n".join(lines) + "\n"
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
@@ -0,0 +1,60 @@
+import pytest
+
+from aoc import PUZZLES, Puzzle, format_table, get_puzzle, run_isolated, run_part
+
+
+def test_get_puzzle():
+    assert get_puzzle(2024, 16).module == "day16"
+    with pytest.raises(KeyError):
+        get_puzzle(2024, 3)
+
+
+def test_registry_is_unique():
+    keys = [(p.year, p.day) for p in PUZZLES]
+    assert len(keys) == len(set(keys))
+
+
+def test_default_input():
+    puzzle = get_puzzle(2023, 17)
+    assert puzzle.default_input.endswith("y2023/data/d17.txt")
+
+
+def test_run_part(tmp_path):
+    fname = tmp_path / "input.txt"
+    fname.write_text("3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n")
+    result = run_part(get_puzzle(2024, 1), 1, str(fname))
+    assert result.error is None
+    assert result.answer == "11"
+    assert result.peak_rss_kib > 0
+    assert "11" in format_table([result])
+
+
+def test_run_part_error(tmp_path):
+    result = run_part(get_puzzle(2024, 1), 1, str(tmp_path / "missing.txt"))
+    assert result.answer is None
+    assert result.error.startswith("FileNotFoundError")
+
+
+def test_run_part_registry_error(tmp_path):
+    puzzle = Puzzle(2024, 1, "day1", "get_ids", {1: "missing"})
+    with pytest.raises(AttributeError):
+        run_part(puzzle, 1, str(tmp_path / "input.txt"))
+
+
+def test_run_isolated(tmp_path):
+    fname = tmp_path / "input.txt"
+    fname.write_text("3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n")
+    results = run_isolated([(2024, 1, 1), (2024, 1, 2)], 1, str(fname))
+    assert [r.answer for r in results] == ["11", "31"]
+
+
+def test_run_isolated_crash(tmp_path):
+    fname = tmp_path / "input.txt"
+    fname.write_text("3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n")
+    # an unregistered day raises KeyError in its worker
+    results = run_isolated([(2024, 3, 1), (2024, 1, 1)], 1, str(fname))
+    assert results[0].error.startswith("KeyError")
+    assert "get_puzzle" in results[0].traceback
+    assert "crash: KeyError" in format_table(results)
+    assert results[1].answer == "11"
+    assert results[1].traceback is None
@@ -0,0 +1,42 @@
+"""
+Compares the d17 crucible engines on the real input and on random digit
+grids.
+
+    python -m benchmarks.d17 --size 1000 --engines packed
+"""
+
+import argparse
+import random
+import time
+
+from grid import GridV2, read_grid_v2
+from y2023 import d17
+
+
+def random_heatmap(size: int, seed: int = 0) -> GridV2[int]:
+    rng = random.Random(seed)
+    return GridV2([[rng.randint(1, 9) for _ in range(size)] for _ in range(size)])
+
+
+def run(name: str, grid: GridV2[int], engines: list[str]) -> None:
+    for engine in engines:
+        for part, fn in [("1", d17.min_dist), ("2", d17.min_dist_v2)]:
+            t0 = time.perf_counter()
+            answer = fn(grid, engine=engine)
+            seconds = time.perf_counter() - t0
+            print(f"{name:<16} part {part} {engine:<7} {answer:>8} {seconds:8.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, nargs="*", default=[200, 1000])
+    parser.add_argument("--engines", nargs="*", default=["packed", "search"])
+    args = parser.parse_args()
+
+    run("d17.txt", read_grid_v2("y2023/data/d17.txt", int), args.engines)
+    for size in args.size:
+        run(f"random {size}x{size}", random_heatmap(size), args.engines)
+
+
+if __name__ == "__main__":
+    main()
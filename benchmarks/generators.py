@@ -0,0 +1,230 @@
+"""
+Synthetic puzzle inputs in the same text format as the real ones. Every
+generator takes a scale, the multiple of the real input size (cells for
+grids, items for lists), and a seeded random.Random so runs are repeatable.
+"""
+
+import itertools
+import math
+import random
+import string
+
+
+def _side(real_side: int, scale: float) -> int:
+    """odd side length of a square grid with scale times the cells"""
+    side = max(5, round(real_side * math.sqrt(scale)))
+    return side if side % 2 == 1 else side + 1
+
+
+def _carve_maze(side: int, rng: random.Random) -> list[list[str]]:
+    """perfect maze on the odd cells of a side x side grid of walls"""
+    cells = [["#"] * side for _ in range(side)]
+    start = (side - 2, 1)
+    cells[start[0]][start[1]] = "."
+    stack = [start]
+    while len(stack) > 0:
+        x, y = stack[-1]
+        steps = [
+            (dx, dy)
+            for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2)]
+            if 0 < x + dx < side - 1
+            and 0 < y + dy < side - 1
+            and cells[x + dx][y + dy] == "#"
+        ]
+        if len(steps) == 0:
+            stack.pop()
+            continue
+        dx, dy = rng.choice(steps)
+        cells[x + dx // 2][y + dy // 2] = "."
+        cells[x + dx][y + dy] = "."
+        stack.append((x + dx, y + dy))
+    return cells
+
+
+def _join_grid(cells: list[list[str]]) -> str:
+    return "\n".join("".join(row) for row in cells) + "\n"
+
+
+def reindeer_maze(scale: float, rng: random.Random, loop_rate: float = 0.1) -> str:
+    """day16, a maze with some walls knocked out so there are several paths"""
+    side = _side(141, scale)
+    cells = _carve_maze(side, rng)
+    for x in range(1, side - 1):
+        for y in range(1, side - 1):
+            if cells[x][y] == "#" and (x + y) % 2 == 1 and rng.random() < loop_rate:
+                cells[x][y] = "."
+    cells[side - 2][1] = "S"
+    cells[1][side - 2] = "E"
+    return _join_grid(cells)
+
+
+def racetrack(scale: float, rng: random.Random) -> str:
+    """day20, a perfect maze so there is exactly one path from S to E"""
+    side = _side(141, scale)
+    cells = _carve_maze(side, rng)
+    cells[side - 2][1] = "S"
+    cells[1][side - 2] = "E"
+    return _join_grid(cells)
+
+
+def falling_bytes(scale: float, rng: random.Random) -> str:
+    """day18, byte positions covering the same share of the grid as the real input"""
+    side = _side(71, scale)
+    n_bytes = round(3450 * scale)
+    cells = [(x, y) for x in range(side) for y in range(side)]
+    cells.remove((0, 0))
+    cells.remove((side - 1, side - 1))
+    return "".join(f"{x},{y}\n" for x, y in rng.sample(cells, min(n_bytes, len(cells))))
+
+
+def falling_bytes_params(scale: float) -> dict[int, dict]:
+    """
+    the grid size of falling_bytes and as many fallen bytes for part 1, the
+    solver would otherwise guess the size and always drop 1024
+    """
+    size = _side(71, scale)
+    return {1: {"size": size, "n_fallen": round(1024 * scale)}, 2: {"size": size}}
+
+
+def heatmap(scale: float, rng: random.Random) -> str:
+    """d17 (2023), heat loss digits"""
+    side = _side(141, scale)
+    return "".join(
+        "".join(rng.choice("123456789") for _ in range(side)) + "\n"
+        for _ in range(side)
+    )
+
+
+def disk_map(scale: float, rng: random.Random) -> str:
+    """day9, alternating file and free space lengths starting and ending on a file"""
+    length = round(19999 * scale) | 1
+    return (
+        "".join(
+            rng.choice("123456789") if i % 2 == 0 else rng.choice("0123456789")
+            for i in range(length)
+        )
+        + "\n"
+    )
+
+
+def stones(scale: float, rng: random.Random) -> str:
+    """day11"""
+    n_stones = max(1, round(8 * scale))
+    return " ".join(str(rng.randrange(10_000_000)) for _ in range(n_stones)) + "\n"
+
+
+def stones_params(scale: float) -> dict[int, dict]:
+    """
+    blinks scaled with the stones, the distinct values level off after a
+    few dozen blinks so more stones alone barely add work
+    """
+    return {1: {"blinks": round(25 * scale)}, 2: {"blinks": round(75 * scale)}}
+
+
+def garden_regions(scale: float, rng: random.Random, cells_per_region: int = 30) -> str:
+    """
+    day12, irregular regions grown from random seeds a random frontier cell
+    at a time, so they have holes, notches and many sides. Letters repeat
+    across the map like the real input.
+    """
+    side = _side(140, scale)
+    cells = [[""] * side for _ in range(side)]
+    frontier = []
+    for _ in range(max(1, side * side // cells_per_region)):
+        x, y = rng.randrange(side), rng.randrange(side)
+        if cells[x][y] == "":
+            cells[x][y] = rng.choice(string.ascii_uppercase)
+            frontier.append((x, y))
+    while len(frontier) > 0:
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        x, y = frontier.pop()
+        for nx, ny in [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]:
+            if 0 <= nx < side and 0 <= ny < side and cells[nx][ny] == "":
+                cells[nx][ny] = cells[x][y]
+                frontier.append((nx, ny))
+    return _join_grid(cells)
+
+
+def _wire_names(rng: random.Random, n: int) -> list[str]:
+    # 3 characters like the real netlists, never starting with x, y or z
+    first = string.ascii_lowercase[:23] + string.digits
+    rest = string.ascii_lowercase + string.digits
+    names = ["".join(p) for p in itertools.product(first, rest, rest)]
+    return rng.sample(names, n)
+
+
+def adder_netlist(scale: float, rng: random.Random, n_bits: int = 45) -> str:
+    """
+    day24, round(scale) ripple carry adders chained so each adds y to the
+    previous sum, about 222 gates per stage like the real input. The last
+    stage drives the z wires.
+    """
+    n_stages = max(1, round(scale))
+    names = iter(_wire_names(rng, n_stages * 5 * n_bits))
+    lines = [f"x{i:02}: {rng.randint(0, 1)}" for i in range(n_bits)]
+    lines += [f"y{i:02}: {rng.randint(0, 1)}" for i in range(n_bits)]
+    lines.append("")
+
+    gates = []
+    xs = [f"x{i:02}" for i in range(n_bits)]
+    ys = [f"y{i:02}" for i in range(n_bits)]
+    for stage in range(n_stages):
+        is_last = stage == n_stages - 1
+        outs = [f"z{i:02}" if is_last else next(names) for i in range(n_bits)]
+        carry = None
+        for i in range(n_bits):
+            half_sum, half_carry = next(names), next(names)
+            gates.append(f"{xs[i]} XOR {ys[i]} -> {half_sum}")
+            gates.append(f"{xs[i]} AND {ys[i]} -> {half_carry}")
+            if carry is None:
+                gates[-2] = f"{xs[i]} XOR {ys[i]} -> {outs[i]}"
+                carry = half_carry
+                continue
+            gates.append(f"{half_sum} XOR {carry} -> {outs[i]}")
+            carry_through, next_carry = next(names), next(names)
+            if is_last and i == n_bits - 1:
+                next_carry = f"z{n_bits:02}"
+            gates.append(f"{half_sum} AND {carry} -> {carry_through}")
+            gates.append(f"{half_carry} OR {carry_through} -> {next_carry}")
+            carry = next_carry
+        xs = outs
+    rng.shuffle(gates)
+    return "\n".join(lines + gates) + "\n"
+
+
+def brick_stack(scale: float, rng: random.Random) -> str:
+    """d22 (2023), bricks over a footprint that grows with the brick count"""
+    n_bricks = round(1258 * scale)
+    side = max(3, round(10 * math.sqrt(scale)))
+    occupied = set()
+    lines = []
+    while len(lines) < n_bricks:
+        start = [rng.randrange(side), rng.randrange(side), rng.randint(1, 350)]
+        end = list(start)
+        axis = rng.randrange(3)
+        end[axis] += rng.randint(0, 3)
+        if axis < 2:
+            end[axis] = min(end[axis], side - 1)
+        cubes = set(
+            itertools.product(
+                *[range(lo, hi + 1) for lo, hi in zip(start, end)],
+            )
+        )
+        # bricks in the real input never overlap
+        if len(cubes & occupied) > 0:
+            continue
+        occupied |= cubes
+        lines.append("{},{},{}~{},{},{}".format(*start, *end))
+    return "\n".join(lines) + "\n"
+
+
+def hailstones(scale: float, rng: random.Random) -> str:
+    """d24 (2023), positions around the part 1 test area"""
+    n_stones = round(300 * scale)
+    lines = []
+    for _ in range(n_stones):
+        p = [rng.randint(100_000_000_000_000, 500_000_000_000_000) for _ in range(3)]
+        v = [rng.choice([-1, 1]) * rng.randint(1, 500) for _ in range(3)]
+        lines.append(f"{p[0]}, {p[1]}, {p[2]} @ {v[0]}, {v[1]}, {v[2]}")
+    return "\n".join(lines) + "\n"
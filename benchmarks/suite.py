@@ -0,0 +1,244 @@
+"""
+Runs solvers on synthetic inputs at growing sizes and appends wall time and
+peak memory per size to a JSON history, so a regression or a solver that
+scales worse than expected shows up as numbers next to the previous run.
+
+    python -m benchmarks.suite --cases day9 d22 --scales 1 10 100
+    python -m benchmarks.suite --timeout 30 --no-record
+
+Each case runs at its own scales unless --scales is given. Each measurement
+runs in its own process, parts that take longer than --timeout are killed
+and recorded as timeouts, which have no times and are never compared.
+"""
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import tempfile
+from dataclasses import asdict, dataclass
+from queue import Empty
+from typing import Callable
+
+from aoc import get_puzzle, run_part
+from aoc.runner import format_seconds
+from benchmarks import generators
+
+HISTORY_FILE = os.path.join(os.path.dirname(__file__), "history.json")
+DEFAULT_SCALES = (1, 10, 100)
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    year: int
+    day: int
+    generate: Callable[[float, random.Random], str]
+    # keyword arguments per part for the puzzle sizes that are not in the
+    # input, scaled along with it
+    params: Callable[[float], dict[int, dict]] | None = None
+    # solvers that grow much faster than their input stop at a lower scale
+    scales: tuple[float, ...] = DEFAULT_SCALES
+
+    def part_params(self, scale: float, part: int) -> dict | None:
+        if self.params is None:
+            return None
+        return self.params(scale).get(part)
+
+
+CASES = [
+    Case("day9", 2024, 9, generators.disk_map),
+    Case("day11", 2024, 11, generators.stones, generators.stones_params),
+    Case("day12", 2024, 12, generators.garden_regions),
+    Case("day16", 2024, 16, generators.reindeer_maze),
+    Case("day18", 2024, 18, generators.falling_bytes, generators.falling_bytes_params),
+    Case("day20", 2024, 20, generators.racetrack),
+    # part 1 evaluates shared subexpressions again, so it is exponential
+    # in the number of chained adders
+    Case("day24", 2024, 24, generators.adder_netlist, scales=(1, 2, 3)),
+    Case("d17", 2023, 17, generators.heatmap),
+    # part 2 is quadratic in the bricks, 1x takes about 16s
+    Case("d22", 2023, 22, generators.brick_stack, scales=(0.1, 0.3, 1)),
+    Case("d24", 2023, 24, generators.hailstones),
+]
+
+
+@dataclass
+class Measurement:
+    case: str
+    scale: float
+    part: int
+    input_bytes: int
+    # "ok", "error" or "timeout"
+    status: str
+    parse_seconds: float | None = None
+    solve_seconds: float | None = None
+    peak_rss_kib: int | None = None
+    answer: str | None = None
+    error: str | None = None
+    params: dict | None = None
+
+
+def _run_in_child(
+    year: int, day: int, part: int, fname: str, params: dict | None, queue
+) -> None:
+    queue.put(asdict(run_part(get_puzzle(year, day), part, fname, params)))
+
+
+def measure(case: Case, scale: float, part: int, fname: str, timeout: float):
+    params = case.part_params(scale, part)
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(
+        target=_run_in_child, args=(case.year, case.day, part, fname, params, queue)
+    )
+    process.start()
+    process.join(timeout)
+    measurement = Measurement(
+        case.name, scale, part, os.path.getsize(fname), "ok", params=params
+    )
+    if process.is_alive():
+        process.kill()
+        process.join()
+        measurement.status = "timeout"
+        measurement.error = f"killed after {timeout:g}s, not a result"
+        return measurement
+
+    try:
+        result = queue.get(timeout=1)
+    except Empty:
+        measurement.status = "error"
+        measurement.error = f"exit code {process.exitcode}"
+        return measurement
+    measurement.parse_seconds = result["parse_seconds"]
+    measurement.solve_seconds = result["solve_seconds"]
+    measurement.peak_rss_kib = result["peak_rss_kib"]
+    measurement.answer = result["answer"]
+    if result["error"] is not None:
+        measurement.status = "error"
+        measurement.error = result["error"]
+    return measurement
+
+
+def run_suite(
+    cases: list[Case],
+    scales: list[float] | None,
+    timeout: float,
+    seed: int = 0,
+) -> list[Measurement]:
+    """every case at scales, or at its own scales when scales is None"""
+    measurements = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for case in cases:
+            parts = sorted(get_puzzle(case.year, case.day).parts)
+            for scale in case.scales if scales is None else scales:
+                fname = os.path.join(tmp_dir, f"{case.name}_{scale}.txt")
+                with open(fname, "w") as f:
+                    f.write(case.generate(scale, random.Random(seed)))
+                for part in parts:
+                    measurement = measure(case, scale, part, fname, timeout)
+                    print(format_measurement(measurement), flush=True)
+                    measurements.append(measurement)
+    return measurements
+
+
+def format_measurement(m: Measurement, previous: dict | None = None) -> str:
+    line = f"{m.case:<6} {m.scale:>6g}x part {m.part} {m.input_bytes:>10}B "
+    if m.status != "ok":
+        return line + (m.status if m.error is None else f"{m.status}: {m.error}")
+    seconds = m.parse_seconds + m.solve_seconds
+    line += f"{format_seconds(seconds):>9} {m.peak_rss_kib / 1024:>7.1f}MB"
+    if previous is None:
+        return line
+    if previous["status"] == "ok":
+        before = previous["parse_seconds"] + previous["solve_seconds"]
+        line += f"  {seconds / max(before, 1e-9):.2f}x previous"
+    else:
+        line += f"  previous {previous['status']}"
+    return line
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(fname: str = HISTORY_FILE) -> list[dict]:
+    if not os.path.exists(fname):
+        return []
+    with open(fname) as f:
+        return json.load(f)
+
+
+def previous_measurement(history: list[dict], m: Measurement) -> dict | None:
+    for run in reversed(history):
+        for previous in run["measurements"]:
+            if (previous["case"], previous["scale"], previous["part"]) == (
+                m.case,
+                m.scale,
+                m.part,
+            ):
+                return previous
+    return None
+
+
+def record(measurements: list[Measurement], seed: int, fname: str = HISTORY_FILE):
+    history = load_history(fname)
+    history.append(
+        {
+            "time": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "seed": seed,
+            "measurements": [asdict(m) for m in measurements],
+        }
+    )
+    with open(fname, "w") as f:
+        json.dump(history, f, indent=1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--cases", nargs="*", default=[c.name for c in CASES], help="case names"
+    )
+    parser.add_argument(
+        "--scales", type=float, nargs="*", help="defaults to each case's scales"
+    )
+    parser.add_argument("--timeout", type=float, default=60, help="seconds per part")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--history", default=HISTORY_FILE)
+    parser.add_argument("--no-record", action="store_true")
+    args = parser.parse_args()
+
+    unknown = set(args.cases) - {c.name for c in CASES}
+    if len(unknown) > 0:
+        raise SystemExit(f"unknown cases: {', '.join(sorted(unknown))}")
+    cases = [c for c in CASES if c.name in args.cases]
+    history = load_history(args.history)
+    measurements = run_suite(cases, args.scales, args.timeout, args.seed)
+
+    print()
+    for m in measurements:
+        print(format_measurement(m, previous_measurement(history, m)))
+    failed = [m for m in measurements if m.status != "ok"]
+    if len(failed) > 0:
+        print(f"{len(failed)} of {len(measurements)} measurements have no result")
+    if not args.no_record:
+        record(measurements, args.seed, args.history)
+
+
+if __name__ == "__main__":
+    main()
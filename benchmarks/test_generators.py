@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+
+from benchmarks import generators
+from geometry import build_adjacency, read_grid
+from os_utils import parse_ints, read_ints
+
+
+def test_mazes_connect_start_and_end(tmp_path):
+    for generate in [generators.reindeer_maze, generators.racetrack]:
+        fname = tmp_path / "maze.txt"
+        fname.write_text(generate(0.1, random.Random(0)))
+        grid = read_grid(fname)
+        adjacency = build_adjacency(grid, lambda c: c != "#")
+        dists = adjacency.bfs(adjacency.node(grid.find("S")[0]))
+        assert dists[adjacency.node(grid.find("E")[0])] > 0
+
+
+def test_falling_bytes_stay_off_the_corners(tmp_path):
+    fname = tmp_path / "bytes.txt"
+    fname.write_text(generators.falling_bytes(1, random.Random(0)))
+    ps = read_ints(fname, n_cols=2)
+    assert len(ps) == 3450
+    assert len({tuple(p) for p in ps.tolist()}) == len(ps)
+    assert not np.any(np.all(ps == 0, axis=1))
+
+
+def test_falling_bytes_params_fit_the_grid():
+    for scale in [0.5, 4]:
+        ps = parse_ints(generators.falling_bytes(scale, random.Random(0)), n_cols=2)
+        params = generators.falling_bytes_params(scale)
+        assert ps.max() < params[1]["size"] == params[2]["size"]
+        assert params[1]["n_fallen"] < len(ps)
+
+
+def test_garden_regions_fill_the_map():
+    rows = generators.garden_regions(0.1, random.Random(0)).split()
+    assert len(rows) == len(rows[0])
+    assert all(len(row) == len(rows) and row.isupper() for row in rows)
+    assert len(set("".join(rows))) > 10
+
+
+def test_brick_stack_has_no_overlaps(tmp_path):
+    fname = tmp_path / "bricks.txt"
+    fname.write_text(generators.brick_stack(0.1, random.Random(0)))
+    bricks = read_ints(fname, n_cols=6)
+    assert len(bricks) == round(1258 * 0.1)
+    assert np.all(bricks[:, :3] <= bricks[:, 3:])
+
+
+def test_adder_netlist_size():
+    text = generators.adder_netlist(2, random.Random(0))
+    gates = [line for line in text.splitlines() if "->" in line]
+    assert len(gates) == 2 * (5 * 45 - 3)
+    outputs = [line.split(" -> ")[1] for line in gates]
+    assert len(set(outputs)) == len(outputs)
+    assert "z45" in outputs
+
+
+def test_disk_map_is_odd_length():
+    disk_map = generators.disk_map(0.01, random.Random(0)).strip()
+    assert len(disk_map) % 2 == 1
+    assert all(disk_map[i] != "0" for i in range(0, len(disk_map), 2))
@@ -0,0 +1,92 @@
+"""
+Microbenchmark of V2 set inserts and neighbor iteration against the previous
+frozen dataclass V2 with the f-string hash, plus the packed-int mode.
+
+    python -m benchmarks.v2
+"""
+
+import timeit
+from dataclasses import dataclass
+
+from grid import V2, Direction
+
+SIZE = 300
+REPEATS = 5
+
+
+@dataclass(frozen=True)
+class LegacyV2:
+    x: int
+    y: int
+
+    def __add__(self, that: "LegacyV2") -> "LegacyV2":
+        return LegacyV2(self.x + that.x, self.y + that.y)
+
+    def __hash__(self) -> int:
+        return hash(f"V2({self.x}, {self.y})")
+
+
+LEGACY_DIRECTIONS = [LegacyV2(d.x, d.y) for d in Direction.ALL]
+
+
+def set_insert(ps: list) -> None:
+    visited = set()
+    for p in ps:
+        visited.add(p)
+
+
+def neighbor_iteration(ps: list, directions: list) -> None:
+    visited = set(ps)
+    for p in ps:
+        for d in directions:
+            _ = (p + d) in visited
+
+
+def packed_neighbor_iteration(ps: list[int], offsets: list[int]) -> None:
+    visited = bytearray(SIZE * SIZE)
+    for p in ps:
+        visited[p] = 1
+    for p in ps:
+        for d in offsets:
+            _ = visited[(p + d) % len(visited)]
+
+
+def timed(fn) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=REPEATS))
+
+
+def main():
+    legacy_ps = [LegacyV2(i, j) for i in range(SIZE) for j in range(SIZE)]
+    ps = [V2(i, j) for i in range(SIZE) for j in range(SIZE)]
+    packed_ps = [p.pack(SIZE) for p in ps]
+    n = len(ps)
+
+    rows = [
+        ("set insert", "legacy", timed(lambda: set_insert(legacy_ps)), n),
+        ("set insert", "slots", timed(lambda: set_insert(ps)), n),
+        ("set insert", "packed", timed(lambda: set_insert(packed_ps)), n),
+        (
+            "neighbors",
+            "legacy",
+            timed(lambda: neighbor_iteration(legacy_ps, LEGACY_DIRECTIONS)),
+            4 * n,
+        ),
+        (
+            "neighbors",
+            "slots",
+            timed(lambda: neighbor_iteration(ps, Direction.ALL)),
+            4 * n,
+        ),
+        (
+            "neighbors",
+            "packed",
+            timed(lambda: packed_neighbor_iteration(packed_ps, Direction.packed(SIZE))),
+            4 * n,
+        ),
+    ]
+    for name, mode, seconds, ops in rows:
+        print(f"{name:<12} {mode:<8} {ops / seconds / 1e6:8.2f} Mops/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Shared 2d grid geometry used by every year's solvers. `grid` (2023) and
+`y2024/utils` re-export from here.
+"""
+
+from geometry.adjacency import Adjacency, build_adjacency, passable_mask
+from geometry.direction import (
+    DIRECTION_OFFSETS,
+    Direction,
+    DirectionEnum,
+    neighbor_offsets,
+)
+from geometry.grid import (
+    DenseGrid,
+    Grid,
+    GridV2,
+    is_inbounds,
+    read_grid,
+    read_grid_dense,
+    read_grid_v2,
+)
+from geometry.search import SearchResult, adjacency_neighbors, search
+from geometry.vector import V2
+
+__all__ = [
+    "DIRECTION_OFFSETS",
+    "V2",
+    "Adjacency",
+    "DenseGrid",
+    "Direction",
+    "DirectionEnum",
+    "Grid",
+    "GridV2",
+    "SearchResult",
+    "adjacency_neighbors",
+    "build_adjacency",
+    "is_inbounds",
+    "neighbor_offsets",
+    "passable_mask",
+    "read_grid",
+    "read_grid_dense",
+    "read_grid_v2",
+    "search",
+]
@@ -0,0 +1,125 @@
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from geometry.direction import DIRECTION_OFFSETS
+from geometry.grid import DenseGrid, Grid, GridV2
+from geometry.vector import V2
+
+
+def is_open(c) -> bool:
+    return c != "#"
+
+
+@dataclass(frozen=True)
+class Adjacency:
+    """
+    CSR index of the passable cells of a static grid. Cells are numbered
+    0..n_nodes-1 in row major order, and the neighbors of node i are
+    indices[indptr[i] : indptr[i + 1]].
+    """
+
+    height: int
+    width: int
+    # packed coordinate (x * width + y) of each node
+    cell_ids: np.ndarray
+    # node of each packed coordinate, -1 for impassable cells
+    node_ids: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.cell_ids)
+
+    def node(self, p: V2) -> int:
+        return int(self.node_ids[p.pack(self.width)])
+
+    def position(self, node: int) -> V2:
+        return V2.unpack(int(self.cell_ids[node]), self.width)
+
+    def neighbors(self, node: int) -> np.ndarray:
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def bfs(self, start: int) -> np.ndarray:
+        """unweighted distance from start to every node, -1 if unreachable"""
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        dists = [-1] * self.n_nodes
+        dists[start] = 0
+        queue = deque([start])
+        while len(queue) > 0:
+            node = queue.popleft()
+            next_dist = dists[node] + 1
+            for next_node in indices[indptr[node] : indptr[node + 1]]:
+                if dists[next_node] == -1:
+                    dists[next_node] = next_dist
+                    queue.append(next_node)
+        return np.array(dists, dtype=np.int32)
+
+    def to_dict(self, values: np.ndarray, missing: int = -1) -> dict[V2, int]:
+        """per node values keyed by position, dropping `missing` entries"""
+        return {
+            self.position(node): int(value)
+            for node, value in enumerate(values.tolist())
+            if value != missing
+        }
+
+    def to_array(self, values: np.ndarray, missing: int = -1) -> np.ndarray:
+        """per node values as a (height, width) array, `missing` off the nodes"""
+        array = np.full(self.height * self.width, missing, dtype=values.dtype)
+        array[self.cell_ids] = values
+        return array.reshape(self.height, self.width)
+
+
+def passable_mask(
+    grid: Grid | DenseGrid | GridV2,
+    is_passable: Callable[[str], bool] = is_open,
+) -> np.ndarray:
+    if isinstance(grid, DenseGrid):
+        cells = grid.cells
+    elif isinstance(grid, GridV2):
+        return np.array([[is_passable(c) for c in row] for row in grid], dtype=bool)
+    else:
+        cells = DenseGrid.from_grid(grid).cells
+    # evaluate the predicate once per byte value rather than once per cell
+    lookup = np.array([is_passable(chr(b)) for b in range(256)], dtype=bool)
+    return lookup[cells]
+
+
+def build_adjacency(
+    grid: Grid | DenseGrid | GridV2,
+    is_passable: Callable[[str], bool] = is_open,
+) -> Adjacency:
+    mask = passable_mask(grid, is_passable)
+    height, width = mask.shape
+    flat_mask = mask.ravel()
+    cell_ids = np.flatnonzero(flat_mask).astype(np.int32)
+    node_ids = np.full(height * width, -1, dtype=np.int32)
+    node_ids[cell_ids] = np.arange(len(cell_ids), dtype=np.int32)
+
+    xs, ys = np.divmod(cell_ids, width)
+    srcs, dsts = [], []
+    for dx, dy in DIRECTION_OFFSETS:
+        nxs, nys = xs + dx, ys + dy
+        inbounds = (0 <= nxs) & (nxs < height) & (0 <= nys) & (nys < width)
+        neighbor_cells = nxs[inbounds] * width + nys[inbounds]
+        is_edge = flat_mask[neighbor_cells]
+        srcs.append(node_ids[cell_ids[inbounds][is_edge]])
+        dsts.append(node_ids[neighbor_cells[is_edge]])
+    src = np.concatenate(srcs)
+    dst = np.concatenate(dsts)
+    # stable so each node's neighbors keep DirectionEnum order
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(len(cell_ids) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=len(cell_ids)), out=indptr[1:])
+    return Adjacency(
+        height=height,
+        width=width,
+        cell_ids=cell_ids,
+        node_ids=node_ids,
+        indptr=indptr,
+        indices=dst[order].astype(np.int32),
+    )
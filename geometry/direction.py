@@ -0,0 +1,80 @@
+from enum import Enum, auto
+
+import numpy as np
+
+from geometry.vector import V2
+
+
+class Direction:
+    DOWN = V2(1, 0)
+    UP = V2(-1, 0)
+    LEFT = V2(0, -1)
+    RIGHT = V2(0, 1)
+
+    ALL = (DOWN, UP, LEFT, RIGHT)
+
+    @staticmethod
+    def packed(width: int) -> list[int]:
+        """offsets of ALL in packed coordinates for a grid of the given width"""
+        return [d.pack(width) for d in Direction.ALL]
+
+
+class DirectionEnum(Enum):
+    """
+    Compass directions in (row, column) coordinates, ie NORTH is up a row.
+    Members are numbered 0..3 by `index` in definition order, which is also
+    the row order of DIRECTION_OFFSETS.
+    """
+
+    NORTH = auto()
+    WEST = auto()
+    EAST = auto()
+    SOUTH = auto()
+
+    @property
+    def index(self) -> int:
+        return self.value - 1
+
+    def to_v2(self) -> V2:
+        return _DIRECTION_V2S[self.index]
+
+    def clockwise(self) -> "DirectionEnum":
+        return _CLOCKWISE[self.index]
+
+    def counter_clockwise(self) -> "DirectionEnum":
+        return _COUNTER_CLOCKWISE[self.index]
+
+    def opposite(self) -> "DirectionEnum":
+        return _CLOCKWISE[_CLOCKWISE[self.index].index]
+
+
+# (dx, dy) of each DirectionEnum member, indexed by DirectionEnum.index
+DIRECTION_OFFSETS = np.array(
+    [
+        [-1, 0],
+        [0, -1],
+        [0, 1],
+        [1, 0],
+    ],
+    dtype=np.int64,
+)
+DIRECTION_OFFSETS.flags.writeable = False
+
+_DIRECTION_V2S = [V2(int(dx), int(dy)) for dx, dy in DIRECTION_OFFSETS]
+_CLOCKWISE = [
+    DirectionEnum.EAST,  # NORTH
+    DirectionEnum.NORTH,  # WEST
+    DirectionEnum.SOUTH,  # EAST
+    DirectionEnum.WEST,  # SOUTH
+]
+_COUNTER_CLOCKWISE = [
+    DirectionEnum.WEST,  # NORTH
+    DirectionEnum.SOUTH,  # WEST
+    DirectionEnum.NORTH,  # EAST
+    DirectionEnum.EAST,  # SOUTH
+]
+
+
+def neighbor_offsets(width: int) -> np.ndarray:
+    """packed coordinate offsets of each DirectionEnum member for a grid of the given width"""
+    return DIRECTION_OFFSETS[:, 0] * width + DIRECTION_OFFSETS[:, 1]
@@ -0,0 +1,156 @@
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+import numpy as np
+
+from geometry.vector import V2
+
+
+class Grid(list[str]):
+    def pprint(self):
+        print("\n".join(self))
+
+    def __post_init__(self) -> None:
+        assert len(self) > 0
+        # TODO assert all the  str length are the same
+
+    @property
+    def height(self) -> int:
+        return len(self)
+
+    @property
+    def width(self) -> int:
+        return len(self[0])
+
+    def is_inbounds(self, position: V2) -> bool:
+        return 0 <= position.x < self.height and 0 <= position.y < self.width
+
+    def at(self, position: V2) -> str:
+        return self[position.x][position.y]
+
+    def update(self, position: V2, s: str) -> None:
+        assert len(s) == 1
+        row = self[position.x]
+        self[position.x] = row[: position.y] + s + row[position.y + 1 :]
+
+    def find(self, target: str) -> list[V2]:
+        ps = []
+        for i in range(self.height):
+            for j in range(self.width):
+                p = V2(i, j)
+                if self.at(p) == target:
+                    ps.append(p)
+        return ps
+
+
+class DenseGrid:
+    """
+    Grid of single byte cells backed by a contiguous uint8 array.
+    Updates are in place instead of rebuilding the row string.
+    """
+
+    def __init__(self, cells: np.ndarray) -> None:
+        assert cells.ndim == 2 and cells.dtype == np.uint8
+        self.cells = np.ascontiguousarray(cells)
+
+    def pprint(self):
+        print("\n".join(self.to_grid()))
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def is_inbounds(self, position: V2) -> bool:
+        return 0 <= position.x < self.height and 0 <= position.y < self.width
+
+    def at(self, position: V2) -> str:
+        return chr(self.cells[position.x, position.y])
+
+    def update(self, position: V2, s: str) -> None:
+        assert len(s) == 1
+        self.cells[position.x, position.y] = ord(s)
+
+    def find(self, target: str) -> list[V2]:
+        return [V2(int(i), int(j)) for i, j in np.argwhere(self.cells == ord(target))]
+
+    @classmethod
+    def from_grid(cls, grid: list[str]) -> "DenseGrid":
+        assert len(grid) > 0
+        buffer = "".join(grid).encode("ascii")
+        cells = np.frombuffer(buffer, dtype=np.uint8).reshape(len(grid), -1)
+        return cls(cells.copy())
+
+    def to_grid(self) -> Grid:
+        return Grid(row.tobytes().decode("ascii") for row in self.cells)
+
+
+ElmT = TypeVar("ElmT")
+
+
+class GridV2(list[list[ElmT]], Generic[ElmT]):
+    def __post_init__(self) -> None:
+        assert len(self) > 0
+        # TODO assert all the  str length are the same
+
+    @property
+    def height(self) -> int:
+        return len(self)
+
+    @property
+    def width(self) -> int:
+        return len(self[0])
+
+    def is_inbounds(self, position: V2) -> bool:
+        return 0 <= position.x < self.height and 0 <= position.y < self.width
+
+    def update(self, p: V2, s: ElmT) -> None:
+        assert self.is_inbounds(p)
+        self[p.x][p.y] = s
+
+    def at(self, position: V2) -> ElmT:
+        return self[position.x][position.y]
+
+    def find(self, target: str) -> list[V2]:
+        ps = []
+        for i in range(self.height):
+            for j in range(self.width):
+                p = V2(i, j)
+                if self.at(p) == target:
+                    ps.append(p)
+        return ps
+
+    @classmethod
+    def fill(
+        cls,
+        e: ElmT,
+        height: int,
+        width: int,
+    ) -> "GridV2[ElmT]":
+        return GridV2([[e for _ in range(width)] for _ in range(height)])
+
+
+def is_inbounds(position: V2, grid: Grid) -> bool:
+    return 0 <= position.x < len(grid) and 0 <= position.y < len(grid[0])
+
+
+def read_grid(fname) -> Grid:
+    with open(fname) as f:
+        return Grid([x.strip() for x in f])
+
+
+def read_grid_v2(fname, map_fn: Callable[[str], ElmT] = lambda c: c) -> GridV2[ElmT]:
+    with open(fname) as f:
+        return GridV2([[map_fn(c) for c in x.strip()] for x in f])
+
+
+def read_grid_dense(fname) -> DenseGrid:
+    with open(fname, "rb") as f:
+        data = f.read().rstrip() + b"\n"
+    width = data.index(b"\n")
+    cells = np.frombuffer(data, dtype=np.uint8).reshape(-1, width + 1)
+    # drop the newline column
+    return DenseGrid(cells[:, :width].copy())
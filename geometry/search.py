@@ -0,0 +1,229 @@
+"""
+Shortest path search over an implicit state space given by a
+`neighbors(state) -> [(next_state, cost), ...]` callback.
+
+The queue is picked from the edge weights: a deque for 0-1 BFS when costs
+are 0 or 1, a circular bucket queue (Dial's algorithm) when they are small
+integers and a binary heap otherwise or when a heuristic is given (A*).
+"""
+
+import heapq
+import itertools
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Generic, Literal, TypeVar
+
+import numpy as np
+
+import instrument
+from geometry.adjacency import Adjacency
+
+StateT = TypeVar("StateT", bound=Hashable)
+Neighbors = Callable[[StateT], Iterable[tuple[StateT, int]]]
+Engine = Literal["auto", "bfs01", "bucket", "heap"]
+
+# largest edge weight that still gets a bucket queue from engine="auto"
+BUCKET_QUEUE_MAX_WEIGHT = 1024
+
+
+@dataclass
+class SearchResult(Generic[StateT]):
+    dists: dict[StateT, int]
+    # all predecessors on a shortest path, only filled with track_preds=True
+    preds: dict[StateT, list[StateT]] = field(default_factory=dict)
+    # reached targets at the minimum distance
+    targets: list[StateT] = field(default_factory=list)
+
+    @property
+    def best(self) -> int:
+        if len(self.targets) == 0:
+            return -1
+        return self.dists[self.targets[0]]
+
+    def path_states(self, ends: Iterable[StateT] | None = None) -> set[StateT]:
+        """states on any shortest path to `ends`, the best targets by default"""
+        if ends is None:
+            ends = self.targets
+        states = set(ends)
+        queue = list(states)
+        while len(queue) > 0:
+            state = queue.pop()
+            for pred in self.preds.get(state, []):
+                if pred not in states:
+                    states.add(pred)
+                    queue.append(pred)
+        return states
+
+
+def pick_engine(max_weight: int | None, heuristic) -> Engine:
+    if heuristic is not None or max_weight is None:
+        return "heap"
+    elif max_weight <= 1:
+        return "bfs01"
+    elif max_weight <= BUCKET_QUEUE_MAX_WEIGHT:
+        return "bucket"
+    return "heap"
+
+
+def search(
+    starts: Iterable[StateT],
+    neighbors: Neighbors,
+    is_target: Callable[[StateT], bool] | None = None,
+    max_weight: int | None = None,
+    heuristic: Callable[[StateT], int] | None = None,
+    track_preds: bool = False,
+    engine: Engine = "auto",
+) -> SearchResult[StateT]:
+    """
+    Shortest distances from `starts`. Costs must be non-negative integers no
+    larger than `max_weight` when it is given. With `is_target` the search
+    stops once every state at the best target distance has been expanded,
+    otherwise the full distance map is built.
+    """
+    if engine == "auto":
+        engine = pick_engine(max_weight, heuristic)
+    if heuristic is not None and engine != "heap":
+        raise ValueError("A* needs the heap engine")
+    if engine == "bucket" and max_weight is None:
+        raise ValueError("the bucket queue needs max_weight")
+
+    result = SearchResult(dists={s: 0 for s in starts})
+    run = {
+        "bfs01": _search_bfs01,
+        "bucket": _search_bucket,
+        "heap": _search_heap,
+    }[engine]
+    relax = _relax
+    if instrument.ENABLED:
+        # counting wrappers are only swapped in when enabled
+        neighbors = instrument.counted("search.expansions")(neighbors)
+        relax = _counting_relax
+        instrument.count(f"search.{engine}")
+    with instrument.phase("search"):
+        run(result, neighbors, is_target, max_weight, heuristic, track_preds, relax)
+    return result
+
+
+def _relax(result, state, next_state, next_dist, track_preds) -> bool:
+    """returns true if next_state got a strictly shorter distance"""
+    dists = result.dists
+    old_dist = dists.get(next_state)
+    if old_dist is None or next_dist < old_dist:
+        dists[next_state] = next_dist
+        if track_preds:
+            result.preds[next_state] = [state]
+        return True
+    if track_preds and next_dist == old_dist:
+        result.preds[next_state].append(state)
+    return False
+
+
+def _counting_relax(result, state, next_state, next_dist, track_preds) -> bool:
+    pushed = _relax(result, state, next_state, next_dist, track_preds)
+    instrument.count("search.pushes", pushed)
+    return pushed
+
+
+def _search_heap(
+    result, neighbors, is_target, max_weight, heuristic, track_preds, relax
+):
+    dists = result.dists
+    counter = itertools.count()
+    h = heuristic if heuristic is not None else (lambda _: 0)
+    heap = [(h(s), next(counter), s) for s in dists]
+    heapq.heapify(heap)
+    best = None
+    while len(heap) > 0:
+        priority, _, state = heapq.heappop(heap)
+        dist = dists[state]
+        if priority > dist + h(state):
+            continue  # stale entry
+        if best is not None and priority > best:
+            break
+        if is_target is not None and is_target(state):
+            if best is None:
+                best = dist
+            if dist == best:
+                result.targets.append(state)
+        for next_state, cost in neighbors(state):
+            next_dist = dist + cost
+            if relax(result, state, next_state, next_dist, track_preds):
+                heapq.heappush(
+                    heap, (next_dist + h(next_state), next(counter), next_state)
+                )
+
+
+def _search_bucket(
+    result, neighbors, is_target, max_weight, heuristic, track_preds, relax
+):
+    dists = result.dists
+    n_buckets = max_weight + 1
+    buckets: list[list] = [[] for _ in range(n_buckets)]
+    buckets[0].extend(dists)
+    pending = len(dists)
+    best = None
+    dist = 0
+    while pending > 0:
+        if best is not None and dist > best:
+            break
+        bucket = buckets[dist % n_buckets]
+        # zero weight edges append to the bucket being drained
+        while len(bucket) > 0:
+            state = bucket.pop()
+            pending -= 1
+            if dists[state] != dist:
+                continue  # stale entry
+            if is_target is not None and is_target(state):
+                if best is None:
+                    best = dist
+                result.targets.append(state)
+            for next_state, cost in neighbors(state):
+                next_dist = dist + cost
+                if relax(result, state, next_state, next_dist, track_preds):
+                    buckets[next_dist % n_buckets].append(next_state)
+                    pending += 1
+        dist += 1
+
+
+def _search_bfs01(
+    result, neighbors, is_target, max_weight, heuristic, track_preds, relax
+):
+    dists = result.dists
+    queue = deque((0, s) for s in dists)
+    best = None
+    while len(queue) > 0:
+        dist, state = queue.popleft()
+        if dists[state] != dist:
+            continue  # stale entry
+        if best is not None and dist > best:
+            break
+        if is_target is not None and is_target(state):
+            if best is None:
+                best = dist
+            result.targets.append(state)
+        for next_state, cost in neighbors(state):
+            next_dist = dist + cost
+            if relax(result, state, next_state, next_dist, track_preds):
+                if cost == 0:
+                    queue.appendleft((next_dist, next_state))
+                else:
+                    queue.append((next_dist, next_state))
+
+
+def adjacency_neighbors(
+    adjacency: Adjacency,
+    weights: np.ndarray | None = None,
+) -> Callable[[int], list[tuple[int, int]]]:
+    """
+    neighbors callback over the nodes of a compiled adjacency index. The cost
+    of entering a node is weights[node], 1 if no weights are given.
+    """
+    indptr = adjacency.indptr.tolist()
+    indices = adjacency.indices.tolist()
+    costs = [1] * adjacency.n_nodes if weights is None else weights.tolist()
+    transitions = [
+        [(n, costs[n]) for n in indices[indptr[node] : indptr[node + 1]]]
+        for node in range(adjacency.n_nodes)
+    ]
+    return transitions.__getitem__
@@ -0,0 +1,94 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from geometry import (
+    DIRECTION_OFFSETS,
+    V2,
+    DenseGrid,
+    Direction,
+    DirectionEnum,
+    Grid,
+    build_adjacency,
+    neighbor_offsets,
+)
+
+
+def test_direction_enum_row_column_convention():
+    assert DirectionEnum.NORTH.to_v2() == Direction.UP
+    assert DirectionEnum.SOUTH.to_v2() == Direction.DOWN
+    assert DirectionEnum.EAST.to_v2() == Direction.RIGHT
+    assert DirectionEnum.WEST.to_v2() == Direction.LEFT
+
+
+def test_direction_enum_rotation():
+    for direction in DirectionEnum:
+        assert direction.clockwise().counter_clockwise() == direction
+        assert direction.opposite().to_v2() == -direction.to_v2()
+        dx, dy = DIRECTION_OFFSETS[direction.index]
+        assert direction.to_v2() == V2(int(dx), int(dy))
+    assert DirectionEnum.NORTH.clockwise() == DirectionEnum.EAST
+
+
+def test_neighbor_offsets():
+    width = 7
+    p = V2(3, 4)
+    for direction, offset in zip(DirectionEnum, neighbor_offsets(width)):
+        assert p.pack(width) + offset == (p + direction.to_v2()).pack(width)
+
+
+def test_v2_hash_and_pack():
+    assert len({V2(1, 2), V2(1, 2), V2(2, 1)}) == 2
+    assert V2.unpack(V2(5, 6).pack(10), 10) == V2(5, 6)
+
+
+def test_v2_immutable():
+    p = V2(1, 2)
+    with pytest.raises(AttributeError):
+        p.x = 3
+    with pytest.raises(AttributeError):
+        del p.y
+    assert pickle.loads(pickle.dumps(p)) == copy.deepcopy(p) == p
+    assert hash(pickle.loads(pickle.dumps(p))) == hash(p)
+
+
+def test_dense_grid_round_trip():
+    grid = Grid(["#.S", "..E"])
+    dense = DenseGrid.from_grid(grid)
+    assert dense.height == 2 and dense.width == 3
+    assert dense.find("E") == [V2(1, 2)]
+    dense.update(V2(0, 0), ".")
+    assert dense.at(V2(0, 0)) == "."
+    assert dense.to_grid() == Grid(["..S", "..E"])
+    assert dense.cells.dtype == np.uint8
+
+
+def test_adjacency_bfs():
+    grid = Grid(
+        [
+            "..#",
+            "#..",
+            ".#.",
+            "...",
+        ]
+    )
+    adjacency = build_adjacency(grid)
+    assert adjacency.n_nodes == 9
+    assert adjacency.indptr[-1] == len(adjacency.indices)
+    start = adjacency.node(V2(0, 0))
+    assert adjacency.node(V2(0, 2)) == -1
+    dists = adjacency.bfs(start)
+    assert dists[adjacency.node(V2(2, 0))] == 8
+    assert adjacency.to_dict(dists)[V2(3, 2)] == 5
+    assert adjacency.to_array(dists)[:, 2].tolist() == [-1, 3, 4, 5]
+    neighbors = {adjacency.position(n) for n in adjacency.neighbors(start)}
+    assert neighbors == {V2(0, 1)}
+
+
+def test_adjacency_predicate():
+    grid = DenseGrid.from_grid(["a.b", "..."])
+    adjacency = build_adjacency(grid, lambda c: c == ".")
+    assert adjacency.n_nodes == 4
+    assert adjacency.bfs(adjacency.node(V2(0, 1))).tolist() == [0, 2, 1, 2]
@@ -0,0 +1,90 @@
+import pytest
+
+from geometry import V2, Direction, Grid, adjacency_neighbors, build_adjacency, search
+
+GRID = Grid(
+    [
+        "S.1..",
+        ".#9#.",
+        "..1.E",
+    ]
+)
+
+
+def weighted_neighbors(p: V2):
+    for direction in Direction.ALL:
+        new_p = p + direction
+        if GRID.is_inbounds(new_p) and GRID.at(new_p) != "#":
+            c = GRID.at(new_p)
+            yield new_p, int(c) if c.isdigit() else 1
+
+
+@pytest.mark.parametrize("engine", ["bucket", "heap"])
+def test_search_engines_agree(engine):
+    end = V2(2, 4)
+    result = search(
+        [V2(0, 0)],
+        weighted_neighbors,
+        is_target=lambda p: p == end,
+        max_weight=9,
+        engine=engine,
+    )
+    assert result.best == 6
+    assert result.targets == [end]
+
+
+def test_search_full_distance_map():
+    result = search([V2(0, 0)], weighted_neighbors, max_weight=9)
+    assert result.dists[V2(1, 2)] == 11
+    assert result.targets == []
+    assert result.best == -1
+
+
+def test_search_a_star():
+    end = V2(2, 4)
+    result = search(
+        [V2(0, 0)],
+        weighted_neighbors,
+        is_target=lambda p: p == end,
+        heuristic=lambda p: abs(p.x - end.x) + abs(p.y - end.y),
+    )
+    assert result.best == 6
+
+
+def test_search_bfs01_zero_edges():
+    # moving right is free, every other move costs 1
+    def neighbors(p: V2):
+        for direction in Direction.ALL:
+            new_p = p + direction
+            if GRID.is_inbounds(new_p) and GRID.at(new_p) != "#":
+                yield new_p, 0 if direction == Direction.RIGHT else 1
+
+    result = search([V2(0, 0)], neighbors, max_weight=1)
+    assert result.dists[V2(0, 4)] == 0
+    assert result.dists[V2(2, 4)] == 2
+
+
+def test_search_path_states():
+    end = V2(2, 4)
+    result = search(
+        [V2(0, 0)],
+        weighted_neighbors,
+        is_target=lambda p: p == end,
+        max_weight=9,
+        track_preds=True,
+    )
+    # both ways around the wall cost 6
+    assert result.path_states() == {
+        V2(0, 0), V2(0, 1), V2(0, 2), V2(0, 3), V2(0, 4), V2(1, 4),
+        V2(1, 0), V2(2, 0), V2(2, 1), V2(2, 2), V2(2, 3), V2(2, 4),
+    }  # fmt: skip
+
+
+def test_search_adjacency_neighbors():
+    adjacency = build_adjacency(GRID)
+    start = adjacency.node(V2(0, 0))
+    result = search([start], adjacency_neighbors(adjacency), max_weight=1)
+    dists = adjacency.bfs(start)
+    assert len(result.dists) == adjacency.n_nodes
+    for node, dist in result.dists.items():
+        assert dists[node] == dist
@@ -0,0 +1,73 @@
+# odd multiplier larger than any grid dimension so (x, y) hashes rarely collide
+HASH_MULTIPLIER = 1_000_003
+
+
+class V2:
+    """
+    Immutable 2d integer vector. Uses __slots__ and an arithmetic hash
+    computed once at construction since it is hashed on every set/dict lookup
+    in the grid searches.
+    """
+
+    __slots__ = ("_hash", "x", "y")
+
+    def __init__(self, x: int, y: int) -> None:
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_hash(self, x * HASH_MULTIPLIER ^ y)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"V2 is immutable, cannot set {name}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"V2 is immutable, cannot delete {name}")
+
+    def __reduce__(self):
+        # the default reduce restores slots through __setattr__
+        return V2, (self.x, self.y)
+
+    def __repr__(self) -> str:
+        return f"V2(x={self.x}, y={self.y})"
+
+    def __eq__(self, that) -> bool:
+        if not isinstance(that, V2):
+            return NotImplemented
+        return self.x == that.x and self.y == that.y
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __add__(self, that: "V2") -> "V2":
+        return V2(self.x + that.x, self.y + that.y)
+
+    def __sub__(self, that: "V2") -> "V2":
+        return V2(self.x - that.x, self.y - that.y)
+
+    def __neg__(self) -> "V2":
+        return V2(-self.x, -self.y)
+
+    def __mul__(self, that) -> "V2":
+        if isinstance(that, int):
+            return V2(self.x * that, self.y * that)
+        raise NotImplementedError
+
+    def __rmul__(self, that) -> "V2":
+        return self * that
+
+    def pack(self, width: int) -> int:
+        """
+        packed int coordinate (x * width + y) for grid algorithms that
+        index flat arrays instead of hashing V2
+        """
+        return self.x * width + self.y
+
+    @classmethod
+    def unpack(cls, i: int, width: int) -> "V2":
+        return cls(*divmod(i, width))
+
+
+# the slot descriptors write past the __setattr__ guard, at the cost of
+# plain attribute assignment
+_set_x = V2.x.__set__
+_set_y = V2.y.__set__
+_set_hash = V2._hash.__set__
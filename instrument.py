@@ -0,0 +1,184 @@
+"""
+Opt-in counters, cache statistics and phase timings for the solvers.
+
+Instrumentation is off unless AOC_INSTRUMENT=1 is set or enable() is called
+before the solver modules are imported. The decorators are resolved when a
+module is imported and return the function untouched while disabled, and
+phase() hands back a shared no-op context manager, so a disabled run pays
+nothing in the hot loops.
+
+    @counted("day6.loop_checks")
+    def is_valid_loop(grid): ...
+
+    @track_cache("day19.num_ways")
+    @functools.cache
+    def num_ways(s, patterns): ...
+
+    with phase("build"):
+        ...
+
+snapshot() returns everything gathered since the last reset() as a JSON
+friendly dict and to_folded() turns its phases into collapsed stacks for
+flamegraph.pl, speedscope or inferno.
+"""
+
+import contextlib
+import functools
+import os
+import time
+from collections import Counter
+from typing import Any, Callable, Iterator, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ENV_VAR = "AOC_INSTRUMENT"
+ENABLED = os.environ.get(ENV_VAR, "") not in ("", "0")
+
+_counters: Counter[str] = Counter()
+# "outer;inner" phase path -> [calls, seconds, self seconds]
+_phases: dict[str, list] = {}
+# open phases as [name, start, seconds spent in child phases]
+_stack: list[list] = []
+# functools.cache wrappers by name, with their hits and misses at reset()
+_caches: dict[str, tuple[Callable, int, int]] = {}
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def enable() -> None:
+    """turns instrumentation on here and in child processes started later"""
+    global ENABLED
+    ENABLED = True
+    os.environ[ENV_VAR] = "1"
+
+
+def disable() -> None:
+    global ENABLED
+    ENABLED = False
+    os.environ.pop(ENV_VAR, None)
+
+
+def reset() -> None:
+    _counters.clear()
+    _phases.clear()
+    _stack.clear()
+    for name, (fn, _, _) in _caches.items():
+        info = fn.cache_info()
+        _caches[name] = (fn, info.hits, info.misses)
+
+
+def count(name: str, n: int = 1) -> None:
+    """for code outside hot loops, which can afford the check"""
+    if ENABLED:
+        _counters[name] += n
+
+
+def _default_name(fn: Callable) -> str:
+    """the name every decorator reports fn under when it is not given one"""
+    return f"{fn.__module__}.{fn.__qualname__}"
+
+
+def counted(name: str | None = None) -> Callable[[F], F]:
+    """counts calls of the decorated function"""
+
+    def decorator(fn: F) -> F:
+        if not ENABLED:
+            return fn
+        key = name or _default_name(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            _counters[key] += 1
+            return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def timed(name: str | None = None) -> Callable[[F], F]:
+    """runs every call of the decorated function as a phase"""
+
+    def decorator(fn: F) -> F:
+        if not ENABLED:
+            return fn
+        key = name or _default_name(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _phase(key):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def track_cache(name: str | None = None) -> Callable[[F], F]:
+    """
+    reports the hits and misses of a functools.cache / lru_cache wrapper,
+    which counts them anyway, so the function is never wrapped
+    """
+
+    def decorator(fn: F) -> F:
+        info = fn.cache_info()  # type: ignore[attr-defined]
+        _caches[name or _default_name(fn)] = (fn, info.hits, info.misses)
+        return fn
+
+    return decorator
+
+
+def phase(name: str) -> contextlib.AbstractContextManager:
+    """times a block, phases opened inside it nest under its name"""
+    if not ENABLED:
+        return _NULL_CONTEXT
+    return _phase(name)
+
+
+@contextlib.contextmanager
+def _phase(name: str) -> Iterator[None]:
+    frame = [name, time.perf_counter(), 0.0]
+    _stack.append(frame)
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - frame[1]
+        _stack.pop()
+        path = ";".join([f[0] for f in _stack] + [name])
+        stats = _phases.setdefault(path, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] += seconds - frame[2]
+        if len(_stack) > 0:
+            _stack[-1][2] += seconds
+
+
+def snapshot() -> dict:
+    caches = {}
+    for name, (fn, hits, misses) in _caches.items():
+        info = fn.cache_info()
+        caches[name] = {
+            "hits": info.hits - hits,
+            "misses": info.misses - misses,
+            "size": info.currsize,
+        }
+    return {
+        "counters": dict(sorted(_counters.items())),
+        "caches": {k: v for k, v in caches.items() if v["hits"] + v["misses"] > 0},
+        "phases": {
+            path: {"calls": calls, "seconds": seconds, "self_seconds": self_seconds}
+            for path, (calls, seconds, self_seconds) in _phases.items()
+        },
+    }
+
+
+def to_folded(stats: dict, root: str | None = None) -> list[str]:
+    """
+    collapsed stack lines, "outer;inner <self microseconds>", of the phases
+    in a snapshot
+    """
+    lines = []
+    for path, phase_stats in stats["phases"].items():
+        if root is not None:
+            path = f"{root};{path}"
+        lines.append(f"{path} {round(phase_stats['self_seconds'] * 1e6)}")
+    return lines
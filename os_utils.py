@@ -1,12 +1,117 @@
-from typing import Callable, TypeVar
+"""
+Input loading shared by the solvers. Files are memory mapped and read line
+by line, so large inputs are never held as both text and parsed objects.
+"""
+
+import contextlib
+import mmap
+import os
+import re
+from typing import Callable, Iterator, TypeVar
+
+import numpy as np
 
 T = TypeVar("T")
 
+# anything that is not part of an integer, a "-" only counts as a sign when
+# it is directly followed by a digit and not preceded by one (so "2-4" is
+# the two numbers 2 and 4)
+_NON_INT_BYTES = re.compile(rb"[^\d-]|-(?!\d)|(?<=\d)-")
+_SEPARATOR = re.compile(rb"[^\d-]")
+_INT_CHARS = b"0123456789-"
+# bytes of input copied and parsed at a time
+PARSE_CHUNK = 1 << 20
+
+
+def resolve_path(fname: str, relative_to: str | None = None) -> str:
+    """
+    fname relative to the directory of relative_to, usually a solver's
+    __file__, so inputs load from any working directory
+    """
+    if relative_to is None or os.path.isabs(fname):
+        return fname
+    return os.path.join(os.path.dirname(os.path.abspath(relative_to)), fname)
+
+
+@contextlib.contextmanager
+def open_mmap(fname: str) -> Iterator[mmap.mmap | bytes]:
+    with open(fname, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def iter_lines(fname: str) -> Iterator[str]:
+    """stripped lines of a file, read lazily from a memory map"""
+    with open_mmap(fname) as mm:
+        if isinstance(mm, bytes):
+            return
+        for line in iter(mm.readline, b""):
+            yield line.decode().strip()
+
+
+def iter_parse_file(fname: str, parse_line_fn: Callable[[str], T]) -> Iterator[T]:
+    for line in iter_lines(fname):
+        yield parse_line_fn(line)
+
 
 def parse_file(fname: str, parse_line_fn: Callable[[str], T]) -> list[T]:
-    objs = []
-    with open(fname) as f:
-        for line in f:
-            line = line.strip()
-            objs.append(parse_line_fn(line))
-    return objs
+    return list(iter_parse_file(fname, parse_line_fn))
+
+
+def read_text(fname: str) -> str:
+    with open_mmap(fname) as mm:
+        return mm[:].decode()
+
+
+def _int_chunks(data: bytes | mmap.mmap) -> Iterator[bytes]:
+    """
+    data in copies of about PARSE_CHUNK bytes, each cut just after a
+    separator so no number or sign is split between two chunks
+    """
+    start = 0
+    while start < len(data):
+        end = start + PARSE_CHUNK
+        if end >= len(data):
+            yield data[start:]
+            return
+        chunk = data[start:end].rstrip(_INT_CHARS)
+        if len(chunk) == 0:
+            # a run of digits longer than a chunk, cut at the next separator
+            separator = _SEPARATOR.search(data, end)
+            end = len(data) if separator is None else separator.end()
+            chunk = data[start:end]
+        yield chunk
+        start += len(chunk)
+
+
+def _parse_chunk(chunk: bytes) -> np.ndarray:
+    # np.fromstring reads a blank string as a single 0
+    text = _NON_INT_BYTES.sub(b" ", chunk).strip()
+    return np.fromstring(text.decode(), dtype=np.int64, sep=" ")
+
+
+def parse_ints(data: bytes | mmap.mmap | str, n_cols: int | None = None) -> np.ndarray:
+    """
+    every integer in data as an int64 array. Vectorized version of
+    re.findall(r"-?\\d+", ...), except that a "-" between two digits is a
+    separator. With n_cols it is reshaped to one row per n_cols numbers.
+    Mapped files are parsed a chunk at a time, never as one string.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    ints = np.concatenate(
+        [np.zeros(0, dtype=np.int64)]
+        + [_parse_chunk(chunk) for chunk in _int_chunks(data)]
+    )
+    if n_cols is not None:
+        ints = ints.reshape(-1, n_cols)
+    return ints
+
+
+def read_ints(fname: str, n_cols: int | None = None) -> np.ndarray:
+    with open_mmap(fname) as mm:
+        return parse_ints(mm, n_cols)
@@ -0,0 +1,100 @@
+import functools
+
+import pytest
+
+import instrument
+from geometry import V2, Direction, Grid, search
+
+
+@pytest.fixture
+def enabled():
+    instrument.enable()
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_is_untouched():
+    assert not instrument.ENABLED
+
+    def fn():
+        pass
+
+    assert instrument.counted()(fn) is fn
+    assert instrument.timed()(fn) is fn
+    with instrument.phase("solve"):
+        instrument.count("calls")
+    assert instrument.snapshot()["counters"] == {}
+    assert instrument.snapshot()["phases"] == {}
+
+
+def test_counters_and_phases(enabled):
+    @instrument.counted("fn.calls")
+    def fn():
+        with instrument.phase("inner"):
+            pass
+
+    with instrument.phase("outer"):
+        fn()
+        fn()
+    stats = instrument.snapshot()
+    assert stats["counters"] == {"fn.calls": 2}
+    assert stats["phases"]["outer;inner"]["calls"] == 2
+    outer = stats["phases"]["outer"]
+    assert outer["self_seconds"] <= outer["seconds"]
+    assert [line.split()[0] for line in instrument.to_folded(stats, "run")] == [
+        "run;outer;inner",
+        "run;outer",
+    ]
+
+
+def test_default_names(enabled):
+    @instrument.counted()
+    @instrument.timed()
+    def fn():
+        pass
+
+    @instrument.track_cache()
+    @functools.cache
+    def cached():
+        pass
+
+    fn()
+    cached()
+    name = f"{__name__}.test_default_names.<locals>"
+    stats = instrument.snapshot()
+    assert list(stats["counters"]) == [f"{name}.fn"]
+    assert list(stats["phases"]) == [f"{name}.fn"]
+    assert list(stats["caches"]) == [f"{name}.cached"]
+
+
+def test_track_cache(enabled):
+    @instrument.track_cache("fib")
+    @functools.cache
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    fib(10)
+    instrument.reset()
+    fib(12)
+    assert instrument.snapshot()["caches"]["fib"] == {
+        "hits": 3,
+        "misses": 2,
+        "size": 13,
+    }
+
+
+def test_search_counters(enabled):
+    grid = Grid(["...", ".#.", "..."])
+
+    def neighbors(p: V2):
+        for direction in Direction.ALL:
+            new_p = p + direction
+            if grid.is_inbounds(new_p) and grid.at(new_p) != "#":
+                yield new_p, 1
+
+    search([V2(0, 0)], neighbors)
+    counters = instrument.snapshot()["counters"]
+    assert counters["search.expansions"] == 8
+    assert counters["search.pushes"] == 7
@@ -0,0 +1,37 @@
+import numpy as np
+
+import os_utils
+from os_utils import iter_lines, parse_file, parse_ints, read_ints, read_text
+
+
+def test_parse_ints():
+    assert parse_ints("p=0,4 v=3,-3").tolist() == [0, 4, 3, -3]
+    assert parse_ints(b"1,0,1~1,2,1", n_cols=3).tolist() == [[1, 0, 1], [1, 2, 1]]
+    assert parse_ints("19, 13, 30 @ -2,  1, -2").tolist() == [19, 13, 30, -2, 1, -2]
+    assert parse_ints("2-4 - 5").tolist() == [2, 4, 5]
+    assert parse_ints("").dtype == np.int64
+    assert len(parse_ints(" x \n")) == 0
+
+
+def test_parse_ints_chunks(monkeypatch):
+    data = b"p=10,-4 v=3,-3\n2-4 - 5 123456789\n"
+    monkeypatch.setattr(os_utils, "PARSE_CHUNK", 4)
+    assert b"".join(os_utils._int_chunks(data)) == data
+    assert parse_ints(data).tolist() == [10, -4, 3, -3, 2, 4, 5, 123456789]
+
+
+def test_read_file(tmp_path):
+    fname = tmp_path / "input.txt"
+    fname.write_text("12 ab\n-3 cd\n")
+    assert list(iter_lines(fname)) == ["12 ab", "-3 cd"]
+    assert parse_file(fname, lambda line: line.split()[1]) == ["ab", "cd"]
+    assert read_text(fname) == "12 ab\n-3 cd\n"
+    assert read_ints(fname).tolist() == [12, -3]
+
+
+def test_read_empty_file(tmp_path):
+    fname = tmp_path / "empty.txt"
+    fname.write_text("")
+    assert list(iter_lines(fname)) == []
+    assert read_text(fname) == ""
+    assert len(read_ints(fname)) == 0
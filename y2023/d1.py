@@ -1,4 +1,5 @@
 import string
+from os_utils import iter_lines, resolve_path
 from utils import first
 
 
@@ -40,21 +41,14 @@ def parse_p2(s) -> int:
 
 
 def part1(fname):
-    nums = []
-    with open(fname) as f:
-        for line in f:
-            nums.append(parse_p1(line))
-    print(sum(nums))
+    return sum(parse_p1(line) for line in iter_lines(fname))
 
 
 def part2(fname):
-    nums = []
-    with open(fname) as f:
-        for line in f:
-            nums.append(parse_p2(line))
-    print(sum(nums))
+    return sum(parse_p2(line) for line in iter_lines(fname))
 
 
 if __name__ == "__main__":
-    part1("./y2023/data/d1.txt")
-    part2("./y2023/data/d1.txt")
+    fname = resolve_path("data/d1.txt", __file__)
+    print(part1(fname))
+    print(part2(fname))
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import Literal
 
 from grid import V2, DirectionEnum, Grid, read_grid
+from os_utils import resolve_path
 
 
 @dataclass(frozen=True)
@@ -68,6 +69,10 @@ def get_energized_tiles(start_ray: Ray, grid: Grid):
     return {r.p for r in visited}
 
 
+def p1(grid: Grid):
+    return len(get_energized_tiles(Ray(V2(0, 0), DirectionEnum.EAST), grid))
+
+
 def p2(grid: Grid):
     max_energized = 0
     for x in range(0, grid.height):
@@ -100,8 +105,7 @@ def p2(grid: Grid):
 
 
 if __name__ == "__main__":
-    test_grid = read_grid("./y2023/data/d16_small.txt")
-    grid = read_grid("./y2023/data/d16.txt")
-    # part 1
-    start_ray = Ray(V2(0, 0), DirectionEnum.EAST)
-    print(len(get_energized_tiles(start_ray, grid)))
+    test_grid = read_grid(resolve_path("data/d16_small.txt", __file__))
+    grid = read_grid(resolve_path("data/d16.txt", __file__))
+    print(p1(grid))
+    print(p2(grid))
@@ -1,80 +1,142 @@
-from dataclasses import dataclass
-from grid import V2, DirectionEnum, GridV2, read_grid_v2
-import heapq
+from typing import Literal
 
+from grid import (
+    DIRECTION_OFFSETS,
+    V2,
+    DirectionEnum,
+    GridV2,
+    read_grid_v2,
+    search,
+)
+from os_utils import resolve_path
 
-@dataclass
-class Node:
-    p: V2
-    dir: DirectionEnum
-    n_steps: int
-    dist: int
 
-    def __lt__(self, that):
-        return self.dist < that.dist
+def crucible_neighbors(grid: GridV2[int], min_steps: int, max_steps: int):
+    """
+    states are (position, direction, steps taken in that direction). The
+    crucible can only turn after min_steps and must turn after max_steps.
+    """
 
+    def neighbors(state):
+        p, dir, n_steps = state
+        moves = []
+        if n_steps >= min_steps:
+            moves += [(dir.clockwise(), 1), (dir.counter_clockwise(), 1)]
+        if n_steps < max_steps:
+            moves.append((dir, n_steps + 1))
+        for new_dir, new_n_steps in moves:
+            new_p = p + new_dir.to_v2()
+            if grid.is_inbounds(new_p):
+                yield (new_p, new_dir, new_n_steps), grid.at(new_p)
 
-def min_dist(grid: GridV2[int], max_steps: int = 3) -> int:
-    start = V2(0, 0)
-    end = V2(grid.width - 1, grid.height - 1)
-    node_heap = [
-        Node(start, DirectionEnum.SOUTH, 0, 0),
-        Node(start, DirectionEnum.EAST, 0, 0),
-    ]
-    visited = {(start, DirectionEnum.SOUTH, 1), (start, DirectionEnum.EAST, 1)}
-    while True:
-        node = heapq.heappop(node_heap)
-        if node.p == end:
-            return node.dist
-        for dir, n_steps in [
-            (node.dir, node.n_steps + 1),
-            (node.dir.clockwise(), 1),
-            (node.dir.counter_clockwise(), 1),
-        ]:
-            new_p = node.p + dir.to_v2()
-            if (
-                grid.is_inbounds(new_p)
-                and n_steps <= max_steps
-                and (new_p, dir, n_steps) not in visited
-            ):
-                heapq.heappush(
-                    node_heap, Node(new_p, dir, n_steps, node.dist + grid.at(new_p))
-                )
-                visited.add((new_p, dir, n_steps))
-
-
-def min_dist_v2(grid: GridV2[int], min_steps: int = 4, max_steps: int = 10) -> int:
+    return neighbors
+
+
+# heat loss of a single block is one digit
+MAX_HEAT_LOSS = 9
+
+Engine = Literal["packed", "search"]
+
+
+def min_dist(grid: GridV2[int], max_steps: int = 3, engine: Engine = "packed") -> int:
+    return min_dist_v2(grid, min_steps=0, max_steps=max_steps, engine=engine)
+
+
+def min_dist_v2(
+    grid: GridV2[int],
+    min_steps: int = 4,
+    max_steps: int = 10,
+    engine: Engine = "packed",
+) -> int:
+    if engine == "packed":
+        return min_dist_packed(grid, min_steps, max_steps)
     start = V2(0, 0)
-    end = V2(grid.width - 1, grid.height - 1)
-    node_heap = [
-        Node(start, DirectionEnum.SOUTH, 0, 0),
-        Node(start, DirectionEnum.EAST, 0, 0),
-    ]
-    visited = {(start, DirectionEnum.SOUTH, 1), (start, DirectionEnum.EAST, 1)}
-    while True:
-        node = heapq.heappop(node_heap)
-        if node.p == end:
-            return node.dist
-        if node.n_steps >= min_steps:
-            for dir in [node.dir.clockwise(), node.dir.counter_clockwise()]:
-                n_steps = 1
-                new_p = node.p + dir.to_v2()
-                if grid.is_inbounds(new_p) and (new_p, dir, n_steps) not in visited:
-                    heapq.heappush(
-                        node_heap, Node(new_p, dir, n_steps, node.dist + grid.at(new_p))
-                    )
-                    visited.add((new_p, dir, n_steps))
-        if node.n_steps < max_steps:
-            dir, n_steps = node.dir, node.n_steps + 1
-            new_p = node.p + dir.to_v2()
-            if grid.is_inbounds(new_p) and (new_p, dir, n_steps) not in visited:
-                heapq.heappush(
-                    node_heap, Node(new_p, dir, n_steps, node.dist + grid.at(new_p))
-                )
-                visited.add((new_p, dir, n_steps))
+    end = V2(grid.height - 1, grid.width - 1)
+    result = search(
+        [(start, DirectionEnum.SOUTH, 0), (start, DirectionEnum.EAST, 0)],
+        crucible_neighbors(grid, min_steps, max_steps),
+        is_target=lambda state: state[0] == end and state[2] >= min_steps,
+        max_weight=MAX_HEAT_LOSS,
+    )
+    return result.best
+
+
+def min_dist_packed(grid: GridV2[int], min_steps: int, max_steps: int) -> int:
+    """
+    Dial's algorithm over states packed into a single int
+    ((cell * 4 + direction) * (max_steps + 1) + n_steps), with a circular
+    queue of MAX_HEAT_LOSS + 1 buckets and a bytearray of settled states.
+    """
+    height, width = grid.height, grid.width
+    n_counts = max_steps + 1
+    costs = [c for row in grid for c in row]
+    # next cell in each direction, -1 when it would leave the grid
+    steps = [[-1] * (height * width) for _ in DirectionEnum]
+    for d, (dx, dy) in enumerate(DIRECTION_OFFSETS.tolist()):
+        for x in range(max(0, -dx), min(height, height - dx)):
+            for y in range(max(0, -dy), min(width, width - dy)):
+                steps[d][x * width + y] = (x + dx) * width + y + dy
+    turns = [(d.clockwise().index, d.counter_clockwise().index) for d in DirectionEnum]
+    end = height * width - 1
+    settled = bytearray(height * width * len(turns) * n_counts)
+
+    n_buckets = MAX_HEAT_LOSS + 1
+    buckets: list[list[int]] = [[] for _ in range(n_buckets)]
+    for d in [DirectionEnum.SOUTH, DirectionEnum.EAST]:
+        buckets[0].append(d.index * n_counts)
+    pending = len(buckets[0])
+    dist = 0
+    while pending > 0:
+        bucket = buckets[dist % n_buckets]
+        while len(bucket) > 0:
+            state = bucket.pop()
+            pending -= 1
+            if settled[state]:
+                continue
+            settled[state] = 1
+            cell_dir, n_steps = divmod(state, n_counts)
+            cell, d = divmod(cell_dir, 4)
+            if cell == end and n_steps >= min_steps:
+                return dist
+            moves = []
+            if n_steps >= min_steps:
+                cw, ccw = turns[d]
+                moves += [(cw, 1), (ccw, 1)]
+            if n_steps < max_steps:
+                moves.append((d, n_steps + 1))
+            for new_d, new_n_steps in moves:
+                new_cell = steps[new_d][cell]
+                if new_cell == -1:
+                    continue
+                new_state = (new_cell * 4 + new_d) * n_counts + new_n_steps
+                if not settled[new_state]:
+                    new_dist = dist + costs[new_cell]
+                    buckets[new_dist % n_buckets].append(new_state)
+                    pending += 1
+        dist += 1
+    return -1
+
+
+def parse_heatmap(fname: str) -> GridV2[int]:
+    return read_grid_v2(fname, lambda c: int(c))
+
+
+def test_engines_agree():
+    grid = parse_heatmap(resolve_path("data/d17_small.txt", __file__))
+    assert min_dist(grid, engine="packed") == min_dist(grid, engine="search") == 102
+    assert (
+        min_dist_v2(grid, engine="packed") == min_dist_v2(grid, engine="search") == 94
+    )
+
+
+def test_engines_agree_min_steps():
+    grid = parse_heatmap(resolve_path("data/d17_small_2.txt", __file__))
+    assert (
+        min_dist_v2(grid, engine="packed") == min_dist_v2(grid, engine="search") == 71
+    )
 
 
 if __name__ == "__main__":
-    test_grid = read_grid_v2("./y2023/data/d17_small.txt", lambda c: int(c))
-    test_grid2 = read_grid_v2("./y2023/data/d17_small_2.txt", lambda c: int(c))
-    grid = read_grid_v2("./y2023/data/d17.txt", lambda c: int(c))
+    grid = parse_heatmap(resolve_path("data/d17.txt", __file__))
+    print(min_dist(grid))
+    print(min_dist_v2(grid))
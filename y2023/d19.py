@@ -3,6 +3,7 @@ from typing import Literal, Tuple, TypedDict
 import re
 import copy
 
+from os_utils import iter_lines
 from range import Range
 
 
@@ -204,30 +205,26 @@ def parse_workflow(s) -> Workflow:
 def parse(fname) -> Tuple[WorkflowSet, list[Part]]:
     workflows = []
     parts = []
-    with open(fname) as f:
-        for line in f:
-            line = line.strip()
-            if re.match(r"\w+{.*}", line):
-                workflows.append(parse_workflow(line))
-            elif re.match(r"{.*}", line):
-                parts.append(parse_part(line))
+    for line in iter_lines(fname):
+        if re.match(r"\w+{.*}", line):
+            workflows.append(parse_workflow(line))
+        elif re.match(r"{.*}", line):
+            parts.append(parse_part(line))
     workflow_set = WorkflowSet({w.id: w for w in workflows})
     return workflow_set, parts
 
 
-if __name__ == "__main__":
-    fname = "./y2023/data/d19.txt"
-    ws, parts = parse(fname)
-    # part 1
+def p1(problem: Tuple[WorkflowSet, list[Part]]) -> int:
+    ws, parts = problem
     total = 0
     for part in parts:
         if ws.apply_action(part).type_ == "accept":
             total += get_rating(part)
-    print(total)
+    return total
 
-    fname = "./y2023/data/d19_small.txt"
-    ws, parts = parse(fname)
 
+def p2(problem: Tuple[WorkflowSet, list[Part]]) -> int:
+    ws, _ = problem
     initial_part_set = dict(
         x=Range(1, 4001),
         m=Range(1, 4001),
@@ -237,5 +234,10 @@ if __name__ == "__main__":
     total = 0
     for part_set, action in ws.apply_action_to_set(initial_part_set):
         if action.type_ == "accept":
-            print(part_set)
             total += compute_count(part_set)
+    return total
+
+
+if __name__ == "__main__":
+    print(p1(parse("./y2023/data/d19.txt")))
+    print(p2(parse("./y2023/data/d19_small.txt")))
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 import re
 
+from os_utils import iter_lines
+
 
 @dataclass
 class Round:
@@ -44,31 +46,33 @@ def parse_round(round_str) -> Round:
 
 def parse_games(fname: str) -> list[Game]:
     games = []
-    with open(fname) as f:
-        for line in f:
-            line = line.strip()
-            game_str, round_str = line.split(":", 1)
-            id = int(game_str[len("Game ") :])
-            rounds = [parse_round(s) for s in round_str.split("; ")]
-            games.append(Game(id, rounds))
+    for line in iter_lines(fname):
+        game_str, round_str = line.split(":", 1)
+        id = int(game_str[len("Game ") :])
+        rounds = [parse_round(s) for s in round_str.split("; ")]
+        games.append(Game(id, rounds))
     return games
 
 
-def p1():
-    games = parse_games("./y2023/data/d2.txt")
+def p1(games: list[Game]) -> int:
     total = 0
     for game in games:
         if is_possible(game, 12, 13, 14):
             total += game.id
-    print(total)
+    return total
 
 
-def p2():
-    games = parse_games("./y2023/data/d2.txt")
+def p2(games: list[Game]) -> int:
     total = 0
     for game in games:
         red_needed = max([r.n_red for r in game.rounds])
         blue_needed = max([r.n_blue for r in game.rounds])
         green_needed = max([r.n_green for r in game.rounds])
         total += red_needed * blue_needed * green_needed
-    print(total)
+    return total
+
+
+if __name__ == "__main__":
+    games = parse_games("./y2023/data/d2.txt")
+    print(p1(games))
+    print(p2(games))
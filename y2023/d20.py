@@ -3,6 +3,8 @@ import abc
 from dataclasses import dataclass, field
 from collections import deque
 
+from os_utils import iter_lines
+
 
 class Node(abc.ABC):
     @abc.abstractmethod
@@ -101,23 +103,21 @@ class ModuleGraph:
 def parse_file(fname) -> ModuleGraph:
     nodes = dict()
     edges = dict()
-    with open(fname) as f:
-        for line in f:
-            line = line.strip()
-            if (match := re.match(r"broadcaster -> (.*)", line)) is not None:
-                (downstream_str,) = match.groups()
-                nodes["broadcast"] = BroadcastNode()
-                edges["broadcast"] = downstream_str.split(", ")
-            elif (match := re.match(r"([%,&])(\w*) -> (.*)", line)) is not None:
-                (
-                    type_str,
-                    upstream_str,
-                    downstream_str,
-                ) = match.groups()
-                nodes[upstream_str] = {"&": AndNode, "%": FlipFlopNode}[type_str]()
-                edges[upstream_str] = downstream_str.split(", ")
-            else:
-                raise ValueError("parsing failed")
+    for line in iter_lines(fname):
+        if (match := re.match(r"broadcaster -> (.*)", line)) is not None:
+            (downstream_str,) = match.groups()
+            nodes["broadcast"] = BroadcastNode()
+            edges["broadcast"] = downstream_str.split(", ")
+        elif (match := re.match(r"([%,&])(\w*) -> (.*)", line)) is not None:
+            (
+                type_str,
+                upstream_str,
+                downstream_str,
+            ) = match.groups()
+            nodes[upstream_str] = {"&": AndNode, "%": FlipFlopNode}[type_str]()
+            edges[upstream_str] = downstream_str.split(", ")
+        else:
+            raise ValueError("parsing failed")
     return ModuleGraph(nodes, edges)
 
 
@@ -1,22 +1,189 @@
-from grid import GridV2, V2, DirectionEnum, is_inbounds, read_grid_v2
+import numpy as np
+
+from grid import GridV2, V2, DirectionEnum, passable_mask, read_grid_v2
+from os_utils import resolve_path
+
+# how many map periods of samples the infinite map extrapolation may look
+# through before giving up on finding a quadratic
+MAX_EXTRAPOLATION_PERIODS = 32
 
 
 def get_possible_locations(
     grid: GridV2[str],
     start_ps: set[V2],
     n_steps: int,
+    infinite: bool = False,
 ) -> set[V2]:
-    if n_steps == 0:
-        return start_ps
-    next_start_ps = set()
-    for p in start_ps:
-        for direction in DirectionEnum:
-            next_p = p + direction.to_v2()
-            if grid.is_inbounds(next_p) and grid.at(next_p) in [".", "S"]:
-                next_start_ps.add(next_p)
-    return get_possible_locations(grid, next_start_ps, n_steps - 1)
+    """
+    With infinite the map repeats in every direction and positions off it
+    are wrapped back onto it for the lookup.
+    """
+    for _ in range(n_steps):
+        next_start_ps = set()
+        for p in start_ps:
+            for direction in DirectionEnum:
+                next_p = p + direction.to_v2()
+                if infinite:
+                    cell = grid.at(V2(next_p.x % grid.height, next_p.y % grid.width))
+                elif grid.is_inbounds(next_p):
+                    cell = grid.at(next_p)
+                else:
+                    continue
+                if cell in [".", "S"]:
+                    next_start_ps.add(next_p)
+        start_ps = next_start_ps
+    return start_ps
+
+
+def garden_mask(grid: GridV2[str]) -> np.ndarray:
+    return passable_mask(grid, lambda c: c in [".", "S"])
+
+
+def step_frontier(frontier: np.ndarray, passable: np.ndarray) -> np.ndarray:
+    """every passable cell next to the frontier"""
+    next_frontier = np.zeros_like(frontier)
+    next_frontier[1:] |= frontier[:-1]
+    next_frontier[:-1] |= frontier[1:]
+    next_frontier[:, 1:] |= frontier[:, :-1]
+    next_frontier[:, :-1] |= frontier[:, 1:]
+    return next_frontier & passable
+
+
+def count_reachable(
+    passable: np.ndarray,
+    start: V2,
+    n_steps: int,
+) -> int:
+    """
+    number of cells reachable in exactly n_steps. Once the frontier repeats
+    with period 2 the answer only depends on the parity of n_steps, so it
+    stops there.
+    """
+    frontiers = [np.zeros_like(passable)]
+    frontiers[0][start.x, start.y] = True
+    for step in range(1, n_steps + 1):
+        frontiers.append(step_frontier(frontiers[-1], passable))
+        if step >= 2 and np.array_equal(frontiers[-1], frontiers[-3]):
+            return int(frontiers[-1 - (n_steps - step) % 2].sum())
+        frontiers = frontiers[-3:]
+    return int(frontiers[-1].sum())
+
+
+def reachable_counts_tiled(
+    passable: np.ndarray,
+    start: V2,
+    n_steps: int,
+) -> list[int]:
+    """
+    reachable cell counts after 0..n_steps steps on the infinite repeated
+    map, simulated on just enough copies of it that the frontier never
+    reaches the edge. Each step only touches the square the frontier can
+    have reached so far. The start may lie on any copy of the map, it is
+    wrapped back onto the middle one.
+    """
+    height, width = passable.shape
+    n_tiles = max(-(-(n_steps + 1) // height), -(-(n_steps + 1) // width))
+    tiled = np.tile(passable, (2 * n_tiles + 1, 2 * n_tiles + 1))
+    frontier = np.zeros_like(tiled)
+    x = start.x % height + n_tiles * height
+    y = start.y % width + n_tiles * width
+    frontier[x, y] = True
+    counts = [1]
+    for step in range(1, n_steps + 1):
+        window = np.s_[x - step - 1 : x + step + 2, y - step - 1 : y + step + 2]
+        frontier[window] = step_frontier(frontier[window], tiled[window])
+        counts.append(int(frontier[window].sum()))
+    return counts
+
+
+def count_reachable_infinite(
+    passable: np.ndarray,
+    start: V2,
+    n_steps: int,
+    max_periods: int = MAX_EXTRAPOLATION_PERIODS,
+) -> int:
+    """
+    On the infinite map the counts at n_steps % period, + period,
+    + 2 * period, ... eventually follow a quadratic, so the count is
+    extrapolated from the first samples with a constant second difference.
+    Small step counts are simulated directly.
+    """
+    height, width = passable.shape
+    assert height == width, "extrapolation needs a square map"
+    period = height
+    offset, n_periods = n_steps % period, n_steps // period
+    n_samples = 4
+    while True:
+        n_samples = min(n_samples, n_periods + 1)
+        counts = reachable_counts_tiled(
+            passable, start, offset + (n_samples - 1) * period
+        )
+        samples = [counts[offset + k * period] for k in range(n_samples)]
+        if n_samples == n_periods + 1:
+            return samples[-1]
+
+        for k in range(n_samples - 3):
+            f0, f1, f2, f3 = samples[k : k + 4]
+            if f3 - 2 * f2 + f1 == f2 - 2 * f1 + f0:
+                # f(k + t) on the quadratic through f0, f1, f2
+                t = n_periods - k
+                first, second = f1 - f0, f2 - 2 * f1 + f0
+                return f0 + t * first + t * (t - 1) // 2 * second
+        if n_samples > max_periods:
+            raise ValueError(f"no quadratic growth within {max_periods} periods")
+        n_samples *= 2
+
+
+def parse_garden(fname: str) -> GridV2[str]:
+    return read_grid_v2(fname, lambda x: x)
+
+
+def p1(grid: GridV2[str]) -> int:
+    return count_reachable(garden_mask(grid), grid.find("S")[0], 64)
+
+
+def p2(grid: GridV2[str]) -> int:
+    return count_reachable_infinite(garden_mask(grid), grid.find("S")[0], 26501365)
+
+
+def test_count_reachable():
+    grid = read_grid_v2(resolve_path("data/d21_small.txt", __file__))
+    start = grid.find("S")[0]
+    passable = garden_mask(grid)
+    assert count_reachable(passable, start, 6) == 16
+    assert count_reachable(passable, start, 6) == len(
+        get_possible_locations(grid, {start}, 6)
+    )
+    assert count_reachable(passable, start, 1_000_000) == count_reachable(
+        passable, start, 1_000
+    )
+
+
+def test_count_reachable_infinite():
+    grid = read_grid_v2(resolve_path("data/d21_small.txt", __file__))
+    start = grid.find("S")[0]
+    passable = garden_mask(grid)
+    assert count_reachable_infinite(passable, start, 10) == 50
+    assert count_reachable_infinite(passable, start, 100) == 6536
+    assert count_reachable_infinite(passable, start, 500) == 167004
+    assert count_reachable_infinite(passable, start, 5000) == 16733044
+
+
+def test_reachable_counts_tiled():
+    grid = read_grid_v2(resolve_path("data/d21_small.txt", __file__))
+    start = grid.find("S")[0]
+    passable = garden_mask(grid)
+    counts = reachable_counts_tiled(passable, start, 30)
+    assert counts == [
+        len(get_possible_locations(grid, {start}, n, infinite=True)) for n in range(31)
+    ]
+    offset = V2(3 * grid.height, -2 * grid.width)
+    assert reachable_counts_tiled(passable, start + offset, 30) == counts
+    # the bounded map stops growing where the infinite one does not
+    assert count_reachable(passable, start, 30) < counts[30]
 
 
 if __name__ == "__main__":
-    grid = read_grid_v2("./y2023/data/d21.txt", lambda x: x)
-    final_ps = get_possible_locations(grid, set(grid.find("S")), n_steps=64)
+    grid = parse_garden(resolve_path("data/d21.txt", __file__))
+    print(p1(grid))
+    print(p2(grid))
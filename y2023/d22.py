@@ -3,6 +3,8 @@ from typing import Literal
 import numpy as np
 import copy
 
+from os_utils import read_ints, resolve_path
+
 EMPTY_BRICK_ID = -1
 
 
@@ -95,12 +97,12 @@ def parse_brick(id, s) -> Brick:
 
 
 def parse_file(fname) -> list[Brick]:
-    bricks = []
-    with open(fname) as f:
-        for i, line in enumerate(f):
-            line = line.strip()
-            bricks.append(parse_brick(i, line))
-    return bricks
+    return [
+        Brick(i, p1=Coord(x1, y1, z1), p2=Coord(x2, y2, z2))
+        for i, (x1, y1, z1, x2, y2, z2) in enumerate(
+            read_ints(fname, n_cols=6).tolist()
+        )
+    ]
 
 
 def part1(bricks_below_map: dict[int, set[int]]) -> None:
@@ -119,6 +121,16 @@ def part2(bricks_below_map: dict[int, set[int]]) -> int:
     return total
 
 
+def p1(bricks: list[Brick]) -> int:
+    bricks_below_map, _ = process_bricks(bricks)
+    return len(part1(bricks_below_map))
+
+
+def p2(bricks: list[Brick]) -> int:
+    bricks_below_map, _ = process_bricks(bricks)
+    return part2(bricks_below_map)
+
+
 def get_bricks_to_fall_count(brick_id, bricks_below_map):
     count = 0
     bricks_to_fall = [brick_id]
@@ -134,8 +146,7 @@ def get_bricks_to_fall_count(brick_id, bricks_below_map):
 
 
 if __name__ == "__main__":
-    bricks = parse_file("y2023/data/d22_small.txt")
-    bricks = parse_file("y2023/data/d22.txt")
-    bricks_below_map, _ = process_bricks(bricks)
-    len(part1(bricks_below_map))
-    part2(bricks_below_map)
+    bricks = parse_file(resolve_path("data/d22_small.txt", __file__))
+    bricks = parse_file(resolve_path("data/d22.txt", __file__))
+    print(p1(bricks))
+    print(p2(bricks))
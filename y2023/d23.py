@@ -1,44 +1,225 @@
 """
 We are trying to find max distance between 1 position and another.
 Each position has valid next steps. There can be no cycles.
+
+Corridors are contracted into a graph of junctions first, then the longest
+simple path is found with a DFS over bitmasks of visited junctions.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Tuple
-from grid import V2, DirectionEnum, GridV2, read_grid_v2
-import copy
 
+import numpy as np
+
+from grid import V2, Adjacency, Direction, GridV2, build_adjacency, read_grid_v2
+
+from os_utils import resolve_path
 from utils import arg_first
 
+# states are memoized up to this many visited junctions, deeper ones rarely
+# repeat and would only grow the memo
+MEMO_DEPTH = 16
 
-def find_max_distance(start_p: V2, end_p: V2, map: GridV2[str]) -> int:
-    max_dist = -1
-    path_queues = [[start_p]]
-
-    while len(path_queues) > 0:
-        path = path_queues.pop()
-        curr_p = path[-1]
-        if curr_p == end_p:
-            max_dist = max(len(path) - 1, max_dist)
-        else:
-            dps = {
-                ">": [V2(0, 1)],
-                "<": [V2(0, -1)],
-                "^": [V2(-1, 0)],
-                "v": [V2(1, 0)],
-                ".": [V2(0, 1), V2(0, -1), V2(1, 0), V2(-1, 0)],
-            }[map.at(curr_p)]
-            dps = [V2(0, 1), V2(0, -1), V2(1, 0), V2(-1, 0)]
-            for dp in dps:
-                next_p = curr_p + dp
-                if (
-                    map.is_inbounds(next_p)
-                    and map.at(next_p) != "#"
-                    and next_p not in path
-                ):
-                    path_queues.append(copy.copy(path) + [next_p])
-
-    return max_dist
+SLOPES = {
+    ">": Direction.RIGHT,
+    "<": Direction.LEFT,
+    "^": Direction.UP,
+    "v": Direction.DOWN,
+}
+
+
+@dataclass
+class JunctionGraph:
+    junctions: list[V2]
+    # edges[i] is a list of (j, length) for corridors from junction i to j
+    edges: list[list[tuple[int, int]]]
+    start: int
+    end: int
+
+
+def _forced_moves(map: GridV2[str], adjacency: Adjacency) -> list[int]:
+    """per node, the node its slope forces a move to, -1 off the slopes"""
+    forced = [-1] * adjacency.n_nodes
+    for node in range(adjacency.n_nodes):
+        p = adjacency.position(node)
+        if (direction := SLOPES.get(map.at(p))) is not None:
+            next_p = p + direction
+            if map.is_inbounds(next_p):
+                forced[node] = adjacency.node(next_p)
+    return forced
+
+
+def build_junction_graph(
+    start_p: V2,
+    end_p: V2,
+    map: GridV2[str],
+    slippery: bool = False,
+) -> JunctionGraph:
+    """
+    junctions are the start, the end and every cell with 3 or more open
+    neighbors. Corridors are walked over the node ids of the grid's
+    adjacency. With slippery slopes a corridor is only kept in the
+    directions all of its slopes allow.
+    """
+    adjacency = build_adjacency(map)
+    indptr, indices = adjacency.indptr.tolist(), adjacency.indices.tolist()
+    degrees = np.diff(adjacency.indptr)
+    junction_nodes = [adjacency.node(start_p), adjacency.node(end_p)]
+    junction_nodes += np.flatnonzero(degrees >= 3).tolist()
+    junction_ids = {node: i for i, node in enumerate(junction_nodes)}
+    forced = _forced_moves(map, adjacency) if slippery else None
+
+    def can_move(node: int, next_node: int) -> bool:
+        return forced is None or forced[node] in (-1, next_node)
+
+    edges: list[list[tuple[int, int]]] = [[] for _ in junction_nodes]
+    for i, junction in enumerate(junction_nodes):
+        for node in indices[indptr[junction] : indptr[junction + 1]]:
+            prev_node, is_allowed, length = junction, can_move(junction, node), 1
+            while node not in junction_ids:
+                next_nodes = [
+                    n
+                    for n in indices[indptr[node] : indptr[node + 1]]
+                    if n != prev_node
+                ]
+                if len(next_nodes) == 0:
+                    break  # dead end
+                (next_node,) = next_nodes
+                is_allowed = is_allowed and can_move(node, next_node)
+                prev_node, node = node, next_node
+                length += 1
+            if node in junction_ids and is_allowed:
+                edges[i].append((junction_ids[node], length))
+    junctions = [adjacency.position(node) for node in junction_nodes]
+    return JunctionGraph(junctions, edges, start=0, end=1)
+
+
+@dataclass
+class SearchBounds:
+    """facts about the graph every branch of the search shares"""
+
+    # the only junction with a corridor into the end, None if there are more
+    last: int | None
+    last_length: int
+    # longest corridor into each junction
+    best_in: list[int]
+
+    @classmethod
+    def from_graph(cls, graph: JunctionGraph) -> "SearchBounds":
+        edges, end = graph.edges, graph.end
+        end_edges = [
+            (node, length)
+            for node, node_edges in enumerate(edges)
+            for n, length in node_edges
+            if n == end
+        ]
+        last, last_length = end_edges[0] if len(end_edges) == 1 else (None, 0)
+        best_in = [0] * len(edges)
+        for node_edges in edges:
+            for n, length in node_edges:
+                best_in[n] = max(best_in[n], length)
+        return cls(last, last_length, best_in)
+
+
+def _longest_from(
+    graph: JunctionGraph,
+    bounds: SearchBounds,
+    node: int,
+    visited: int,
+    dist: int,
+) -> int:
+    """
+    longest distance to the end starting at node, -1 if it is unreachable.
+    Two prunes: the upper bound of what is left, every unvisited junction
+    entered once through at most its longest corridor, and a memo of the
+    longest dist seen at each (node, visited), as arriving the same way
+    with less can never finish longer. The memo only holds the first
+    MEMO_DEPTH junctions of a path.
+    """
+    edges, end, best_in = graph.edges, graph.end, bounds.best_in
+    # the end is only entered through one junction, once there going
+    # anywhere else can never come back
+    last, last_length = bounds.last, bounds.last_length
+    remaining = sum(w for n, w in enumerate(best_in) if not visited >> n & 1)
+    best = -1
+    longest_at: dict[tuple[int, int], int] = {}
+
+    def dfs(node: int, visited: int, dist: int, remaining: int) -> None:
+        nonlocal best
+        if node == end:
+            best = max(best, dist)
+            return
+        if node == last:
+            best = max(best, dist + last_length)
+            return
+        if dist + remaining <= best:
+            return
+        if visited.bit_count() <= MEMO_DEPTH:
+            state = (node, visited)
+            if longest_at.get(state, -1) >= dist:
+                return
+            longest_at[state] = dist
+        for next_node, length in edges[node]:
+            bit = 1 << next_node
+            if not visited & bit:
+                dfs(
+                    next_node,
+                    visited | bit,
+                    dist + length,
+                    remaining - best_in[next_node],
+                )
+
+    dfs(node, visited, dist, remaining)
+    return best
+
+
+def _longest_from_args(args) -> int:
+    return _longest_from(*args)
+
+
+def longest_path(graph: JunctionGraph, processes: int | None = None) -> int:
+    """
+    with processes the branches two junctions out from the start are
+    searched in a process pool
+    """
+    bounds = SearchBounds.from_graph(graph)
+    start_visited = 1 << graph.start
+    if processes is None:
+        return _longest_from(graph, bounds, graph.start, start_visited, 0)
+
+    branches = [(graph.start, start_visited, 0)]
+    for _ in range(2):
+        next_branches = []
+        for node, visited, dist in branches:
+            if node == graph.end:
+                # nothing goes on from the end, keep the finished path as is
+                next_branches.append((node, visited, dist))
+                continue
+            for next_node, length in graph.edges[node]:
+                if not visited >> next_node & 1:
+                    next_branches.append(
+                        (next_node, visited | 1 << next_node, dist + length)
+                    )
+        branches = next_branches
+    with ProcessPoolExecutor(processes) as pool:
+        return max(
+            pool.map(
+                _longest_from_args,
+                [(graph, bounds, *branch) for branch in branches],
+            ),
+            default=-1,
+        )
+
+
+def find_max_distance(
+    start_p: V2,
+    end_p: V2,
+    map: GridV2[str],
+    slippery: bool = False,
+    processes: int | None = None,
+) -> int:
+    graph = build_junction_graph(start_p, end_p, map, slippery)
+    return longest_path(graph, processes)
 
 
 @dataclass
@@ -55,9 +236,27 @@ def parse_file(fname) -> ProblemInput:
     return ProblemInput(map, start_p, end_p)
 
 
-if __name__ == "__main__":
-    problem = parse_file("./y2023/data/d23_small.txt")
-    assert find_max_distance(problem.start_p, problem.end_p, problem.map) == 94
+def p1(problem: ProblemInput) -> int:
+    return find_max_distance(problem.start_p, problem.end_p, problem.map, True)
+
+
+def p2(problem: ProblemInput) -> int:
+    return find_max_distance(problem.start_p, problem.end_p, problem.map)
+
+
+def test_find_max_distance():
+    problem = parse_file(resolve_path("data/d23_small.txt", __file__))
+    assert p1(problem) == 94
+    assert p2(problem) == 154
 
-    problem = parse_file("./y2023/data/d23.txt")
-    find_max_distance(problem.start_p, problem.end_p, problem.map)
+
+def test_longest_path_processes():
+    problem = parse_file(resolve_path("data/d23_small.txt", __file__))
+    graph = build_junction_graph(problem.start_p, problem.end_p, problem.map)
+    assert longest_path(graph, processes=2) == longest_path(graph) == 154
+
+
+if __name__ == "__main__":
+    problem = parse_file(resolve_path("data/d23.txt", __file__))
+    print(p1(problem))
+    print(p2(problem))
@@ -3,6 +3,8 @@ import numpy as np
 from numpy.linalg import LinAlgError
 import math
 
+from os_utils import read_ints, resolve_path
+
 
 @dataclass
 class R2:
@@ -119,6 +121,10 @@ def part1(
     return count
 
 
+def p1(states: list[State]) -> int:
+    return part1(states, 200000000000000, 400000000000000)
+
+
 def parse_r3(s) -> R3:
     x, y, z = s.split(", ", 2)
     return R3(
@@ -143,17 +149,15 @@ def test_find_intersection():
 
 
 def parse_file(fname) -> list[State]:
-    states = []
-    with open(fname) as f:
-        for line in f:
-            line = line.strip()
-            states.append(parse_state(line))
-    return states
+    return [
+        State(p0=R3(px, py, pz), v=R3(vx, vy, vz))
+        for px, py, pz, vx, vy, vz in read_ints(fname, n_cols=6).astype(float).tolist()
+    ]
 
 
 if __name__ == "__main__":
-    states = parse_file("./y2023/data/d24_small.txt")
+    states = parse_file(resolve_path("data/d24_small.txt", __file__))
     part1(states, 7, 27)
 
-    states = parse_file("./y2023/data/d24.txt")
-    part1(states, 200000000000000, 400000000000000)
+    states = parse_file(resolve_path("data/d24.txt", __file__))
+    print(p1(states))
@@ -1,17 +1,17 @@
 import networkx as nx
 
+from os_utils import iter_lines
+
 
 def parse_graph(fname) -> nx.Graph:
     nodes = set()
     edges = set()
-    with open(fname) as f:
-        for line in f:
-            line = line.strip()
-            node, neighbors_str = line.split(": ")
-            nodes.add(node)
-            for neighbor in neighbors_str.split(" "):
-                nodes.add(neighbor)
-                edges.add((node, neighbor))
+    for line in iter_lines(fname):
+        node, neighbors_str = line.split(": ")
+        nodes.add(node)
+        for neighbor in neighbors_str.split(" "):
+            nodes.add(neighbor)
+            edges.add((node, neighbor))
     g = nx.Graph()
     g.add_nodes_from(nodes)
     g.add_edges_from(edges)
@@ -113,14 +113,14 @@ def get_gears(grid: Grid) -> list[Gear]:
 def p1(fname):
     grid = read_grid(fname)
     numbers = get_part_numbers(grid)
-    print(sum(numbers))
+    return sum(numbers)
 
 
 def p2(fname):
     grid = read_grid(fname)
     gears = get_gears(grid)
     total = sum([g.n1 * g.n2 for g in gears])
-    print(total)
+    return total
 
 
 def test_get_part_numbers():
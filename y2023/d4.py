@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from os_utils import iter_lines
+
 
 @dataclass
 class Card:
@@ -33,22 +35,22 @@ def parse_card(s) -> Card:
 
 
 def parse_cards(fname) -> list[Card]:
-    cards = []
-    with open(fname) as f:
-        for line in f:
-            cards.append(parse_card(line.strip()))
-    return cards
+    return [parse_card(line) for line in iter_lines(fname)]
 
 
-def p1():
-    cards = parse_cards("./y2023/data/d4.txt")
-    print(sum([c.score() for c in cards]))
+def p1(cards: list[Card]) -> int:
+    return sum([c.score() for c in cards])
 
 
-def p2():
-    cards = parse_cards("./y2023/data/d4.txt")
+def p2(cards: list[Card]) -> int:
     n_cards = [1 for _ in range(len(cards))]
     for i, card in enumerate(cards):
         for i_prime in range(i + 1, i + card.n_matches() + 1):
             n_cards[i_prime] += n_cards[i]
-    print(sum(n_cards))
+    return sum(n_cards)
+
+
+if __name__ == "__main__":
+    cards = parse_cards("./y2023/data/d4.txt")
+    print(p1(cards))
+    print(p2(cards))
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
+from typing import Tuple
 import re
 
+from os_utils import iter_lines, parse_ints
+
 
 @dataclass(frozen=True)
 class Range:
@@ -82,10 +85,8 @@ class UnionMap:
 
 
 def parse_file(fname):
-    with open(fname) as f:
-        lines = f.readlines()
-    lines = [l.strip() for l in lines]
-    seeds = [int(i) for i in lines[0][len("seeds: ") :].split(" ")]
+    lines = list(iter_lines(fname))
+    seeds = parse_ints(lines[0]).tolist()
     maps = []
     curr_map = None
     for line in lines:
@@ -107,14 +108,15 @@ def parse_file(fname):
     return seeds, maps
 
 
-def p1(seeds, maps: list[UnionMap]):
+def p1(problem: Tuple[list[int], list[UnionMap]]) -> int:
+    seeds, maps = problem
     final_outputs = []
     for seed in seeds:
         output = seed
         for map_ in maps:
             output = map_.map_elm(output)
         final_outputs.append(output)
-    print(min(final_outputs))
+    return min(final_outputs)
 
 
 def test_range_and():
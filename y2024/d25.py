@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Literal, Tuple
 import numpy as np
 
+from utils import read_text
+
 MAX_HEIGHT = 5
 
 
@@ -31,9 +33,7 @@ def parse_grid(s: str) -> np.ndarray:
 
 def parse_file(fname) -> list[Schematic]:
     schematics = []
-    with open(fname) as f:
-        content = f.read()
-    grid_strs = content.split("\n\n")
+    grid_strs = read_text(fname).split("\n\n")
     for grid_str in grid_strs:
         grid = parse_grid(grid_str)
         # since 1 of the rows must does not contribute to the height
@@ -59,15 +59,13 @@ def is_compatible(s1: Schematic, s2: Schematic) -> bool:
     return is_different_type and has_compatible_heights
 
 
-def part1(fname):
-    schematics = parse_file(fname)
+def part1(schematics: list[Schematic]) -> int:
     keys = [s for s in schematics if s.type_ == "key"]
     locks = [s for s in schematics if s.type_ == "lock"]
     total = 0
     for key in keys:
         for lock in locks:
             if is_compatible(key, lock):
-                print(key, lock)
                 total += 1
     return total
 
@@ -75,4 +73,4 @@ def part1(fname):
 if __name__ == "__main__":
     test_fname = "y2024/data/d25_small.txt"
     fname = "y2024/data/d25.txt"
-    part1(fname)
+    print(part1(parse_file(fname)))
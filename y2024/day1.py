@@ -1,17 +1,14 @@
 from collections import Counter
 from typing import Tuple, List
 
-DATA_FILE = "./data/day1.txt"
+from utils import read_ints, resolve_path
 
+DATA_FILE = resolve_path("data/day1.txt", __file__)
 
-def get_ids() -> Tuple[List[int], List[int]]:
-    ids1, ids2 = [], []
-    with open(DATA_FILE, "r") as f:
-        for line in f:
-            id1, id2 = line.split()
-            ids1.append(int(id1))
-            ids2.append(int(id2))
-    return (ids1, ids2)
+
+def get_ids(fname: str = DATA_FILE) -> Tuple[List[int], List[int]]:
+    ids = read_ints(fname, n_cols=2)
+    return (ids[:, 0].tolist(), ids[:, 1].tolist())
 
 
 def calculate_total_distance(
@@ -37,7 +34,16 @@ def calculate_similarity_score(
     return total
 
 
-ids1, ids2 = get_ids()
-print(calculate_total_distance(ids1, ids2))
-print(calculate_similarity_score(ids1, ids2))
-print("Hello, World!")
+def part_1(ids: Tuple[List[int], List[int]]) -> int:
+    return calculate_total_distance(*ids)
+
+
+def part_2(ids: Tuple[List[int], List[int]]) -> int:
+    return calculate_similarity_score(*ids)
+
+
+if __name__ == "__main__":
+    ids1, ids2 = get_ids()
+    print(calculate_total_distance(ids1, ids2))
+    print(calculate_similarity_score(ids1, ids2))
+    print("Hello, World!")
@@ -1,5 +1,13 @@
 from typing import Tuple
-from utils import Grid2, V2, is_inbounds, Direction
+from utils import (
+    Grid2,
+    V2,
+    is_inbounds,
+    iter_lines,
+    track_cache,
+    Direction,
+    resolve_path,
+)
 import string
 import functools
 from dataclasses import dataclass
@@ -22,6 +30,7 @@ def is_valid_step(start: str, end: str) -> bool:
 class Problem:
     map: Tuple[str]
 
+    @track_cache("day10.get_num_paths")
     @functools.cache
     def get_num_paths(self, position: V2) -> int:
         map = self.map
@@ -43,6 +52,7 @@ class Problem:
                 total += self.get_num_paths(new_position)
         return total
 
+    @track_cache("day10.get_reachable_peaks")
     @functools.cache
     def get_reachable_peaks(self, position: V2) -> set[V2]:
         map = self.map
@@ -92,11 +102,18 @@ TEST_MAP = (
     "01329801",
     "10456732",
 )
-with open("data/day10.txt") as f:
-    MAP = tuple([x.strip() for x in f])
 
-print(Problem(TEST_MAP).get_total_num_paths())
-print(Problem(MAP).get_total_num_paths())
 
-print(Problem(TEST_MAP).get_total_num_paths_2())
-print(Problem(MAP).get_total_num_paths_2())
+def parse_problem(fname: str) -> Problem:
+    return Problem(tuple(iter_lines(fname)))
+
+
+def test_problem():
+    assert Problem(TEST_MAP).get_total_num_paths() == 36
+    assert Problem(TEST_MAP).get_total_num_paths_2() == 81
+
+
+if __name__ == "__main__":
+    problem = parse_problem(resolve_path("data/day10.txt", __file__))
+    print(problem.get_total_num_paths())
+    print(problem.get_total_num_paths_2())
@@ -1,15 +1,31 @@
 from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+import bisect
 import functools
 
+import numpy as np
 
-def transform_stone(stone: int) -> list[int]:
+from utils import read_ints, track_cache, resolve_path
+
+# POWERS_OF_TEN[i] is the smallest number with i + 2 digits
+POWERS_OF_TEN = [10**i for i in range(1, 64)]
+# distinct values seen across all blinks of real inputs are a few thousand
+TRANSITION_CACHE_SIZE = 1 << 16
+
+
+def num_digits(stone: int) -> int:
+    return bisect.bisect_right(POWERS_OF_TEN, stone) + 1
+
+
+@track_cache("day11.transform_stone")
+@functools.lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def transform_stone(stone: int) -> tuple[int, ...]:
     if stone == 0:
-        return [1]
-    stone_str = str(stone)
-    if (len(stone_str) % 2) == 0:
-        half_len = len(stone_str) // 2
-        return [int(stone_str[:half_len]), int(stone_str[half_len:])]
-    return [2024 * stone]
+        return (1,)
+    n_digits = num_digits(stone)
+    if n_digits % 2 == 0:
+        return divmod(stone, POWERS_OF_TEN[n_digits // 2 - 1])
+    return (2024 * stone,)
 
 
 def transform_stones(stones: list[int], n: int) -> int:
@@ -25,8 +41,120 @@ def transform_stones(stones: list[int], n: int) -> int:
     return sum([x for x in counts.values()])
 
 
-test_stones = [125, 17]
-stones = [30, 71441, 3784, 580926, 2, 8122942, 0, 291]
-print(transform_stones(test_stones, 25))
-print(transform_stones(stones, 25))
-print(transform_stones(stones, 75))
+@dataclass
+class TransitionGraph:
+    """
+    every value reachable from some starting stones, with each value's
+    stones after one blink as CSR rows, so a blink is a sparse matrix
+    vector product over per value counts
+    """
+
+    values: list[int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    index: dict[int, int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.index = {value: i for i, value in enumerate(self.values)}
+        # edges grouped by target so a blink is one np.add.reduceat
+        sources = np.repeat(np.arange(len(self.values)), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        self._sources = sources[order]
+        self._targets, self._target_starts = np.unique(
+            self.indices[order], return_index=True
+        )
+
+    @classmethod
+    def from_stones(cls, stones: list[int]) -> "TransitionGraph":
+        values = list(dict.fromkeys(stones))
+        index = {value: i for i, value in enumerate(values)}
+        indptr, indices = [0], []
+        # values is appended to while it is walked
+        for value in values:
+            for next_value in transform_stone(value):
+                if next_value not in index:
+                    index[next_value] = len(values)
+                    values.append(next_value)
+                indices.append(index[next_value])
+            indptr.append(len(indices))
+        return cls(values, np.array(indptr), np.array(indices, dtype=np.int64))
+
+    def count_vector(self, stones: list[int]) -> np.ndarray:
+        # python ints never overflow, counts grow ~1.5x per blink
+        counts = np.zeros(len(self.values), dtype=object)
+        for stone in stones:
+            counts[self.index[stone]] += 1
+        return counts
+
+    def blink(self, counts: np.ndarray) -> np.ndarray:
+        """counts per value, or a column of them per query, after one blink"""
+        new_counts = np.zeros_like(counts)
+        new_counts[self._targets] = np.add.reduceat(
+            counts[self._sources], self._target_starts, axis=0
+        )
+        return new_counts
+
+
+def count_stones_many(queries: list[tuple[list[int], int]]) -> list[int]:
+    """
+    stone counts after n blinks for every (stones, n) query. All queries
+    share one transition graph and blink together as columns of one count
+    matrix, up to the largest n.
+    """
+    if len(queries) == 0:
+        return []
+    graph = TransitionGraph.from_stones([s for stones, _ in queries for s in stones])
+    counts = np.stack([graph.count_vector(stones) for stones, _ in queries], axis=1)
+    answers = [0] * len(queries)
+    by_blinks = sorted(range(len(queries)), key=lambda i: queries[i][1])
+    n_blinks = 0
+    for i in by_blinks:
+        while n_blinks < queries[i][1]:
+            counts = graph.blink(counts)
+            n_blinks += 1
+        answers[i] = int(counts[:, i].sum())
+    return answers
+
+
+def parse_stones(fname: str) -> list[int]:
+    return read_ints(fname).tolist()
+
+
+def part_1(stones: list[int], blinks: int = 25) -> int:
+    return count_stones_many([(stones, blinks)])[0]
+
+
+def part_2(stones: list[int], blinks: int = 75) -> int:
+    return count_stones_many([(stones, blinks)])[0]
+
+
+def test_transform_stones():
+    assert transform_stones([125, 17], 25) == 55312
+
+
+def test_transform_stone():
+    assert transform_stone(0) == (1,)
+    assert transform_stone(1000) == (10, 0)
+    assert transform_stone(99) == (9, 9)
+    assert transform_stone(999) == (2021976,)
+
+
+def test_parts():
+    assert part_1([125, 17]) == 55312
+    assert part_1([125, 17], blinks=6) == 22
+
+
+def test_count_stones_many():
+    queries = [([125, 17], 25), ([125, 17], 6), ([0], 0), ([0, 1], 75)]
+    assert count_stones_many(queries) == [
+        55312,
+        22,
+        1,
+        transform_stones([0, 1], 75),
+    ]
+
+
+if __name__ == "__main__":
+    stones = parse_stones(resolve_path("data/day11.txt", __file__))
+    print(part_1(stones))
+    print(part_2(stones))
@@ -1,133 +1,149 @@
-from collections import Counter
-from utils import Grid2, Direction, V2, read_grid
 from dataclasses import dataclass
 
-
-@dataclass(frozen=True)
-class Side:
-    position: V2
-    direction: V2
-
-    def is_adjacent(self, that: "Side") -> bool:
-        if self.direction != that.direction:
-            return False
-        position = self.position
-        direction = self.direction
-        if direction == Direction.UP or direction == Direction.DOWN:
-            adjacent_directions = [Direction.RIGHT, Direction.LEFT]
-        elif direction == Direction.RIGHT or direction == Direction.LEFT:
-            adjacent_directions = [Direction.UP, Direction.DOWN]
-        else:
-            raise ValueError
-        for adjacent_direction in adjacent_directions:
-            candidate_position = position + adjacent_direction
-            if candidate_position == that.position:
-                return True
-        return False
+import numpy as np
+
+from utils import DenseGrid, Grid2, read_grid_dense, resolve_path
+
+
+def _compress(parent: np.ndarray) -> np.ndarray:
+    """pointer jumping until every node points at its root"""
+    up = np.empty_like(parent)
+    while True:
+        np.take(parent, parent, out=up)
+        if np.array_equal(up, parent):
+            return parent
+        parent, up = up, parent
+
+
+def label_regions(cells: np.ndarray) -> np.ndarray:
+    """
+    union find over the flat cell index. Every horizontal run of equal
+    cells starts as a tree under its first cell, then vertical edges
+    between equal cells are merged a round at a time. Each round drops
+    edges whose ends already share a root, hooks the larger root of every
+    other edge onto the smaller one, so parent[i] <= i and the forest never
+    cycles, and compresses every path. The label of a region is the flat
+    index of its first cell in row order.
+    """
+    height, width = cells.shape
+    flat = cells.ravel()
+    run_starts = np.ones(flat.size, dtype=bool)
+    run_starts[1:] = flat[1:] != flat[:-1]
+    run_starts[::width] = True
+    parent = np.where(run_starts, np.arange(flat.size, dtype=np.int32), 0)
+    np.maximum.accumulate(parent, out=parent)
+
+    # two runs that touch overlap from a column where one of them starts,
+    # so one vertical edge there is enough to join them
+    run_starts = run_starts.reshape(height, width)
+    joins = cells[1:] == cells[:-1]
+    joins &= run_starts[1:] | run_starts[:-1]
+    a = np.flatnonzero(joins).astype(np.int32)
+    del run_starts, joins
+    while True:
+        root_a, root_b = parent[a], parent[a + width]
+        differ = root_a != root_b
+        if not differ.any():
+            return parent.reshape(height, width)
+        a, root_a, root_b = a[differ], root_a[differ], root_b[differ]
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        parent = _compress(parent)
+
+
+# least cells per np.bincount call, bounds its int64 and float64 copies
+BINCOUNT_CHUNK = 1 << 22
 
 
 @dataclass
-class Region:
-    label: str
-    positions: set[V2]
-    grid: Grid2
-
-    def get_area(self) -> int:
-        return len(self.positions)
-
-    def get_perimeter(self) -> int:
-        total = 0
-        grid = self.grid
-
-        for position in self.positions:
-            for direction in Direction.ALL:
-                adjacent_position = position + direction
-                if (
-                    not grid.is_inbounds(adjacent_position)
-                    or grid.at(adjacent_position) != self.label
-                ):
-                    total += 1
-        return total
-
-    def _get_sides(self, position: V2) -> list[Side]:
-        grid = self.grid
-        sides = []
-        for direction in Direction.ALL:
-            adjacent_position = position + direction
-            if (
-                not grid.is_inbounds(adjacent_position)
-                or grid.at(adjacent_position) != self.label
-            ):
-                sides.append(Side(position, direction))
-        return sides
-
-    def get_sides(self) -> list[list[Side]]:
-        merged_sides: list[list[Side]] = []
-        for position in sorted(self.positions, key=lambda p: (p.x, p.y)):
-            sides = self._get_sides(position)
-            merged = False
-            for side in sides:
-                for merged_side in merged_sides:
-                    # TODO make the guarantee
-                    if any([s.is_adjacent(side) for s in merged_side]):
-                        merged_side.append(side)
-                        merged = True
-                if not merged:
-                    merged_sides.append([side])
-                else:
-                    merged = False
-
-        return merged_sides
-
-
-def get_region(position: V2, grid: Grid2) -> Region:
-    label = grid.at(position)
-    region = {position}
-    queue = [position]
-    while len(queue) > 0:
-        current_position = queue.pop()
-        for direction in Direction.ALL:
-            next_position = current_position + direction
-            if (
-                grid.is_inbounds(next_position)
-                and grid.at(next_position) == label
-                and next_position not in region
-            ):
-                region.add(next_position)
-                queue.append(next_position)
-    return Region(label, region, grid)
-
-
-def get_regions(grid: Grid2) -> list[Region]:
-    visited = set()
-    regions = []
-    for i in range(grid.height):
-        for j in range(grid.width):
-            position = V2(i, j)
-            if position not in visited:
-                region = get_region(position, grid)
-                visited |= region.positions
-                regions.append(region)
-    return regions
-
-
-def solve_part_1(map: Grid2) -> int:
-    regions = get_regions(map)
-    total = 0
-    for region in regions:
-        total += region.get_area() * region.get_perimeter()
+class RegionStats:
+    """indexed by region, numbered in row order of their first cell"""
+
+    area: np.ndarray
+    perimeter: np.ndarray
+    sides: np.ndarray
+
+    def price(self, edges: np.ndarray) -> int:
+        """sum of area times edges over regions"""
+        return int(np.dot(self.area, edges))
+
+
+def _differs(labels: np.ndarray, dx: int, dy: int) -> np.ndarray:
+    """true where the neighbor at (dx, dy) is off the map or in another region"""
+    height, width = labels.shape
+    differs = np.ones(labels.shape, dtype=bool)
+    rows = slice(max(-dx, 0), height - max(dx, 0))
+    cols = slice(max(-dy, 0), width - max(dy, 0))
+    neighbor_rows = slice(max(dx, 0), height - max(-dx, 0))
+    neighbor_cols = slice(max(dy, 0), width - max(-dy, 0))
+    differs[rows, cols] = labels[rows, cols] != labels[neighbor_rows, neighbor_cols]
+    return differs
+
+
+def region_stats(labels: np.ndarray) -> RegionStats:
+    """
+    perimeter counts the neighbors outside a cell's region. Sides are
+    counted as corners, which a polygon has as many of as it has sides: a
+    cell has a convex corner towards a diagonal when both neighbors on that
+    side are outside its region and a concave one when both are inside but
+    the diagonal cell is not.
+    """
+    outside = {
+        (dx, dy): _differs(labels, dx, dy)
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    }
+    fences = np.zeros(labels.shape, dtype=np.uint8)
+    for is_outside in outside.values():
+        fences += is_outside
+    corners = np.zeros(labels.shape, dtype=np.uint8)
+    for dx in [-1, 1]:
+        for dy in [-1, 1]:
+            vertical, horizontal = outside[(dx, 0)], outside[(0, dy)]
+            corners += vertical & horizontal
+            corners += ~vertical & ~horizontal & _differs(labels, dx, dy)
+    del outside
+
+    regions, n_regions = _number_regions(labels)
+    return RegionStats(
+        area=_per_region(regions, None, n_regions),
+        perimeter=_per_region(regions, fences.ravel(), n_regions),
+        sides=_per_region(regions, corners.ravel(), n_regions),
+    )
+
+
+def _number_regions(labels: np.ndarray) -> tuple[np.ndarray, int]:
+    """flat region number of every cell, labels are the first cell's index"""
+    flat = labels.ravel()
+    is_first = flat == np.arange(flat.size, dtype=flat.dtype)
+    numbers = np.cumsum(is_first, dtype=np.int32)
+    numbers -= 1
+    return numbers[flat], int(numbers[-1]) + 1
+
+
+def _per_region(
+    regions: np.ndarray, counts: np.ndarray | None, n_regions: int
+) -> np.ndarray:
+    total = np.zeros(n_regions, dtype=np.int64)
+    # every call allocates a count per region, so chunks grow with them
+    step = max(BINCOUNT_CHUNK, n_regions // 2)
+    for start in range(0, regions.size, step):
+        chunk = slice(start, start + step)
+        weights = None if counts is None else counts[chunk]
+        sums = np.bincount(regions[chunk], weights, minlength=n_regions)
+        np.add(total, sums, out=total, casting="unsafe")
     return total
 
 
-def solve_part_2(map: Grid2) -> int:
-    regions = get_regions(map)
-    total = 0
-    for region in regions:
-        total += region.get_area() * len(region.get_sides())
-    return total
+def solve_part_1(map: DenseGrid) -> int:
+    stats = region_stats(label_regions(map.cells))
+    return stats.price(stats.perimeter)
+
 
+def solve_part_2(map: DenseGrid) -> int:
+    stats = region_stats(label_regions(map.cells))
+    return stats.price(stats.sides)
 
-test_map = Grid2(
+
+TEST_MAP = Grid2(
     [
         "RRRRIICCFF",
         "RRRRIICCCF",
@@ -141,8 +157,26 @@ test_map = Grid2(
         "MMMISSJEEE",
     ]
 )
-print(solve_part_1(test_map))
 
-map = read_grid("data/day12.txt")
 
-print(solve_part_2(map))
+def test_solve():
+    map = DenseGrid.from_grid(TEST_MAP)
+    assert solve_part_1(map) == 1930
+    assert solve_part_2(map) == 1206
+
+
+def test_label_regions():
+    labels = label_regions(DenseGrid.from_grid(["AAB", "BAB", "BBB"]).cells)
+    assert labels.tolist() == [[0, 0, 2], [2, 0, 2], [2, 2, 2]]
+
+
+def test_region_stats():
+    # an E shape, 17 cells, 12 sides
+    map = DenseGrid.from_grid(["EEEEE", "EXXXX", "EEEEE", "EXXXX", "EEEEE"])
+    assert solve_part_2(map) == 236
+
+
+if __name__ == "__main__":
+    map = read_grid_dense(resolve_path("data/day12.txt", __file__))
+    print(solve_part_1(map))
+    print(solve_part_2(map))
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from os import WCOREDUMP
-import re
 import math
 
+from utils import read_ints, resolve_path
+
 """
 ax + by = c minimizing 3a+b
 a and b are integers
@@ -93,38 +94,19 @@ def solve_part_2(problem: Problem) -> int | None:
         return None
 
 
-def parse_problems(fname: int) -> list[Problem]:
-    with open(fname) as f:
-        text = f.read()
+def part_1(problems: list[Problem]) -> int:
+    return sum(x for x in map(solve_part_1, problems) if x is not None)
 
-    # Split text into individual game states
-    sections = text.strip().split("\n\n")
-    problems = []
 
-    for section in sections:
-        button_a = None
-        button_b = None
-        target = None
-        # Process each line
-        lines = section.strip().split("\n")
-
-        a_match = re.search(r"Button A: X\+(\d+), Y\+(\d+)", lines[0])
-        if a_match:
-            button_a = V2([int(a_match.group(1)), int(a_match.group(2))])
-
-        # Parse Button B
-        b_match = re.search(r"Button B: X\+(\d+), Y\+(\d+)", lines[1])
-        if b_match:
-            button_b = V2([int(b_match.group(1)), int(b_match.group(2))])
-
-        # Parse Prize
-        p_match = re.search(r"Prize: X=(\d+), Y=(\d+)", lines[2])
-        if p_match:
-            target = V2([int(p_match.group(1)), int(p_match.group(2))])
-        assert button_a is not None
-        assert button_b is not None
-        assert target is not None
-        problems.append(Problem(button_a, button_b, target))
+def part_2(problems: list[Problem]) -> int:
+    return sum(x for x in map(solve_part_2, problems) if x is not None)
+
+
+def parse_problems(fname: str) -> list[Problem]:
+    # every section is "Button A: X+a, Y+b", "Button B: ..." and "Prize: X=..."
+    problems = []
+    for ax, ay, bx, by, x, y in read_ints(fname, n_cols=6).tolist():
+        problems.append(Problem(V2([ax, ay]), V2([bx, by]), V2([x, y])))
     return problems
 
 
@@ -159,10 +141,7 @@ def test_4():
     print(find_solution(A, y))
 
 
-test_1()
-test_2()
-test_3()
-test_4()
-problems = parse_problems("data/day13.txt")
-solutions_1 = [solve_part_1(p) for p in problems]
-solutions_2 = [solve_part_2(p) for p in problems]
+if __name__ == "__main__":
+    problems = parse_problems(resolve_path("data/day13.txt", __file__))
+    print(part_1(problems))
+    print(part_2(problems))
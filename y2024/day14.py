@@ -1,93 +1,76 @@
-import re
 from dataclasses import dataclass
-from typing import Counter, Tuple
-from utils import V2
 
+import numpy as np
 
-def print_positions(positions: list[V2], max_x: int, max_y: int) -> None:
-    grid = [["." for _ in range(max_y)] for _ in range(max_x)]
-    for position in positions:
-        grid[position.x][position.y] = "*"
-    for line in grid:
-        print(*line)
+from utils import read_ints, resolve_path
 
 
-def calculate_final_position(p0: V2, v: V2, t: int, max_x: int, max_y: int) -> V2:
-    p_final = p0 + (t * v)
+@dataclass
+class Problem:
+    # (n_robots, 2) arrays of x, y
+    positions: np.ndarray
+    velocities: np.ndarray
+    max_x: int
+    max_y: int
+    t: int
 
-    return V2(
-        p_final.x % max_x,
-        p_final.y % max_y,
-    )
+    @property
+    def size(self) -> np.ndarray:
+        return np.array([self.max_x, self.max_y])
 
+    def positions_at(self, t: int | np.ndarray) -> np.ndarray:
+        """
+        positions after t seconds, (n_robots, 2) for a single t and
+        (len(t), n_robots, 2) for an array of them
+        """
+        t = np.asarray(t)[..., np.newaxis, np.newaxis]
+        return (self.positions + t * self.velocities) % self.size
 
-def get_quadrant(p: V2, max_x: int, max_y: int) -> Tuple[int, int] | None:
-    mid_x = max_x // 2
-    mid_y = max_y // 2
 
-    if p.x == mid_x or p.y == mid_y:
-        return None
+def quadrant_counts(positions: np.ndarray, max_x: int, max_y: int) -> np.ndarray:
+    """robots per quadrant, robots on a middle line are in none"""
+    x, y = positions[:, 0], positions[:, 1]
+    mid_x, mid_y = max_x // 2, max_y // 2
+    in_quadrant = (x != mid_x) & (y != mid_y)
+    quadrants = 2 * (x[in_quadrant] > mid_x) + (y[in_quadrant] > mid_y)
+    return np.bincount(quadrants, minlength=4)
 
-    quadrant_x = 0 if p.x < mid_x else 1
-    quadrant_y = 0 if p.y < mid_y else 1
-    return (quadrant_x, quadrant_y)
 
+def part_1(problem: Problem) -> int:
+    positions = problem.positions_at(problem.t)
+    return int(np.prod(quadrant_counts(positions, problem.max_x, problem.max_y)))
 
-@dataclass
-class InitialState:
-    p0: V2
-    v: V2
 
+def most_clustered_time(problem: Problem) -> int:
+    """
+    each axis repeats with its own period, max_x for x and max_y for y, so
+    the frame where the robots cluster has the least variance of x over
+    one x period and of y over one y period. The time with both phases
+    follows from the chinese remainder theorem as the periods are coprime.
+    """
+    t_x, t_y = [
+        int(np.argmin(problem.positions_at(np.arange(period))[:, :, axis].var(axis=1)))
+        for axis, period in enumerate([problem.max_x, problem.max_y])
+    ]
+    inverse = pow(problem.max_x, -1, problem.max_y)
+    return t_x + problem.max_x * ((t_y - t_x) * inverse % problem.max_y)
 
-@dataclass
-class Problem:
-    robot_states: list[InitialState]
-    max_x: int
-    max_y: int
-    t: int
 
+def render(positions: np.ndarray, max_x: int, max_y: int) -> str:
+    grid = np.full((max_y, max_x), ord("."), dtype=np.uint8)
+    grid[positions[:, 1], positions[:, 0]] = ord("*")
+    return "\n".join(row.tobytes().decode() for row in grid)
 
-def part_1(problem: Problem) -> int:
-    quadrants = []
-    for state in problem.robot_states:
-        final_position = calculate_final_position(
-            state.p0,
-            state.v,
-            problem.t,
-            problem.max_x,
-            problem.max_y,
-        )
-        quadrant = get_quadrant(
-            final_position,
-            problem.max_x,
-            problem.max_y,
-        )
-        if quadrant is not None:
-            quadrants.append(quadrant)
-
-    counter = Counter(quadrants)
-    total = 1
-    for v in counter.values():
-        total *= v
-    return total
+
+def part_2(problem: Problem) -> int:
+    return most_clustered_time(problem)
 
 
 def parse_problem(fname: str) -> Problem:
-    def parse_line(line):
-        # Extract all numbers (including negative) using regex
-        numbers = re.findall(r"-?\d+", line)
-        # Convert strings to integers
-        return [int(num) for num in numbers]
-
-    with open(fname) as f:
-        lines = [x.strip() for x in f]
-
-    robot_states = []
-    for line in lines:
-        px, py, vx, vy = parse_line(line)
-        robot_states.append(InitialState(V2(px, py), V2(vx, vy)))
+    robots = read_ints(fname, n_cols=4)
     return Problem(
-        robot_states=robot_states,
+        positions=robots[:, :2],
+        velocities=robots[:, 2:],
         t=100,
         max_x=101,
         max_y=103,
@@ -95,42 +78,68 @@ def parse_problem(fname: str) -> Problem:
 
 
 test_problem = Problem(
-    robot_states=[
-        InitialState(p0=V2(0, 4), v=V2(3, -3)),
-        InitialState(p0=V2(6, 3), v=V2(-1, -3)),
-        InitialState(p0=V2(10, 3), v=V2(-1, 2)),
-        InitialState(p0=V2(2, 0), v=V2(2, -1)),
-        InitialState(p0=V2(0, 0), v=V2(1, 3)),
-        InitialState(p0=V2(3, 0), v=V2(-2, -2)),
-        InitialState(p0=V2(7, 6), v=V2(-1, -3)),
-        InitialState(p0=V2(3, 0), v=V2(-1, -2)),
-        InitialState(p0=V2(9, 3), v=V2(2, 3)),
-        InitialState(p0=V2(7, 3), v=V2(-1, 2)),
-        InitialState(p0=V2(2, 4), v=V2(2, -3)),
-        InitialState(p0=V2(9, 5), v=V2(-3, -3)),
-    ],
+    positions=np.array(
+        [
+            [0, 4],
+            [6, 3],
+            [10, 3],
+            [2, 0],
+            [0, 0],
+            [3, 0],
+            [7, 6],
+            [3, 0],
+            [9, 3],
+            [7, 3],
+            [2, 4],
+            [9, 5],
+        ]
+    ),
+    velocities=np.array(
+        [
+            [3, -3],
+            [-1, -3],
+            [-1, 2],
+            [2, -1],
+            [1, 3],
+            [-2, -2],
+            [-1, -3],
+            [-1, -2],
+            [2, 3],
+            [-1, 2],
+            [2, -3],
+            [-3, -3],
+        ]
+    ),
     max_x=11,
     max_y=7,
     t=100,
 )
 
 
-def part_2(problem: Problem, start_t, end_t: int | None = None):
-    if end_t is None:
-        end_t = start_t + 5
-    for t in range(start_t, end_t, 50):
-        final_positions = [
-            calculate_final_position(
-                x.p0, x.v, max_x=problem.max_x, max_y=problem.max_y, t=t
-            )
-            for x in problem.robot_states
-        ]
-        print(f"iteration {t}")
-        print_positions(final_positions, problem.max_x, problem.max_y)
+def test_part_1():
+    assert part_1(test_problem) == 12
+
+
+def test_positions_at():
+    many = test_problem.positions_at(np.array([0, 5, 100]))
+    assert many.shape == (3, 12, 2)
+    assert (many[2] == test_problem.positions_at(100)).all()
+    assert many[1, 10].tolist() == [1, 3]
+
 
+def test_most_clustered_time():
+    # robots that all sit in a 5x5 box at t=6000 and are spread otherwise
+    rng = np.random.default_rng(0)
+    velocities = rng.integers(-100, 100, size=(300, 2))
+    box = rng.integers(40, 45, size=(300, 2))
+    size = np.array([101, 103])
+    problem = Problem((box - 6000 * velocities) % size, velocities, 101, 103, 100)
+    assert part_2(problem) == 6000
 
-problem = parse_problem("data/day14.txt")
-# print(part_1(test_problem))
-# print(part_1(problem))
 
-part_2(problem, 500, 10000)
+if __name__ == "__main__":
+    problem = parse_problem(resolve_path("data/day14.txt", __file__))
+    print(part_1(problem))
+    t = part_2(problem)
+    print(render(problem.positions_at(t), problem.max_x, problem.max_y))
+    print(t)
@@ -1,170 +1,176 @@
 from dataclasses import dataclass
-from utils import V2, Direction, Grid2, is_inbounds
+from typing import Tuple
 
-DIRECTION_MAP = {
-    ">": Direction.RIGHT,
-    "v": Direction.DOWN,
-    "<": Direction.LEFT,
-    "^": Direction.UP,
-}
+import numpy as np
+
+from utils import read_text, resolve_path
+
+WALL, EMPTY, ROBOT = ord("#"), ord("."), ord("@")
+BOX, BOX_LEFT, BOX_RIGHT = ord("O"), ord("["), ord("]")
+MOVES = "^v<>"
+# every tile is two wide in part 2
+WIDE_TILES = {"#": "##", "O": "[]", ".": "..", "@": "@."}
 
 
 @dataclass
-class Update:
-    p: V2
-    direction: V2
-
-
-def apply_update(update: Update, grid: Grid2) -> bool:
-    """
-    returns true if an update was applied or not
-    """
-    p, direction = update.p, update.direction
-    if not grid.is_inbounds(p):
-        return True
-
-    piece = grid.at(p)
-    if piece == ".":
-        return True
-    elif piece == "#":
-        return False
-    elif piece == "O" or piece == "@":
-        updated = apply_update(Update(p + direction, direction), grid)
-        if updated:
-            grid.update(p + direction, piece)
-            if piece == "@":
-                grid.update(p, ".")
-        return updated
-    else:
-        raise NotImplementedError
-
-
-def find_robot_position(grid: Grid2) -> V2:
-    for i in range(grid.height):
-        for j in range(grid.width):
-            if grid[i][j] == "@":
-                return V2(i, j)
-
-    raise ValueError("robot not found")
-
-
-def apply_robot_instructions(grid: Grid2, robot_directions: list[V2]) -> None:
-    robot_position = find_robot_position(grid)
-    for direction in robot_directions:
-        grid_updated = apply_update(Update(robot_position, direction), grid)
-        if grid_updated:
-            robot_position += direction
-
-
-def calculate_sum_of_box_coordinate_value(grid: Grid2) -> int:
-    total = 0
-    for i in range(grid.height):
-        for j in range(grid.width):
-            if grid[i][j] == "O":
-                total += i * 100 + j
-    return total
+class Warehouse:
+    """row major cells of the map, the robot is a flat index into them"""
+
+    cells: bytearray
+    width: int
+    robot: int
+    # boxes are "[]" pairs instead of "O"
+    wide: bool = False
+
+    @classmethod
+    def from_rows(cls, rows: list[str], wide: bool = False) -> "Warehouse":
+        if wide:
+            rows = ["".join(WIDE_TILES[c] for c in row) for row in rows]
+        cells = bytearray("".join(rows).encode())
+        return cls(cells, len(rows[0]), cells.index(ROBOT), wide)
+
+    def to_rows(self) -> list[str]:
+        text = self.cells.decode()
+        return [text[i : i + self.width] for i in range(0, len(text), self.width)]
+
+    def step(self, move: str) -> int:
+        return {"^": -self.width, "v": self.width, "<": -1, ">": 1}[move]
+
+    def push(self, step: int) -> None:
+        """moves the robot one step if the boxes in front of it can move"""
+        if step in (1, -1) or not self.wide:
+            self._push_chain(step)
+        else:
+            self._push_wide(step)
+
+    def _push_chain(self, step: int) -> None:
+        # a straight line of boxes, shifted as one slice
+        cells, robot = self.cells, self.robot
+        end = robot + step
+        while cells[end] in (BOX, BOX_LEFT, BOX_RIGHT):
+            end += step
+        if cells[end] == WALL:
+            return
+        if step == 1:
+            cells[robot + 1 : end + 1] = cells[robot:end]
+        elif step == -1:
+            cells[end:robot] = cells[end + 1 : robot + 1]
+        else:
+            # only narrow boxes get here, moving the first to the end is enough
+            cells[end] = cells[robot + step]
+            cells[robot + step] = ROBOT
+        cells[robot] = EMPTY
+        self.robot = robot + step
+
+    def _push_wide(self, step: int) -> None:
+        # wide boxes pushed up or down can push two boxes each, the pushed
+        # cells are collected a row at a time until a row is free or walled
+        cells = self.cells
+        layers = [[self.robot]]
+        while True:
+            front = set()
+            for cell in layers[-1]:
+                ahead = cell + step
+                piece = cells[ahead]
+                if piece == WALL:
+                    return
+                if piece == BOX_LEFT:
+                    front.update((ahead, ahead + 1))
+                elif piece == BOX_RIGHT:
+                    front.update((ahead - 1, ahead))
+                elif piece == BOX:
+                    front.add(ahead)
+            if len(front) == 0:
+                break
+            layers.append(list(front))
+        for layer in reversed(layers):
+            for cell in layer:
+                cells[cell + step] = cells[cell]
+                cells[cell] = EMPTY
+        self.robot += step
+
+    def run(self, moves: str) -> None:
+        steps = {move: self.step(move) for move in MOVES}
+        for move in moves:
+            self.push(steps[move])
+
+    def gps_sum(self) -> int:
+        grid = np.frombuffer(self.cells, dtype=np.uint8).reshape(-1, self.width)
+        rows, cols = np.nonzero((grid == BOX) | (grid == BOX_LEFT))
+        return int(100 * rows.sum() + cols.sum())
+
+
+def parse_problem(fname: str) -> Tuple[list[str], str]:
+    grid_str, moves_str = read_text(fname).split("\n\n", 1)
+    return grid_str.split(), "".join(c for c in moves_str if c in MOVES)
+
+
+def part_1(problem: Tuple[list[str], str]) -> int:
+    rows, moves = problem
+    warehouse = Warehouse.from_rows(rows)
+    warehouse.run(moves)
+    return warehouse.gps_sum()
+
+
+def part_2(problem: Tuple[list[str], str]) -> int:
+    rows, moves = problem
+    warehouse = Warehouse.from_rows(rows, wide=True)
+    warehouse.run(moves)
+    return warehouse.gps_sum()
+
+
+TEST_ROWS = [
+    "##########",
+    "#..O..O.O#",
+    "#......O.#",
+    "#.OO..O.O#",
+    "#..O@..O.#",
+    "#O#..O...#",
+    "#O..O..O.#",
+    "#.OO.O.OO#",
+    "#....O...#",
+    "##########",
+]
+TEST_MOVES = "".join(
+    c
+    for c in (
+        "<vv>^<v^>v>^vv^v>v<>v^v<v<^vv<<<^><<><>>v<vvv<>^v^>^<<<><<v<<<v^vv^v>^"
+        "vvv<<^>^v^^><<>>><>^<<><^vv^^<>vvv<>><^^v>^>vv<>v<<<<v<^v>^<^^>>>^<v<v"
+        "><>vv>v^v^<>><>>>><^^>vv>v<^^^>>v^v^<^^>v^^>v^<^v>v<>>v^v^<v>v^^<^^vv<"
+        "<<v<^>>^^^^>>>v^<>vvv^><v<<<>^^^vv^<vvv>^>v<^^^^v<>^>vvvv><>>v^<<^^^^^"
+        "^><^><>>><>^^<<^^v>>><^<v>^<vv>>v>>>^v><>^v><<<<v>>v<v<v>vvv>^<><<>^><"
+        "^>><>^v<><^vvv<^^<><v<<<<<><^v<<<><<<^^<v<^^^><^>>^<v^><<<^>>^v<v^v<v^"
+        ">^>>^v>vv>^<<^v<>><<><<v<<v><>v<^vv<<<>^^v^>^^>>><<^v>>v^v><^^>>^<>vv^"
+        "<><^^>^^^<><vvvvv^v<v<<>^v<v>v<<^><<><<><<<^^<<<^<<>><<><^^^>^^<>^>v<>"
+        "^^>vv<^v^v<vv>^<><v<^v>^^^>>>^^vvv^>vvv<>>>^<^>>>>>^<<^v>^vvv<>^<><<v>"
+        "v^^>>><<^^<>>^v^<v^vv<>v^<<>^<^v^v><^<<<><<^<v><v<>vv>>v><v^<vv<>v^<<^"
+    )
+    if c in MOVES
+)
 
 
 def test_part_1():
-    grid = Grid2(
-        [
-            "##########",
-            "#..O..O.O#",
-            "#......O.#",
-            "#.OO..O.O#",
-            "#..O@..O.#",
-            "#O#..O...#",
-            "#O..O..O.#",
-            "#.OO.O.OO#",
-            "#....O...#",
-            "##########",
-        ]
+    assert part_1((TEST_ROWS, TEST_MOVES)) == 10092
+
+
+def test_part_2():
+    assert part_2((TEST_ROWS, TEST_MOVES)) == 9021
+
+
+def test_push_wide():
+    warehouse = Warehouse.from_rows(
+        ["#######", "#...#.#", "#.....#", "#..OO@#", "#..O..#", "#.....#", "#######"],
+        wide=True,
     )
-    directions = [
-        DIRECTION_MAP[d]
-        for d in "<vv>^<v^>v>^vv^v>v<>v^v<v<^vv<<<^><<><>>v<vvv<>^v^>^<<<><<v<<<v^vv^v>^ vvv<<^>^v^^><<>>><>^<<><^vv^^<>vvv<>><^^v>^>vv<>v<<<<v<^v>^<^^>>>^<v<v ><>vv>v^v^<>><>>>><^^>vv>v<^^^>>v^v^<^^>v^^>v^<^v>v<>>v^v^<v>v^^<^^vv< <<v<^>>^^^^>>>v^<>vvv^><v<<<>^^^vv^<vvv>^>v<^^^^v<>^>vvvv><>>v^<<^^^^^ ^><^><>>><>^^<<^^v>>><^<v>^<vv>>v>>>^v><>^v><<<<v>>v<v<v>vvv>^<><<>^>< ^>><>^v<><^vvv<^^<><v<<<<<><^v<<<><<<^^<v<^^^><^>>^<v^><<<^>>^v<v^v<v^ >^>>^v>vv>^<<^v<>><<><<v<<v><>v<^vv<<<>^^v^>^^>>><<^v>>v^v><^^>>^<>vv^ <><^^>^^^<><vvvvv^v<v<<>^v<v>v<<^><<><<><<<^^<<<^<<>><<><^^^>^^<>^>v<> ^^>vv<^v^v<vv>^<><v<^v>^^^>>>^^vvv^>vvv<>>>^<^>>>>>^<<^v>^vvv<>^<><<v>v^^>>><<^^<>>^v^<v^vv<>v^<<>^<^v^v><^<<<><<^<v><v<>vv>>v><v^<vv<>v^<<^"
-        if d in DIRECTION_MAP.keys()
-    ]
-    apply_robot_instructions(grid, directions)
-    print(calculate_sum_of_box_coordinate_value(grid))
-
-
-test_part_1()
-grid = Grid2(
-    [
-        "##################################################",
-        "#..O.#.O.....O.#..O...O.O.O..O..O...O...O.....OO.#",
-        "#....OO........O........O..OO.O..O...##O.O#O..OOO#",
-        "#..O...O......O.O#...O.#......#O.#......O.....OO.#",
-        "#O.#O....OOOO.OO....O.......O.#.O..O##...O..#..#.#",
-        "#.O..O...OO......OOOO...........#OO.O..##.O.O.#..#",
-        "#.......O.O.OO...#.OOO..O.O..O.OO....O...O.....OO#",
-        "#O...O....O...OO#.....OO.O..O......#..#.O.OO.O...#",
-        "#.O.......O.#.#..#.O.......OO..O.....O#.OO.O...OO#",
-        "#OO.#..#..#...O.....O.O.............OO.OOO.O.....#",
-        "##O........O..........O.O#O..O.......O.O.OO.O....#",
-        "#OO...O.O...OO...OO......O...........#..O.#O.#O..#",
-        "#.O..#..#...O.....O.O.......OOO..O.OO.....O.O.O.O#",
-        "#.O#....O..O..O..#.......O.OO............O..O.#..#",
-        "##O..#...OO..O...O..#.....O....O..O.OO....##..O.O#",
-        "#.O.O...OOO...#OOO.O..O.O..O.....#..OOOO..O..O...#",
-        "##..##O..#.OO.#.....O#..O.O#O.O.O.O.....#..OO..#.#",
-        "#O...O.O.O##..O........O..O..........O...O.O.O.#.#",
-        "#.O..OO.O.#.#.#....OO.........O..O#.OO......#..OO#",
-        "##O..O.....O.OO..O.O.O#O....OOO#...#..O.O.#..OO..#",
-        "#...O...#.......#....#....OOO...##.OO.O..O..O....#",
-        "#OO.OO..##.O.O.OO........O.O..O....O.....OOO##.#.#",
-        "##.....OO...O...OO..OOO....#.O.OO..OO.#.OO.......#",
-        "#O...#.O#..#.O..O...O..O..O........OO#..O.O.O....#",
-        "#..#....O.#...........O.@........#....O...OO.O.O.#",
-        "#.O#.........#.O.....OO..O..O.O....OO#..#.O..O...#",
-        "##.#O.O..O...O.....##O....O..#..OO..O.#.....O....#",
-        "#...#...#O..O.O.OO......O.OO.#OO...O..##O.....#O.#",
-        "#...........OO...O.O.#O.O.O..OOO#.##..O..O.#...###",
-        "#OO.O.O.....O...O.........O.#.....O..O.O.....O..##",
-        "#.O#OO#....O....O.#.OO.....O.O...O.#O..OO.......O#",
-        "#...O.O...#....OO....O#.....OO...#.#....#......O.#",
-        "#.....OO.........O.O.....O.O..O...#O.O...#.OO..O##",
-        "#...OO.O.O........#O.O......O.O..OO.....O..O#O..##",
-        "#O.O#.O.OO...OO...#...OO.##..O.OOO.....OO...OO...#",
-        "#........#......OO...O.....O.#...O.........O.O..##",
-        "#....OO...O#O....O#.....OO....O.....#..O##.......#",
-        "#.O........#.O.O......O..#.........#...#...OO..O.#",
-        "#.#...O..#.O.#..#.......OOO..O..O....#OO...O.O##.#",
-        "#...#O.O.......O.#..O.##OOO....#..#O.##.O....OO..#",
-        "#O.O....O.O.....#......O..#...O..#O..OO#.O.....#.#",
-        "#O..O...OO...#...O...O.O.....#...OO.OO....#...O..#",
-        "#.....#........OO..#...O.......OO.O..O.OOO#O.....#",
-        "#.O#...#O...O........O#O..O.O.OO.O..O.#..O.O.OO.##",
-        "##.#..#.....O..OO....O...#.O.....OO....O.#...OOO.#",
-        "#....#O.#.....O....O..O.............O.O.O#.O...OO#",
-        "#.OO.......O..#.O...O......O#.O..O.#.#O.#.#.O.#.O#",
-        "#.......O.O...O..O......O..O.OO.....O...#..O.....#",
-        "#........O#.O.O......O#.O.#..O##OO.O...O...O.....#",
-        "##################################################",
+    warehouse.run("<vv<<^^<<^^")
+    assert warehouse.to_rows()[1:4] == [
+        "##...[].##..##",
+        "##...@.[]...##",
+        "##....[]....##",
     ]
-)
 
-directions = """
-<v^>><vv>>><vvv<vv^^v>><^^vv>>^^^>>v<<v><><>^<<^vv>>>>^^^v>v>^>^><^v^>^^>v<<^<v>v^v<v^<>><^<<v<^^<^vv<^<^>>v><><<<>><>><<^<<^v^^><><<v><<^vv<<>><>^>^^>>>>^^v^^vv^v^>^<><>vv>v<v^<<^>v<><^>^v>^><>>v^<^^>>vv^><v<^v^>>v^>><v<v>^vv><vv<vv<<v><>vv<<^^<>>>>>vv<v>vv>^^<>v>v^v^>v<^<><>>^^><<v>v<>v<>vv^v>vv<>>vv<<<<>v^vv^<>^v^^^^>^>v>>^^v><<>v><<><^><>>v<><v^>^>><^<v<^>v^><^>^<v<^<>^^^v<^v<^^<<vvvv<>^v<>>v<v<^<vvv<<v<vv>><<<<v<v>^>v<<<^>>^><^^><>^^>v^v<^>vv<>><<>vvv>^^<<v>^<^<><^^<^v^>><v>v>v^><v^<<vv^^>vv>v^<>v>^<>^vv<v<>^v<>^^^>>v>^><><>>><>v^><<vvvv^>vv^>>v>v<<<^^^<^><vvv<<vvv<><^<<<^>>v<<<><<v><v<><<^^v^v^v><>v^<v^^<^^^<v<v<<v>>>><v^>^>v<>><^>^<^><^<><v^><vv^v<>v<<v>v<vv>vvv<><<^^^>v<<v^v^^vvv^<^v^>vvvv>^^<<><<<>><<^v<>><vv<>^^^<<>>>v><^v<vv<<^<^^><^<^>v>v^^>^><^^<>^<v<v<<v>>><^>v><<<v<v^v^^v>v^>^<v><vvv<>>^><<v>vv^v^v^>vvv><<>><<^v<<v^^^^><^><<<^v<^vvv><^^<^<v>^^<<^<^><><>>v>>v>vvv<<v^>>>^^v^v<v^^v><^v^<^>><v^<<^^<<v><>^>^<v><>><<<vvv^>^>><<^vvvv<vv^^v<<>v<><^><^>^>vv<>><v<vv<>v<<^<^><>^v<^
-v^^<<v>><^^><^>><v^>><^><>><v>^v^v^v^<<<v<>^<^<^^^<><<>>^<v>>vv<>>^<>^<vvv<v^>><v^<><^^<v><v^<>>^>vv>^<^v>v>^<v><<^^v>v>^^v>v>^>><<<^>>>v^vv^>^vv>^v<>v^<<>>><<^<>^^^<>^<^>^^>><<v^v><v<<>>vv^v<>^<<>><>>^^^<^^v>>^^<v<>v>vv><v^<^<vvvv>^>^<<>>><><^<v^^^^>v>^>><v>>^^<vv>^<<v><^^^^>^v>>vv^>>v>>v<<<>v<>><v<v^^>>^>vv<>><v^><><<>>v^><vvvv^<vv<v<v>^>^^><<v<v^^vv>v^v>v>v>v>><^<vv>v<v^<v^v<v>>^v<^<<<<>><^>>>v>>^>^^vv<><<vvvv>^v>v><v^<<v<>>>v^<<><^>vv^<>v^^^<v<^><^^<><<<<^>>v>>^>>^^^^^v^<<v^v<>^^>^>vv>^>v><vv^^<^^>^<v^<<^vvvvv>^^v>^<^<<v>>><^><vv><>v><^>v^>v^^<>>>>v^<>v^^>^v<vv<v>v>v^><>vvv^v^<^^v<vv<^<<v>>>v>v<v><v<vvv^<<><>><v<<v^<^<^>>v^^<><<<^v<><v>^^>vv<<^><^>v>^>^^v^v<>^^<^v<^v<<<^<<v>>^>vv>^<^><v^^v<^^<<<v<>v><>^^>^<><>^v<v>^v><>v>^>^v>v<<v<^<<>>v^<<^vv^^^v^><<vvv^^vv>^^^^>>><>v><>v>><^>^<<v<^<^<<^v>^v<^vvvv<v><<<v>><<^>>v^^^<<><^vv>v<^<<^<vv^^^<v^v<^^<^v>^v^^v<^<vv>>><^<v^^<<vvv><<>^>^><><>^v<<<v^>v^^>^<>>^^<^>>>^<>^<^^v^>^v<<vv<^v>><><>v^vvv^v^>><<^vv<^^v>>>>>><>><vv<^vv^vv><v<<><v<<>>>>>^
-^<^v^<<>>><v<v^<>^<v^>vvv^>^<^<>>>>^^^<<<<<<>>><<>>v^>v^v>v^^<v<><^<v^><^>^>v>^>^^>>>^^<>>^<^v^<>v<^v><v<<v<><^>>^v<^^><^>vv><vvv>><<>><<<>vv>>vv^>vv<^v^>>^<v>v^>^<<<v^>v><<v><v^<^^v<<<^<^<v<^<v<v<v<>v>^^v<v^<><v^v^v><^^v><v<>>^><>v^>v>v<><vv^>v^>^v<><vv<>^>>^<v<^>^>v<>>v>^v>^^^v>vvv^>v^^>>><<><<vvv><<v<<>^v<<v^>v<>vv^v<>^<>v>^vv>>v><^^<<vv><><<v>^^^>^vv>>>>><vv>^>^<<>v<^v^<>><v^v^<v>v>>^v<v<<^v<vv>^vv^v^^v<v>vv<>vv^^<vv<><^>>>>>v^<^v^^^>v^vvv<^v<v><>><v<>^^v<^^v<^>>^vv^>v<^<>>^v>>>v^<<v^v^^>v><v<>^^<>vvv><vvv>>><>^>v^<><<v^v^v><<^^v>><>v>><><<<<><<^<<<>><^^v^^vv<<^^><>^v><v>^^^vv<<><<^><><<>v>>^<v^v>v>^^vv^<><v><^v<<<<^<v<v^v<^<>v>^v<<^>>vv>^v<<<>v>vv>v^>vvvv><>v>v><><v^v>v^>>^>^v>^>^<vv<<v^vvv^>vvv^<^>^>>v>^<<>^v<v^<vv^<v<<vv<>>^^<>vv^<vv^<v<^<^<<>v>v>^v<<vv<>v<<^<^>v^>^><vv<<>>^<<^v><<^<v^^^>^^>v^v>^<^^<^<>^<<v>><v<<<<><v^v^>>^>v>v<^v^^^vv^^<vvv^<^<^><vvvvv<<<<v>><v^^<^<><>>^<^v^<v>>vv><<v^><^<<>vv<^><^vv^^v<><^>^^v<^>v>>vv^^v>^<>v^>^v<vv^vv>v>^^v<^<<<>^vv^v<<vv^v<>^^><vvv^<^>^v>^^>
-v>vv>><>v^vv^<<><<><<^><<>>^v^<vvv>>v<><>vv<^v<<^v^v^<>^vv<v^^<><>^<v<<>^<<^<v<^^<>>^v<v<>^v<^>vv<vv^>v^vv<v^<<vv<^>>^<><><<vv<^>>^v^^^<^v>^<<>^<>><^v^^^>>v>vv>v^^v>>>v<>^>v^v^><<^^<>^v>><^^>vvvvv<v>^v>v><v>^<<>^>v>v<v>v<v^><>v<v>^>v<>>^^v>vv>^^<v^^<>^v>^>vv<^^><<vv^v>v^<<<>>>^><^^^^^v<>v^<<^v^>^>>vv^><v<^>vvv<v>>>^v<v><^v<>vvv>v^>^v^>v^<>v>v^>^<v<>>v>>>>^>>v<<v<^>^vv><<>>v^v^^v>^^vv>>v>^>>>vv>^><vv>^v>>v^>><^^^>>^vv<v>>vv<<<v<^>>>^><>vv<>><>v><vv><<^^v<^vv^>vv><<>^>>vv>>^^v^<v<<^<>>v>^<<<><^^<^<v<<<<^<v<^>v><<^^>vvv<><^v>><vv<<>>v<<><<<v>^>>>>>>^<^><^^>^v<v>^v^^^>v<<>^v>^>v<v>^^^><>v<v>vv^^^^vvv<<^<<<^><^><>v<>>>^vv<>v>^>^^>^vv<^v^^<>>^>^v>^v<v^<^vv^vv>>v^><^<vv>>>v^^>^<<>>>^>><>^v<<^^vv><v<<<>>^^<^v^>^><^><v^^<>>>vv>v^v>^<<<>v<^^^<<v<<>>>>^v<v^^<^^vvv><v<^>^v>><vv>^vv>^<^v>^<>^v<^^>^^^vv<>^>>>>><^>^<>^^<><<v<^^>>^>vv<vvv>>>^><<v<^>^<>v^>v>vv^>^>^^>v>>>>^<v>>^<><vv>^<v<>^^<>>v^<^<v><><>v>^^vvv^v>>>vv^><^v><^>vv<vv^<^<vv^<>>vv><^^><vv<vv<vv<>v>v^>^v<<><>^vv>v><>^^v^^<>^v^>>^^<v<<^v^>>^
-><>^^v^>v><^<^v^<v>^v><<^<<<v>^^v><^<<vv^v<<<>v<^^<^>>><^v>v<vv^vv<>^><>vv>><><^^^><vv>v^>>vvv^^>v<v^<><vv^<>>><v<>v>>>^v^^<>^>><v^v^><v<<v<<v^^>>^<<<^^vv^^<><<>v><^>>v^^>^<<>>^v>v^>><<v^<^^<v<><vv>v<<v^vv>^<vv<<>>>>><v^^<<<v>>v><v<v<^>>^^^^v^>^^vvv>^>><<>^<<^v^<>><><>v<v^^>><^^<v<v^^<<>v>><^^>v>>vvv<><^v^^><<^<v<^v>v^v>^v^>>><^<^>v<<<^vv>v<^<^^<>v<v^vv<>>^>>v^^v<v>v<>><>><^<><v^><v<><>>v^v^<<v><v^<^>v^<^v<v<v>v>>^<^^vv>^<^^^v<><<^^v<<<^^^v>>><^vvv^v>>^>^^^<^^><^<^^vv><v^<<>^vvv<v^><v>v^>v<^^^>^>><v^v^^vvvv>^v<v>>^>>^^^>v>vv^<^^v<^><><><^^vvvv<>vv<^>>>^<v<>><><v>>>>>><>><vv^><^>>>^^>^^^><^>vv<v>vv^^<v>v^<<><^v>v<<v^<>^<<^<<>>^<^v>v>^^v<^<vv^vv><><<^>^^^^v^<v>>v^v><>><v<^^^^><>^^v><v^vvv<<>^>>><v^><vv>vv><^<>^<^>^>vv^<v<<^>>^^v>v<<>v^^><>>v>^^^>^^^v<>>^v>v^^vv>v<^vv><^><v<<v<<v<v>v<<>v^<>vv>><<<^><>>v<<>^v>^vv<>>>v<v<^vvv>>^^<^v<^v>^>v^^<<^<<>^>^<v^><>>vv<<^>v>^<^^>^v<^>^^v>>><<v<>^vv>>v>v>v>^<>^>^v<^^v<^>^v<<<><^<v<^^<v>^v^^v>^^<v<v<^^<v<<vv<>v>^vv>vv^v<>v>^>>^>^>>><<><v<v>>v<>v^<vv<>v
->>^>vv<vvv^<vv<<^^v>^<>v<v<^<<>^>v>^<<<^^<<<^^>^>><^^v<<<^<^<>><^v^<>^v^<>^^<^>><<^<<<<<><^>v>><<^<^<v<^><<>vv><<>>><v<vv^>v^<>v><>vv^v>><<v^^<<>vvv^v>vv<<<>^<<<<<>vv<v^^>^>v><v><>>v^v^<>v^>>^><<^<^><^<^<^<>>^^>>^^^>v<<<^<>vvvv>v^^<>v^>>vvv<<^>vv^<^^<v>>>^v^v^v^^v^v^>>^<>^>><>>>v<^>>>^>>><v^v<^v<vv><<^>>v^v<>^<>>^^><v^>vv<v^vv>v^^<<^><^>>^^<^v><v^v<>v><^<v^^^^^vv>>v^>>>>>^vv<^vvvv>>>^^v>^<>^v^^>^<<>^v>>>^>>v>^^v<^^>^^><^v>>^^>^>^^<^<><^<<^>>^>^^>v><^>vv^vv^><<^<^>v>^v<>v^^<<<<v^^^<>^^<>^^^>^v<<<vvv>><vv<>v^^<<^^><><vv^>><^v>><^<^><>vv<<>v^>vv^v<><<^>v>^><^<><v^>v<<v<v^v<v>>^v^>^vv<^^^>^<v><<vv^<v<^v><<v>>>vv<^<<>v>><^>>><<<^>^v<>>v<^v^<<^>><^>vv^>^>><>^^^v^><^vv<v^>vv><^v<>^<<v^v><<^v<<^>><<<v^><<v^>v^>>^>>>v<v<v^^<^^^><>v>^^v<<vv><>v^^^>>^<^>^v^^v<v^^^^>v>>>vv<<^><^><<vv<<v<>>>v>>v>^>>>><^v^^><v<^><<<v>>^^v<vv^v<<<^v^><>v>>v><^^v^<>^><v^>^^>^v>^v>^^v<^<<<<>^v>^><>v>>^^v^vv>>>^<^<v><^v<vv<vv^v<<>v^v<<v><v^<>>v>vvvvvv^v^^v<<>^<v>>v>v>><><<v<><<v^<>^>v^>vv^^v>^v^^^<v^<<<>>v^<vv>^v><^v^^^
-v>^v^>v^v^<^>>^v>v<vv>><<v>>><<>^<^<v<>^v^^>v<^v<>^^<^v>^v<^<^^<<<<<<v><<^>v>vv^v<>><>>>^>^<<>v^<<<>>^^<v<><v<>><^><v<><vvv>v^><^<><>^^<>v^^>v>v>v<>vv>^^<<v^>vv>vvv<<<>>^>^>^v<<><v>^>v>>><^vvvvv<<^^v<>^v^>>>^>v^>vvv^v^v><^<>>><v>>v>v>^v<v>^^>>^v<<vv<>^<^^v^^>>v^>^<<<^<><>^<<v>^v^>>><<v<>>^<vvv^^<^v^^^>v<>>>v<^><^^^^v^<^^^v^^><><v>>>^v<<v<vvv>^>v<>^vvv^^<<><v<^<<>v<>v^<>vv<<^v^^^v^vvv^v>^<<<>v^<^<vv<^<>><^v^<^^^^^vv^v>^<<<^>><<v<v>>^<^^<<>v<^<v>v^v><><<v>>vv<<^<v<^^<v><^<^^>>>>>^vv^<^v<<<v^<v<^>^vv><^v^v<^^<<<v^^vv>^<^<^v^><v<^^>^<>v>>v^^^^<v>v^<>^v^<^^^>>v^^v^<>vv<<vv^<<>v>v<>v^>>><^^>^>>>v^<^v<<<v^>^>vv>^>><<<<<^>v^<<<<<>v<><^^vv>^^<^vv><>^>><>v<<<^v><^>^>>>><>v^v>>>^^<<v>><v>^><^>>>vv^^v>v>^<>>>>^<v>v><^^<v<>^>^<<><<^^v>v>v>^<^><^v<vv<>^v>>^><>^>v>^>v^<v<v>v<>>^^>v^><vv^<^v^v>v<vv^v<<v^<<^>>^<<vv>>v^^^^>v^<>v<<v^^v<^<<<><<v^<>^^^>>^v<>^<><<v^^^^v>^^><^^^<<^^>>v>^v>>^<<>^<^>^><>v<>^>^<^^>^<<<^>>>v^<v>>^v^>v>^vvv>vv<^v>^><<^<^>><<v^><>^>v<<<<^vv>><><>^>><^>v^v<^v>><>vv<vv>v<>v>>^><<>>^
-^>v<<<<<><v<^>v<>vv^>>^<v^^>vv^v<v^>v<>^v^v^^^>v>><v^>><>>^v<<>>v^<<^^>^>^<>>v^<^>v>^^>><>><<>><<<<^>>v<v>><v<>>>>>^<v<<v^<vvv^<<<<><^>v<<vv^<v<<^v<^><^^v^vv<><<<v^^<^<vv>^>><><>v><>v<^v<<^vv<^>><><^>><<<vv^<><v^>><v>v>v^>>v^>vv^^^^v<^vv^>vv>>>v>^<<<<><<>v>vv<^^>vv<>><<^^vvv^^<<^<<<>v>>^<>^<v<^>^^>v<>^^^^^>>^^v^<>^<vv^v<<v<v^^<><v><v^<><<<^^>><v>^^^><<><><v^><>^v<v^v^<v^>v<v>^<<^>^>>>^><>v>^<v<v<vv^<v><<^^^^<^<<v<>><<<v^>^^<^<><<^v^v<v><^>^<>>^<v>^><^<<^<^^^<><<^>^>v^vv>v<v^>^<<^^v><>>>^>>^v<<<^^^^v^^><v^>v>v<v<<v><^>v><v><v^<<<<v^^^v^^vvv^<v<<vv<^v><<v>><^^>v>v>^v>^^<>vvv<^>>><>>>v^>><v>>>><v<<<^^v>^v^><<<v^<>v^>v<>^^^^^<^<<v^^^><vv>>^<><vv^v<><^>^vv^>^<v>^><><>v>>v>^^><^<>v>>><>^v>v<>v>>^^^v><<v^<><>^v^^>^<><^v^v<><<><^<vv<vv>>v^v<>>^<^><vv>v^^^^><<<vv^^>vv<v^><><^^<<>>v^vv^v<vv<^><v>>v>^<<>v^v<>>><>vv<^<<><<<>v<><^<<<^>^<^<v^<^v>^^<<vv^>>>^v<>>><^><<^^>>v^vv<^v<v>vv<>>v<<^v<^v^v^^>v^^^<<^<<<^v>>v><<v^<>>v<v<v^>v>>v<<^v^>v<>><^^v><^^>^><vv<^^v>^><v^>^<>><<v<<>><>v^v^^v>>v>v^<v^^^v<<>
-^<<v^>^v<>v>>^^^<v<>>^><^^>>>>v><v>>>^v<^v<<vv><^>^<vvv<vv^<^^v<v^>><>>^<^^^>v^<^^>vv^<>^<<v<v^^>>^>>><^<><^<^<><>>><<<<>^><vv^>>v<>^<>>vv><^>vv<<^><vv>>v^>^v^v<v<>>><^v>v><v^<>>^^><<^>>^^><v<>v^<vv>^^<>>vv^<v<>>v>vv^v<<^>vv^^vv^<><^<<>><><<vv^v<^^vv^>^>v<^^>>vv^^>vv<v<^vv^<>v<><v^<<>v>v^>v<^v^vv^v<v>vv<>vvv>>^<^>v<><>vvv>v><^>v<>^<^^v^v>^>v>^^>>v>^<^>^^v>>^>v<>^v<v<<>^^v<^>^v>>^vvv>^^vv<<v>v>>^v^v>^v<vv<v<<><^><^<v^<^vv<v>v><vv<<><v>vv<^<^<><^v><^^^vv<>^v>>^>>^^v^vv>>^^>^>vv^<v^>v>>v><^vv>v><>>>^^>>^v><<v<><<vv^^>>^v><>vvv<v>vv^^v>v^<vv>vv^>>v^^>>^<<<<v<^^^<v^v><^<>vv>^^<v><><^v<>v><>><vv<v>^^<^>v^>v<vvv>^^<<>>v<v^<^vv<<v^>><<v>^^^v<<^v<^^<^^v^<>v>v^v<^^<<v>v^v<>^<><>^>><^^>^<vvv<^<<^<>vv^v>><<<^^v^v^<>^^>><<<>>vv^<<v<^>^<^><<>v^^>vv<vv^<v<^>v>v^^^^>^vv><>>>><<^>>^v<<><^^v^>><>>^vv>>vv<v>^<vv<>^^^<<>vv^^><v^><^>v<vvv^^>><>>^>v<vv>v^<^>v<^<>>^^>v^>v^vvv<>vv<v<^<>^>>v<<><<v<<v^>><^^<^v<<^vv^<vv>><<>v<vv^<<^vv^>^^v<>>^^>v^>v>v<^>v<v^^vv<>>v>^^><><<>v<v><v^v>v<>v<v>^<v>^vvv>^<vv<<><<<<>^^
-vv<^<<><>>v^><<v<<^<>^>^>><<^v<>^v>><>vv^>^^>>v<^^>>^<^><^v>>>v^^^>v<<<>>><><>^v<<>>^^vv>^<v^^<^v<<^>v>v<v<<<>^>^^v^>>v<v><^>^>^^<v^vv^vv^v>>^v>><v>^><>>^<>>v><>v><<>^^>^>vv<^v^v<<v<^>v<<^^<<<>>v>>^>^>>vvv^vv>vv^<^v<vvv<>^>>^^^vvv><>v^<<>vv>v>^<v^^>v^v>v<^^v^^>v>^<>v><<<vv^<>>^v>>v<<<^^<v>>^<^>v>^<<<v>^^^><>><^><^>v^<^^<^>^>><<^^<>^<>^v><>><^^>v>^>^<^<^v<<vv>^>>^^<<v><>^^vv^>^^v^<>v^^>>v^>^^v^>><v><>>v<>^>>^>^^<v<<>><^>><<v<^>v<vv><<<vv>v^v<vv>><>vvv><vvv^v^v^<^<^<^<^<^<><^><^>>>>>>v<^^<<<^v>v^v<v^><^<v^^v^v^><v^^v^^v>>v<<>^v<v<v<^^<v^>^^><^^>vv>^>^>v^<<<^v>><v<>>>^>^>^^^v^<>v>^<<^<<^>v^>^^><v>^v><v>v><^>>v>^vv^^^<v>>><^^>^>>>v<v><v^v<^v^<^v^<<>^^v><^<<>v<>><<>^v<v>^^<^v><v<^vv^^><^^<>^>>^v^^>^^<>vv<><^>><<vv>^^<^>^<v^v^vv<vv>>>>v>>vv<v<v<><^v<^v^>^>>>><<vvv><vv^>^>v<vv^^>v>><<>>>^v>v<v<>^<v<^>>^<>vv<<><v^v^<><^^v^>v<^<><>v<v<>^v<^^v<^vv^>vvvv>v>>>v<>v>v>^>>^<<><<>>^vv^>^^<^v>v^><<vv<<>^v^>^v<v<^<<>vvvv<<vvv>^>v^v^^>>v<^>><v^><vv<^<vv>^>vv>^>><v^<^^^<v<>v<<><^><<^<^<>^>>v<v^<<<v><><<<<
->^^<v<>^v<v^^>^^^vv>^>>^><v<vv^^v<v>vv^^^><v^^>>v<<vv^^>v<vv^^><^^^^<^vv^>^<vvvv>>>><<>v<>v><vv<<<<>^<<<^vvvv^vvv>^<^v<>>^v><<^>>v<^vv<^vv>^^^>^^<v><><>vv><^<^>v^>^^vvv^<>>vvv>>^<<^>v<<^^<>>><<v<vv<v^><v<vv^v^v^v<v^>^>^>^^><>>vv^v^<v><v>vv<vv<<<<>>>v^^>>^<v<^v<>>v^<^<<>^^>>><vvv><^<^^<^><v<<<vv>^><<>^<^<vv<><^<<><>^<v^^^<>><^<<v<v<<<<><<<^v<<^>>v^v<<<<<^>^v>><<^^<>vvv><>^><^v^^>vv>v^<<>^v^>>v>v>^v>>^v<vv><<^^<>v>^^^>>><<<<><>^^v>vvv^<>>>^v>^^>>^vv<vvv^^>^>v^<<^^<>^<^vv^^v<v>>^>^>v^^^^vv^^<>>v><>>^<^vvv<v^<v>v<>^v>^>^^v<^>>>>v><<^^v<<v><^>v^<<<^v>v<>vv^v<<>v>>v<>>>>v>^v^^^<^>^><v>^<<v><><vv<^<<<^v<^<v^<^^>^>><v<^^>v><<<>vvv<^><v^v^^v><<<<>^^<v<^>^vvv^<^<<^v<^<<^<<v>v<v^^^v><><^><>v^^vvv<vv<vv^v^>>^><vv><vv<v>^<<v>^<^^^^vvv^^><>v<^vv><^<v^>v^<v><>>>v<<^>^<^<<<vv<<><v>>>v>^><v>v>v>vv>^<<<^^>>>v<^v<v>^><v><<^v^^^vv<>^<v><^>^^><^v><><v>>^>>v<^v>>><><^>><<v^<^>><<<<<^><<<v<v><v>^v>v<v^v>v^<^>^vv^<^v><v>><>v>^v>^<<<>v>^^<v<<>v<^<^^^^^v>^^^>vv^v><>vvv><^vv<<^vv^<<>>^><^^>^^v<^<<^>>>vv<^v^<v^^<
->>>^^v^v^v<<^>v^v^v<><<<<<v^>>vv^<<^v<v<>>v^v^<>^>>>^><^<>^vvv<>>>v^^^<v>v<<v>>v<<<v<><vv>^v<^><^^<vv><v<<^^><<v>>^v^^^v>^<>>>>^^^^>v<v^<<<<v>v^v<><v><>v^v<vv>>^>v>^><>v^><^^>^<>vvvvvv<>v^^^>v>^^v>>vv<>v^^vv><>>>>><<<^<v^<vvv<vvv<>^<v<>^<<v^^^^>^^>><v<v<<<>^^><v<vv^v>v^v<^vv^<<^^^<vv<^><>>v^^v^v^v>vvv^v^vv>><^v<^v<v<>^<>^<<>v>v^vv<vv<v<v^>><><<><<<>v><^<vv>vv^^<^vvvvv^<v>^>^>^v>vv><<^v<>><v^v^v>v><>v^>>>v^>><<v^vv>^v^<^v^>><v<><v<vv^vvv><^^<v><v><^<<vv<^<v<vvv<<vvv^<v^>>>^><v>v><^^^<^<>>^>v>v<v<<<vvv^^^<v<^><<>^<^<>>^v<vv>^>><v<^^>vv^^^^v>v^v^^<>><<<>>^vvv^v^v>>v<v<<>v<v<<<v><^^vv^v<<><^^<<<>^<^v^<<v>v<^>>v<^v>v><^>>><>^>>^vvv<<<<^>v^vvv<<<<<>>>^<^>^^^^v>^>>^>v^v^><<<^<>^>><>><^^v>v^v<v<>v^<^<^<<<v>>^^vv<<>vv>v<><>><><><>vv<>v^^>>vv<<^>^v^><<<<^^<^<v><>^>>><<>^^>v^>^v^>>^>^v^v><>v>^<v^^<>vv^^<v^v<^v<v<<^vv^^<v^<<^<<>v>vvv^><>v^>v>vv><<<v^v<<^v><^^^<>^><^>^^>v<v^>><>>>v>vvv>><><vvv>^^^v<><^v<<v>v^^>^v^^<<v^><<>vv^v<^>vv<>>^^^v<^vv<v<^<><>v>>^<><v>>^<>><<>><^>><>>v<<<>><><<>v>^<>^<<>>^^v
-^^>v<^><^v>>><<<<^>>^^^<vv<>><v>^<^^v^^^v>^v<<v>^^^v<^>>^>>^^v>^<^v<>v^<>><>><>>>^>^^>v^><>^v<>^^<<v><<<^<>v<vvv>><>>v^vv<^vv^^<v>v^^^>^>>^v><v^<v<v^v<v><^v<v<^<^<<>><<v>^<v><<v^<^>><^v^<<>^>v>^^<<^>v^<>>^v^<>v>v<<^><v^<>^^^v><^^v^v>^^>v>>v<^<v><v^v^v>^^vv<v>><>v<>^^>><^v<v^>>vv>^v<^<v<vv>^^^>^v>v>v<<<vv<v>>vv<>vvv<^v^<>>^>^<>^>><<^vv<^<^^v>v^>>><<>vv>^>^^^>^>^>v^>^<v<v><vv^^>><vv<^<v<>v^v<<^^<^>>v>v<^>v>^<v<<v><v>>v>>v^^>^>><v<>vv<vv>^<<<v^>>^>v><>^v>^<<v^v>><^>vv^^^vv><^v<<^>>v^><>v^^^<v^<^<<>>v>^^>^v><v>vv^<<^<>>>v^<^^>^^<^v^>^<<v<^^<<<>v<><vv>^^><v><>>>>><^>>^><<^>><><<vv^^^>>>>^><v>>>v<>v^^<^^<<^^^vv^v<v^^^v^<^<v<<<^v^><<v>>^<^>^<v>>v>^^><^v<>vvv<>vv^vvv<>v>v<v^<^<v<><>v<<v^v<v^><vv<<vv^<v<<<vv<v<<<^v^^^>v>v>>v^^^^>^^v<>>v<v^^>^v><<>v>^^vv^<vv<^^><>^>vvv^^vv^^<v<<>^v>v>v>v<>><>^^>><^<^<v<^>^<<^v<vv^vvv>>>><>>^^<^v>>^><>vv^<<^>^^>^vv^^>>><<<^v<^<>v<<^^v^<^vv>v<^<<<^>><>^^^>^<^v>><^v^^>^v<v<^<>^><><^<<<>^<>vv^^<>><^>>>>^>>^vv^<<^>^>v<^v^v^v<^^<^^>vv<v^^^v>>>>^>^><><>>><>><><v^>v^^><
-v<<^^^v^<>^><^>^^<>^v>^^^v<v<><>vv^^>v^^><<>vvv>>^<><>v^v<^v<v^<>v^>^<vvvv>v>^v<^>^^v<v^<^>>>><vv^^^<>>v>^<vv^>^>^><vvv<>>v^v^>><>>>^v<>^v^>>v^>v><^v^<><v<<v^<^><^v>v^<><>>v<<>vv>>vv>^^^<>v<v^vv><>vv<<>^>>^<>>v<>^>^<>><^^>v<>^v^v>^>^^>><v^<<<<^^v<<v<v<vv<v^v><>>v><>^vvvv<>v^vvv<<v<<<v<<v<v><^^>^<>^v>>>>^<>><<v<v<^<^>^<<<><vv<>vv<>v>v^><v^^>vvvv^><v^^^^>>>^<<>^<<^><^<^<^>><^^vv><v^<v>><>>>v<>><><^<<<>^<^^<<<v^><v>>^<>^>v<v<^>v<<<<v^>^^v<>>^<<><^vv><<^v>v^v^v^v^^v<<v^vvv^>v<^v^^vv^<<<vv>><v^<v<vvv^^^v<v>>>>v^v>^>>>>vv><>vv^>^^^vvvv>>>v<>>^><v>vv<<<>>><v>><>>>v>>v>>^>vv>^>v<^^<>vv<>v>>><<>>>^>v>>^<v^^>>vvvv<><v<v<^<v<>^^>vv<<^v^><v>v<<^<<<>^>^>vv^>v^v^<v>><><>v<>^^>v>vv^v^v>>^v^>^^>v^v^<<<^><^<^>^><v>v<>v>v>^^<^vvvv^<^^<<v^<><>^>^>v<^^vv<vvv>^v<v>v><^v^^><<^v^^^>vv>><><v<^vv^^>^<<>vvv<>v<>^^<^<vv^<v<v<v^v<v<>v^v>^<>^<^>vv>v^^v^>^>>>^>^>>vvv><<><^<^v><><>v^<^^^><v^>^^<<>^^vvvv^v<<<v^>v><>>v<>^^>^vv><<^^^^<<<<>^vvv^^^v^^^vv>>^>>^<^^<><^>v><^v<<vv<v<vv^^<<>^v<^<^vv^<><^^<<<v^>>v^v<>^v<v^^^^>
->^^<^v^>^^v<><vvvv>>^<^>^^v<^v<^>vv<<^><<^vvv^<<v<v^>^v^>^^<v^>^>>^v<v>^<<><<<<<>>vv<vv^>><>^<<^<v>^^<<>v>><v><v>>><>vv>v<<^vv<>v>v^<v^v>>v>vv<^><vvv>><vv<^v>>>><<^<^^<<>^>>^<<v^<><v<v^^>>><^<v<^<<v<><v<v<><v^>>^v<<<^<vv^^^>^>v<>^<^v>^^v<vv^<<<^<^v>^<>^<vv^vv<>^^^>^>>><v^>v<^>v<v^<^vv><^<^>><v<^>><^^>><>>>^>>v<><>v^><>v<>>v^<v>><>v<^vv^^v<^>>>v>v<<vv><>>^<>v><v>v><>^><^<vvv><^>>v>>^vv^>v>^^^<>>>v^<^^^<<>>^^v^^^<>vv^>^><>><>><>v>^^>vv<vv>>v>>^>>><<>v>>v^<vvv>v<vvv>>><vv<^vv>><vvvv<^<>>^vv<vv>>v^v>^^^<>>><^v<^^<<v<v<<v>v<>vv>^v>^<v>>^<^<^v><v>>^^>v<<vv<<<v<v<<>>>^v^^v<vv^>v<>^>v<>><>v<><<<v^^<>^^<v^^^vv^^<>><<<>^v<^>><v<v^<<^><>^<<v^<^v^v^v^<>^v^v^<>><v>^<v>^<vvv>^<>>^>v<vvv<><v^<v>vv>^^>><^<<<><<><><<<v<>><>^>v<>v^^^<^>>^>^><vv>>>>v><v>^>^<vv^<><^^<>v^vv<<<v^^v^<v>><v^^<<^>vv>v>v<^<^>^vv^>>vv^^<^^vv<>vv<><>>><><^><>>^vv<<<^><^<^<^v<^<vv>^^<>^<v>>^><^>^><<<<>v^>^^^v>^v>^v>>^<^>>v<<<><<><>^>^^^^^^<<v<>^><v^^v^^^<v^v<>^v>vv^^<v>v>^^^^v<<^<>^^^>v<^>>v^>><>>><<>^vv<<>^^v^^^^><^v^^vvv<^<<^^<>
-^^<><v^<^^<v<<v<<<<>v>>^^<>v>>^>v^>^^>vv^><^vv<><^v<vv>v<>^<>v<vv>^>>v<<>>v>v<>v>><<v^<^>v^>>v>v>^>vv>^<>v>^v^v><>v><>^^>^>^^<<>>^<>>>v<^^vv><>v<<><^>><<^^^^<<vv<>>><<>vv<><<vv^<><vv<^v<v<^v^vv<v^><^>v<>v^^<v>>vv<><v^vv^<<>^<<vv^>v<>>v<<^<>vv^vv<<>^v<v>^v<^<<><^>v>>>><><vvv<>><>^<v>v^vv^<<<^<><v>vv^>^vvv>vv><<<^^^<>^^<<^<^<><v>^<<>^^<<v<v><<^v^<<>><<v<vv>v^<^v^^<^^>^<>v^>vvv<v<><<vvv^^>^<>v>^^v><<v><vv>v><vvvv<<>^v^^<v^v<^><>><^>>^><^vv><>vvvv>v^vv<^>v><<<^vv>^>^v>^^v^^>vv^^v^v<^^<>><v^<^^v<<>^><<v^>vvv<^<v<v^<>><<^^^>>v><v<^>v^<>^v<v<>^>><^^>>^<<<vv>^^^<^<><^v<<<^<>vv<<<^v<^^^^<<^^v<^vv^v>><<<^^>>>vv^vv>>^v^^^^^<<><<v<vv^><^v><><^>^<vvv^>^^><>>>v><^^v>>^^^v<<v<>><<v^>^^^^>v^<^>>^vv>>v^<<^<^>^v><vvv>><<<><v<<<v><^^><<>>v><^v^vv<v^>^<<^<^v>^<><v<<^vv^v>>><vvv><v<><v<<^^^<>v^>v^v<v>>^>^^v>^<>>^^>vv^^^<>^>^vvv^>vv<><<^>v><><<^<v<<<^^v<<>>>><v^^<><^>>><<^>>^>^>>^^v^v^v>^^<^<<<<>v>>v^v<><>^><>>>>v<><<><>vv^><^>>>v^<v^^>vv<v^^v^v>^vv^^v<<^^^^>><><^>^>^>>^^><>v^^v>^>v>>>>v<v<v^^><^>^><^v^<><v
-^^^>>>v>v<>>^v>v<<^>^>^vv<<>v<v<>v>^^^<><^<<<<v><^^^<<<v^^>^v>^<>v<^<v<^>v>^<vv^>v<^><v<v>v<<^<>^^<<v>v^^vv<^v>^^><v><>v<<^>><v^>vv<^><<<v>^^v>^<<^<<v^^v><>>^^^>^>>^><v^<>v>^vv^v<><<>>><<v><><>^<<<>^<v<^>v<v^<<^^^v^vv>v><^vv>v<^>v><^v>>^^^^^^>^>^^<<^<^<^^><vv^>v^<v>>v>^<>^v>>^^vv>>v<v<v>>>v>v>v<^^>>>^^v^>v<>^<vvvv><v>v<v<>^<v<<>^>>^<v^^<><>>^<>v^^v<<^>>^>^>vv>><^>^^v^<vv>>v^v<>v><><^vv>>^^^vv<><^^>^^>vv<>^v>><v<vv>^<v^<^^>^<<^^^<^><^^^><v<vv>vv^^vv^^^>^<v^v<^^^v<^<^v>>><>^>><<v<>><><v^^<>^>^>v>^>><>>v<^<>^v<^v>><<^v<vvv<>>>><^v^v^<<vv>>^<v^>^vv<<<^v<v>v>v^v^^vv<v<^v<>v<<^>><v>v>v<^v><^<><^><v>^>^v<>>^<v<><v^v^^v>>vv^^^^<><^vvv^v<<^v<^v>v<vv^v<<^v>^v^^>^>^<^^^v^v<^v><<<^vv^>>^v<^v<<<^<^v^<^vv<^v^^v>v<<<v<<<v>><v^^><^v^<<vvv>>^><<>^>v<>v<v<><^>>>><v<>vv^>vvv<v<^<<>^<<v^v<<<v^vv^<vvv>><v<<^>>v^>v^^^^v<^^^^^>v<<^<>><<vv><^^^<v^^<>vv>v><<<>><>vv<v<v<><v<>vv^<<<^<>v^>>>v<<v<<v^v<^vv>^^<v<^<<>v<<<<^<v<>^<>v><^^<>v^>><^^>>^<v^^><^v>>v<^^^><<vvvv^^^<v^>^>^^v<vv^^<^^<<vv>v>^v<v<<v^^v^^>^v^><v>^<
-^<^^<<v<>v<v<<<>v^^^^<>><vv<>vvvvv<^<^<>vv<^v>^>>^v^>>^>><>^^^>^v<<>><^^^>v^>>v<^^v>^>^vv<<vvv^<^^v>v<v>>v^v^<v>>>vv<vv^>^<^<v<>^^v<<vv>v<<v<^^<<>v^v<>v>><^<v<v^>>>><v<<<>vv>^<<><<^<v<v^^^^^<^>>><v><>v>v^^^v<^^vv>>>vv>vv<^>vv>>vv^^>v<<<v^vv>>^^<^>^>vv<v>^v<^>^v>^<vv>>^>>v<^>v<v^>vv<^^^>^^>>v>^<>v>^>v>vv^>>^^<>>v^^^<><v^<vv<><>^<<<<<>>v^v<^<>v^<>^v<v^v>vv<>>^<^<^>v^<^<v^vv>>><v<><><v>>v^<^<<^>v^v>v>>^v><v<^v<^<<^^^<>^<v^^<v^^v><<v<^><v<<v<<<<^^^^>v^^vvv><^^vv^v<<<<>vv<<vvv>v^<<>>v^>vv<>v<><>>>v^<v>>^^^>^v^>v><^><<vv^<>>^<>vv^^>vv>^<^<>vv<<v^>^vv<v<><<v^vv>>>v>^<<>v>><>vv><^vv^>vvv^<^v^vv<^^v^^v<>>^^<<>^<>^<<<v^>^>>>>vvv^>^<<v<>>^>v<><>v^>^^>^>><vv>^<^<v>^<><v<><>^^vv^>^^^<>^v>>vv^><v^v^^>^v^^^v>>^^^>>v>^<>>><<<^v<^v>><<>vvv>^vv>v>^v><<vv^^<<^^^<vv^^^<^<>>^v><vv><><v<^v<><<vv>vv^>>^v>^v><><<vvv<<^<<>v>>vv><<<><<><<^<<vv<vvv<<<<<^>^vv^v>><><^^<<>^vvvv^>>v<^^><v>v^vv<<>^>^^vv<>v><<v>^^<><^<><vvv<^<^^<>^>>^^<^<vvvvv<>^v><vv^<^><^^^<v^>^<^^^v^v>v^<<>v>>vvvv^vv><v<<v<v<vv><<>vv>^^^vv>>v^v>v<<
-vv^<<^v><<vvv>>>vv<>^<^><>>^^>^<v><<<<<<^<^<>>>v<<<<><vv^^^^v<<>vv^>v<^v>v>vv>v><>v<v<<v<>^^^><v>vv<<>^^>v^<<><^^vvv^^v^>^<<>v^<>^><>^^>>v>v<v<>^v>^^<^<^^^^>v^v<v><<^<><^>^^v>>v>v<<vv>^>><<<v^><>vv^^v^v>^^<<<<^vv^>>>v<vvv^^<>v<^^v^^^<v<>><<>^^>^v<v<v<<<<<>v^<>v<^<vv^^<>>v^<vv><^^<<>v<^v>^^>vv>>^^v^^>v^<>>>vv>^<v>^v<^^<>^^><<>v<>>v<<>^>>>><^>^<<<>^^<^^<v^v<^><v<<<v^v>><<<^<>v<^><<v>>v<>><><^<v><vv^^>>v>vv>><^>v<>v^<^<v<<^^>v<^^^^<<<>^<<><^>>><^<>^>^^<>v<>v<><v>><v<v><v^^^>^^<>^>>v<^<v>^<^v^vv^><v^^>^^>^<vv<<^^v<><v^v^v^<^^vv^>><^<><<^<v<v<^>^>^<v^<>>^^vv><v<<^vvvv<v^>>v^v<^>>^^>vv^v^>><>><<<<<<^<^>v^<<v>v>v^<v^>>^<<>><<v>>^vv<>><>>^^>v>^>^<vv^<^v>>v>^><^<^<<v^>v>^>>v<vv><>^^^v>><v^><^^>^v^^v>^<^>>>v><<<<><^><<<<vv><>vvv<<v^<><^><vv^<><<<^v<vvv^<<>>v<<v<<>><<^v^v<>v^^>^^vv<v^>^^>v><v^<vv<<<><<<v<^><vvv<vv^^vvv<vvv<^>^>^v<<>^v>vv^><<>><v<^>>^<^>vv^v><>^vv<>vv>^<>>^<^><v^v^v><><v><^v>^^><vv<<<^>>v>v^v^<^vv>>>^^>><^^v^>v<^<<<>><v^<^^v<^v<>vvv<>>>v<<vv<<^v>^<v><^>vv<>><<>^<vvvvv^v><^>^v<<><>
-<<>v^^^v<<v<^<<<<<<^vv><>^<>v^><v><v<^<>^vvv<^vv>v^<><^^>v^<v<vv>v^><><<v>>>>><^<vv<v>^>^<<>v><<>>><>>^>v<<>v<<^<^^^<<v^^^<>>v<<<<<v<>^^>^<><<^<v^<>^^<vv>vvv^^v<v>v<v>^<>>^vv^><v<<<<<<v^^v<^v^v^>^^><^^v^<<>>v<^^<^^v^>>^>v<<v<v^<^vvv^<v<>><^v>v><v^<<<^<^vvv^<<v^<>><<>>vv<^<vv^^v<<^><v^v<^^>^vv^^<<>><<><>>v>>vv^>>v^<<v>^v>^^>^^<<^v>>vv<<>>v>>vv<vv^^<>^>^<vv^>v^^><^v<<vv<><<<v<^<^<<><^vv<><>>>>>>^<<>>^>>^^^<v<>><<v><^^^^^>>v<>><><>>><<>><^><^<<^<v^^><v^^^>vv>v><<vv>>^^v^v^><<vv>^^<^>^<<vv><<<v>><<>>><^^v^<>>vv<>><^^^>>^v<^>>>>>v<^v<>^>^<^>^^^v<<^<v>^^^>>vv>>>>v>>^^<>>>^><<><^^^<<>vv^^<>vv^><v^v<>>>v>^v<^v>^<>^<<^^^^v>^^vv>>>>>>^vv<^v^<><>v^><^>><><>><<^v>v<<^v^^<^<^^v^^<>v<^v>v^<v<<><^<><vv^v^^>><<v<v<<v<v>^>v>><^<^^^^v><vv^><<<^^>>>^<vv><<><<^<^<^^>^<^^^>>^^>v><<vv>v<>^>^^^<><>v><<<>^v<>v<>>^^^v<<<<<v^>vv^>>^<^v^<<<^>><v^v^>>^<^^^v<>v>>>vv^<<v<<^vv>^v^^<v<v<>^^^^vv<v<^^^^v<><v>v<>v<<<>>v^v>v<><<>>v^v<><><v<>>v>vvvvvv^^^<<>v<<>^v><<v><<^^^v<<^<>^v<<>^v<^<>vv>vv^vvv>^^>><>^>^^v<<<^v<v^<>^<
-"""
-directions = [DIRECTION_MAP[d] for d in directions if d in DIRECTION_MAP.keys()]
+
+if __name__ == "__main__":
+    problem = parse_problem(resolve_path("data/day15.txt", __file__))
+    print(part_1(problem))
+    print(part_2(problem))
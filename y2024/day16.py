@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 
-from utils import V2, DirectionEnum, Grid, read_grid
-import networkx as nx
-import math
+from utils import V2, DirectionEnum, Grid, SearchResult, read_grid, search, resolve_path
 
 
 @dataclass(frozen=True)
@@ -16,74 +14,72 @@ class Weight:
     MOVE = 1
 
 
-def parse_graph(grid: Grid) -> nx.DiGraph:
-    graph = nx.DiGraph()
-    for i in range(grid.height):
-        for j in range(grid.width):
-            p = V2(i, j)
-            if grid.at(p) != "#":
-                for direction in DirectionEnum:
-                    n = Node(p, direction)
-                    graph.add_node(n)
-                    graph.add_edge(
-                        n, Node(p, direction.clockwise()), weight=Weight.ROTATE
-                    )
-                    graph.add_edge(
-                        n,
-                        Node(p, direction.counter_clockwise()),
-                        weight=Weight.ROTATE,
-                    )
-                    adjacent_position = p + direction.to_v2()
-                    if (
-                        grid.is_inbounds(adjacent_position)
-                        and grid.at(adjacent_position) != "#"
-                    ):
-                        graph.add_edge(
-                            n, Node(adjacent_position, direction), weight=Weight.MOVE
-                        )
-    return graph
-
-
-def heuristic(s: Node, e: Node) -> int:
-    return abs(s.p.x - e.p.x) + abs(s.p.y - e.p.y)
-
-
-def part_1(grid: Grid) -> float:
+def maze_neighbors(grid: Grid):
+    def neighbors(n: Node):
+        yield Node(n.p, n.direction.clockwise()), Weight.ROTATE
+        yield Node(n.p, n.direction.counter_clockwise()), Weight.ROTATE
+        adjacent_position = n.p + n.direction.to_v2()
+        if grid.is_inbounds(adjacent_position) and grid.at(adjacent_position) != "#":
+            yield Node(adjacent_position, n.direction), Weight.MOVE
+
+    return neighbors
+
+
+def reverse_maze_neighbors(grid: Grid):
+    def neighbors(n: Node):
+        yield Node(n.p, n.direction.clockwise()), Weight.ROTATE
+        yield Node(n.p, n.direction.counter_clockwise()), Weight.ROTATE
+        previous_position = n.p - n.direction.to_v2()
+        if grid.is_inbounds(previous_position) and grid.at(previous_position) != "#":
+            yield Node(previous_position, n.direction), Weight.MOVE
+
+    return neighbors
+
+
+def search_maze(grid: Grid, track_preds: bool = False) -> SearchResult[Node]:
     start_p = grid.find("S")[0]
     end_p = grid.find("E")[0]
+    return search(
+        [Node(p=start_p, direction=DirectionEnum.EAST)],
+        maze_neighbors(grid),
+        is_target=lambda n: n.p == end_p,
+        max_weight=Weight.ROTATE,
+        track_preds=track_preds,
+    )
 
-    start_node = Node(p=start_p, direction=DirectionEnum.EAST)
-    graph = parse_graph(grid)
 
-    min_length = math.inf
-    for direction in DirectionEnum:
-        end_node = Node(p=end_p, direction=direction)
-        length = nx.astar_path_length(graph, start_node, end_node, heuristic)
-        min_length = min(min_length, length)
-    return min_length
+def part_1(grid: Grid) -> int:
+    return search_maze(grid).best
 
 
 def run_part_2(grid: Grid) -> int:
-    start_p = grid.find("S")[0]
+    """
+    A state is on an optimal path iff its distance from the start plus its
+    distance to any end state equals the best score. One forward search and
+    one backward search from every end direction give both, so no paths
+    or predecessor lists are kept.
+    """
     end_p = grid.find("E")[0]
+    forward = search_maze(grid)
+    backward = search(
+        [Node(end_p, direction) for direction in DirectionEnum],
+        reverse_maze_neighbors(grid),
+        max_weight=Weight.ROTATE,
+    )
+    best = forward.best
+    backward_dists = backward.dists
+    return len(
+        {
+            n.p
+            for n, dist in forward.dists.items()
+            if dist + backward_dists.get(n, best + 1) == best
+        }
+    )
+
 
-    start_node = Node(p=start_p, direction=DirectionEnum.EAST)
-    graph = parse_graph(grid)
-
-    min_length = math.inf
-    min_paths = []
-    for direction in DirectionEnum:
-        end_node = Node(p=end_p, direction=direction)
-        length = nx.astar_path_length(graph, start_node, end_node, heuristic)
-        if length <= min_length:
-            min_paths = list(
-                nx.all_shortest_paths(graph, start_node, end_node, weight="weight")
-            )
-            min_length = length
-    node_set = set()
-    for path in min_paths:
-        node_set |= set([v.p for v in path])
-    return len(node_set)
+def run_part_2_with_preds(grid: Grid) -> int:
+    result = search_maze(grid, track_preds=True)
+    return len({n.p for n in result.path_states()})
 
 
 def test_grid_1():
@@ -107,6 +103,8 @@ def test_grid_1():
         ]
     )
     assert part_1(grid) == 7036
+    assert run_part_2(grid) == 45
+    assert run_part_2_with_preds(grid) == 45
 
 
 def test_grid_2():
@@ -132,14 +130,15 @@ def test_grid_2():
         ]
     )
     assert part_1(grid) == 11048
+    assert run_part_2(grid) == 64
+    assert run_part_2_with_preds(grid) == 64
 
 
 def run_real_grid():
-    grid = read_grid("data/day16.txt")
+    grid = read_grid(resolve_path("data/day16.txt", __file__))
     print(part_1(grid))
     print(run_part_2(grid))
 
 
-# test_grid_1()
-# test_grid_2()
-run_real_grid()
+if __name__ == "__main__":
+    run_real_grid()
@@ -1,107 +1,202 @@
-from dataclasses import dataclass, field
+from typing import Callable, Tuple
 
+import numpy as np
 
-@dataclass
-class State:
-    instruction_ptr: int = 0
-    registers: list[int] = field(default_factory=lambda: [0, 0, 0])
-    output: list[int] = field(default_factory=list)
+from utils import read_ints, resolve_path
 
+REGISTERS = "abc"
+# shifts by 64 or more are undefined for numpy integers
+MAX_SHIFT = 63
 
-def _get_combo_value(operand: int, state: State) -> int:
+
+def _combo(operand: int) -> str | None:
     if 0 <= operand <= 3:
-        return operand
+        return str(operand)
     elif 4 <= operand <= 6:
-        return state.registers[operand - 4]
-    else:
-        raise ValueError
-
-
-def adv(operand: int, state: State) -> State:
-    numerator = state.registers[0]
-    denominator = 2 ** _get_combo_value(operand, state)
-    state.registers[0] = numerator // denominator
-    return state
-
-
-def bxl(operand: int, state: State) -> State:
-    state.registers[1] = state.registers[1] ^ operand
-    return state
-
-
-def bst(operand: int, state):
-    state.registers[1] = _get_combo_value(operand, state) % 8
-    return state
-
-
-def jnz(operand, state):
-    if state.registers[0] != 0:
-        state.instruction_ptr = operand
-    return state
-
-
-def bxc(operand, state):
-    state.registers[1] = state.registers[1] ^ state.registers[2]
-    return state
-
-
-def out(operand, state):
-    state.output.append(_get_combo_value(operand, state) % 8)
-    return state
-
-
-def bdv(operand, state):
-    numerator = state.registers[0]
-    denominator = 2 ** _get_combo_value(operand, state)
-    state.registers[1] = numerator // denominator
-    return state
-
-
-def cdv(operand, state):
-    numerator = state.registers[0]
-    denominator = 2 ** _get_combo_value(operand, state)
-    state.registers[2] = numerator // denominator
-    return state
-
-
-def execute_program(program: list[int], state):
-    ops = [
-        adv,
-        bxl,
-        bst,
-        jnz,
-        bxc,
-        out,
-        bdv,
-        cdv,
+        return REGISTERS[operand - 4]
+    return None
+
+
+def _compile_instruction(opcode: int, operand: int) -> list[str]:
+    """python lines for one instruction, jnz is left to the caller"""
+    combo = _combo(operand)
+    if combo is None and opcode in (0, 2, 5, 6, 7):
+        return [f"raise ValueError('invalid combo operand {operand}')"]
+    # registers never go negative, so // 2**x and % 8 are shifts and masks
+    match opcode:
+        case 0:
+            return [f"a = a >> {combo}"]
+        case 1:
+            return [f"b = b ^ {operand}"]
+        case 2:
+            return [f"b = {combo} & 7"]
+        case 4:
+            return ["b = b ^ c"]
+        case 5:
+            return [f"output.append({combo} & 7)"]
+        case 6:
+            return [f"b = a >> {combo}"]
+        case 7:
+            return [f"c = a >> {combo}"]
+    raise ValueError(f"invalid opcode {opcode}")
+
+
+def compile_program(program: list[int]) -> Callable[[int, int, int], list[int]]:
+    """
+    a python function run(a, b, c) -> output with the registers as locals.
+    Every instruction pointer a jump can land on gets a block that runs
+    straight through to the end of the program, jnz only leaves it when
+    the jump is taken.
+    """
+    lines = ["def run(a, b, c):", "    output = []", "    ip = 0", "    while True:"]
+    for start in range(len(program) - 1):
+        lines.append(f"        {'if' if start == 0 else 'elif'} ip == {start}:")
+        for i in range(start, len(program) - 1, 2):
+            opcode, operand = program[i], program[i + 1]
+            if opcode == 3:
+                lines += [
+                    "            if a:",
+                    f"                ip = {operand}",
+                    "                continue",
+                ]
+            else:
+                lines += [
+                    "            " + line
+                    for line in _compile_instruction(opcode, operand)
+                ]
+        lines.append("            return output")
+    lines += ["        else:", "            return output"]
+    namespace: dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace["run"]
+
+
+def _shift(x: np.ndarray, by: np.ndarray | int) -> np.ndarray:
+    by = np.asarray(by, dtype=np.uint64)
+    return np.where(by > MAX_SHIFT, 0, x >> np.minimum(by, MAX_SHIFT))
+
+
+def run_batch(program: list[int], a: np.ndarray, b: int = 0, c: int = 0) -> np.ndarray:
+    """
+    runs the program for every starting a at once, each lane with its own
+    instruction pointer. Returns (len(a), longest output) outputs padded
+    with -1.
+    """
+    registers = [
+        np.array(a, dtype=np.uint64),
+        np.full(len(a), b, dtype=np.uint64),
+        np.full(len(a), c, dtype=np.uint64),
     ]
-
-    while state.instruction_ptr < len(program):
-        prev_ptr = state.instruction_ptr
-        operation = ops[program[state.instruction_ptr]]
-        operand = program[state.instruction_ptr + 1]
-        state = operation(operand, state)
-        if state.instruction_ptr == prev_ptr:
-            state.instruction_ptr += 2
-    return state
-
-
-# state = execute_program(
-#     [0, 1, 5, 4, 3, 0],
-#     State(registers=[729, 0, 0]),
-# )
-# print(state)
-
-# state = execute_program(
-#     [2, 4, 1, 3, 7, 5, 1, 5, 0, 3, 4, 1, 5, 5, 3, 0],
-#     State(registers=[21539243, 0, 0]),
-# )
-# print(state)
-
-program = [2, 4, 1, 3, 7, 5, 1, 5, 0, 3, 4, 1, 5, 5, 3, 0]
-for i in range(2**20, 2**30):
-    state = State(registers=[i, 0, 0])
-    final_state = execute_program(program, state)
-    if final_state.output == program:
-        print(i)
-        break
+    ip = np.zeros(len(a), dtype=np.int64)
+    output = np.full((len(a), 8), -1, dtype=np.int8)
+    n_output = np.zeros(len(a), dtype=np.int64)
+    while True:
+        running = ip < len(program) - 1
+        if not running.any():
+            return output[:, : max(1, int(n_output.max()))]
+        for start in np.unique(ip[running]).tolist():
+            lanes = np.flatnonzero(ip == start)
+            opcode, operand = program[start], program[start + 1]
+            ra, rb, rc = [r[lanes] for r in registers]
+            if opcode not in (1, 3, 4):
+                if not 0 <= operand <= 6:
+                    raise ValueError(f"invalid combo operand {operand}")
+                combo = (
+                    np.uint64(operand)
+                    if operand <= 3
+                    else registers[operand - 4][lanes]
+                )
+            next_ip = np.full(len(lanes), start + 2)
+            match opcode:
+                case 0:
+                    registers[0][lanes] = _shift(ra, combo)
+                case 1:
+                    registers[1][lanes] = rb ^ np.uint64(operand)
+                case 2:
+                    registers[1][lanes] = combo & np.uint64(7)
+                case 3:
+                    next_ip[ra != 0] = operand
+                case 4:
+                    registers[1][lanes] = rb ^ rc
+                case 5:
+                    if n_output[lanes].max() >= output.shape[1]:
+                        output = np.pad(
+                            output, ((0, 0), (0, output.shape[1])), constant_values=-1
+                        )
+                    output[lanes, n_output[lanes]] = combo & np.uint64(7)
+                    n_output[lanes] += 1
+                case 6:
+                    registers[1][lanes] = _shift(ra, combo)
+                case 7:
+                    registers[2][lanes] = _shift(ra, combo)
+            ip[lanes] = next_ip
+
+
+def find_quine(program: list[int]) -> int | None:
+    """
+    smallest a that makes the program print itself. Like every puzzle input
+    the program has to loop on a >> 3 and print one value per loop that only
+    depends on a's low bits, so a's top octal digit decides the last value.
+    a is grown a digit at a time, keeping every candidate whose output is
+    the matching tail of the program.
+    """
+    candidates = np.zeros(1, dtype=np.uint64)
+    for i in range(len(program) - 1, -1, -1):
+        candidates = (
+            candidates[:, np.newaxis] * 8 + np.arange(8, dtype=np.uint64)
+        ).ravel()
+        tail = program[i:]
+        output = run_batch(program, candidates)
+        if output.shape[1] < len(tail):
+            return None
+        matches = (output[:, : len(tail)] == tail).all(axis=1)
+        if output.shape[1] > len(tail):
+            matches &= output[:, len(tail)] == -1
+        candidates = candidates[matches]
+        if len(candidates) == 0:
+            return None
+    run = compile_program(program)
+    for a in sorted(candidates.tolist()):
+        if a > 0 and run(a, 0, 0) == program:
+            return a
+    return None
+
+
+def parse_problem(fname: str) -> Tuple[list[int], list[int]]:
+    a, b, c, *program = read_ints(fname).tolist()
+    return program, [a, b, c]
+
+
+def part_1(problem: Tuple[list[int], list[int]]) -> str:
+    program, registers = problem
+    return ",".join(str(x) for x in compile_program(program)(*registers))
+
+
+def part_2(problem: Tuple[list[int], list[int]]) -> int | None:
+    program, _ = problem
+    return find_quine(program)
+
+
+def test_compile_program():
+    run = compile_program([0, 1, 5, 4, 3, 0])
+    assert run(729, 0, 0) == [4, 6, 3, 5, 6, 3, 5, 2, 1, 0]
+    # bst 6, out 5, jumping past the end halts
+    assert compile_program([2, 6, 5, 5, 3, 7])(1, 0, 9) == [1]
+
+
+def test_run_batch():
+    program = [0, 1, 5, 4, 3, 0]
+    output = run_batch(program, np.array([729, 0, 7]))
+    assert output[0].tolist() == [4, 6, 3, 5, 6, 3, 5, 2, 1, 0]
+    assert output[1].tolist()[:1] == [0]
+    assert output[2].tolist()[:4] == [3, 1, 0, -1]
+
+
+def test_find_quine():
+    assert find_quine([0, 3, 5, 4, 3, 0]) == 117440
+
+
+if __name__ == "__main__":
+    problem = parse_problem(resolve_path("data/day17.txt", __file__))
+    print(part_1(problem))
+    print(part_2(problem))
@@ -1,44 +1,157 @@
-from utils import V2, Direction, Grid
-from collections import deque
+from utils import V2, DenseGrid, Grid, build_adjacency, read_ints, resolve_path
+import numpy as np
 
-MARKER = "x"
 GRID_SIZE = 71
+# bytes fallen in part 1
+N_FALLEN = 1024
 
 
-def find_min_dist(maze: Grid, start: V2, end: V2) -> int:
-    queue = deque([(start, 0)])
-    maze.update(start, MARKER)
-    while len(queue) > 0:
-        (p, dist) = queue.popleft()
-        if p == end:
-            return dist
-        for direction in Direction.ALL:
-            new_p = p + direction
-            if maze.is_inbounds(new_p) and maze.at(new_p) == ".":
-                maze.update(new_p, MARKER)
-                queue.append((new_p, dist + 1))
-    return -1
+def find_min_dist(maze: Grid | DenseGrid, start: V2, end: V2) -> int:
+    """shortest number of steps over "." cells, -1 if end is unreachable"""
+    adjacency = build_adjacency(maze, lambda c: c == ".")
+    start_node, end_node = adjacency.node(start), adjacency.node(end)
+    if start_node == -1 or end_node == -1:
+        return -1
+    return int(adjacency.bfs(start_node)[end_node])
 
 
-all_blocked_ps = []
-with open("./data/day18.txt") as f:
-    for i, line in enumerate(f):
-        x, y = line.split(",")
-        all_blocked_ps.append(V2(int(x), int(y)))
+def parse_blocked(fname: str) -> np.ndarray:
+    """(n_bytes, 2) coordinates in falling order"""
+    return read_ints(fname, n_cols=2)
 
 
-def create_grid(blocked_ps):
-    grid = Grid("." * GRID_SIZE for _ in range(GRID_SIZE))
-    for p in blocked_ps:
-        grid.update(p, "#")
-    return grid
+def grid_size(blocked_ps: np.ndarray) -> int:
+    """GRID_SIZE, or larger when bytes fall outside of it"""
+    return max(GRID_SIZE, int(blocked_ps.max(initial=0)) + 1)
 
 
-print(find_min_dist(create_grid(all_blocked_ps[:1024]), V2(0, 0), V2(70, 70)))
-for n in range(1024, len(all_blocked_ps)):
-    if find_min_dist(create_grid(all_blocked_ps[:n]), V2(0, 0), V2(70, 70)) == -1:
-        print(all_blocked_ps[n - 1])
-        break
+def create_grid(blocked_ps: np.ndarray, size: int = GRID_SIZE) -> DenseGrid:
+    cells = np.full((size, size), ord("."), dtype=np.uint8)
+    cells[blocked_ps[:, 0], blocked_ps[:, 1]] = ord("#")
+    return DenseGrid(cells)
+
+
+def fall_times(blocked_ps: np.ndarray, size: int) -> np.ndarray:
+    """
+    index of the first byte to land on each cell of the grid padded by a
+    border, len(blocked_ps) for cells that stay open and -1 on the border
+    """
+    n_bytes = len(blocked_ps)
+    times = np.full((size, size), n_bytes, dtype=np.int64)
+    np.minimum.at(times, (blocked_ps[:, 0], blocked_ps[:, 1]), np.arange(n_bytes))
+    return np.pad(times, 1, constant_values=-1).ravel()
+
+
+def first_cut_union_find(blocked_ps: np.ndarray, size: int) -> int | None:
+    """
+    index of the byte that first cuts the corners apart. Runs backwards:
+    with every byte fallen the open cells are joined in a union find, then
+    bytes are lifted last first until the corners join, the lifted byte is
+    the cut.
+    """
+    n_bytes, width = len(blocked_ps), size + 2
+    times = fall_times(blocked_ps, size)
+    start, end = width + 1, size * width + size
+    parent = list(range(len(times)))
+
+    def find(cell: int) -> int:
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    def union(a: int, b: int) -> None:
+        a, b = find(a), find(b)
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+
+    is_open = times == n_bytes
+    for step in [1, width]:
+        for a in np.flatnonzero(is_open[:-step] & is_open[step:]).tolist():
+            union(a, a + step)
+    if find(start) == find(end):
+        return None
+
+    is_open = is_open.tolist()
+    times = times.tolist()
+    cells = ((blocked_ps[:, 0] + 1) * width + blocked_ps[:, 1] + 1).tolist()
+    for i in range(n_bytes - 1, -1, -1):
+        cell = cells[i]
+        if times[cell] != i:
+            continue  # an earlier byte landed here too
+        is_open[cell] = True
+        for step in [1, -1, width, -width]:
+            if is_open[cell + step]:
+                union(cell, cell + step)
+        if find(start) == find(end):
+            return i
+    return None
+
+
+def _is_connected(open_cells: bytearray, start: int, end: int, width: int) -> bool:
+    """flood fill from start, open_cells is cleared as it is visited"""
+    if not open_cells[start]:
+        return False
+    open_cells[start] = 0
+    stack = [start]
+    while len(stack) > 0:
+        cell = stack.pop()
+        if cell == end:
+            return True
+        for next_cell in (cell + 1, cell - 1, cell + width, cell - width):
+            if open_cells[next_cell]:
+                open_cells[next_cell] = 0
+                stack.append(next_cell)
+    return False
+
+
+def first_cut_binary_search(blocked_ps: np.ndarray, size: int) -> int | None:
+    """
+    same answer as first_cut_union_find by bisecting on the number of
+    fallen bytes, every probe refills one open cell bitmap from fall_times
+    """
+    n_bytes, width = len(blocked_ps), size + 2
+    times = fall_times(blocked_ps, size)
+    start, end = width + 1, size * width + size
+    open_cells = bytearray(len(times))
+
+    def is_connected(n_fallen: int) -> bool:
+        open_cells[:] = (times >= n_fallen).tobytes()
+        return _is_connected(open_cells, start, end, width)
+
+    if is_connected(n_bytes):
+        return None
+    # connected with lo bytes fallen, cut with hi
+    lo, hi = 0, n_bytes
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if is_connected(mid):
+            lo = mid
+        else:
+            hi = mid
+    return hi - 1
+
+
+def part_1(
+    all_blocked_ps: np.ndarray,
+    size: int | None = None,
+    n_fallen: int = N_FALLEN,
+) -> int:
+    """size defaults to the grid_size of the bytes"""
+    if size is None:
+        size = grid_size(all_blocked_ps)
+    grid = create_grid(all_blocked_ps[:n_fallen], size)
+    return find_min_dist(grid, V2(0, 0), V2(size - 1, size - 1))
+
+
+def part_2(all_blocked_ps: np.ndarray, size: int | None = None) -> str | None:
+    if size is None:
+        size = grid_size(all_blocked_ps)
+    i = first_cut_union_find(all_blocked_ps, size)
+    if i is None:
+        return None
+    x, y = all_blocked_ps[i].tolist()
+    return f"{x},{y}"
 
 
 def test_find_min_dist_simple():
@@ -86,3 +199,66 @@ def test_find_min_dist_sample():
         ]
     )
     assert find_min_dist(grid, V2(0, 0), V2(6, 6)) == 22
+
+
+def test_find_min_dist_dense():
+    grid = DenseGrid.from_grid(
+        [
+            "..x",
+            "x..",
+            ".x.",
+            "...",
+        ]
+    )
+    assert find_min_dist(grid, V2(0, 0), V2(2, 0)) == 8
+
+
+TEST_BYTES = np.array(
+    [
+        [5, 4],
+        [4, 2],
+        [4, 5],
+        [3, 0],
+        [2, 1],
+        [6, 3],
+        [2, 4],
+        [1, 5],
+        [0, 6],
+        [3, 3],
+        [2, 6],
+        [5, 1],
+        [1, 2],
+        [5, 5],
+        [2, 5],
+        [6, 5],
+        [1, 4],
+        [0, 4],
+        [6, 4],
+        [1, 1],
+        [6, 1],
+        [1, 0],
+        [0, 5],
+        [1, 6],
+        [2, 0],
+    ]
+)
+
+
+def test_first_cut():
+    assert find_min_dist(create_grid(TEST_BYTES[:12], 7), V2(0, 0), V2(6, 6)) == 22
+    assert part_1(TEST_BYTES, size=7, n_fallen=12) == 22
+    assert part_2(TEST_BYTES, size=7) == "6,1"
+    assert first_cut_union_find(TEST_BYTES, 7) == 20
+    assert first_cut_binary_search(TEST_BYTES, 7) == 20
+    # never cut, and repeated bytes
+    assert first_cut_union_find(TEST_BYTES[:20], 7) is None
+    assert first_cut_binary_search(TEST_BYTES[:20], 7) is None
+    repeated = np.concatenate([TEST_BYTES[:20], TEST_BYTES[:20], TEST_BYTES[20:]])
+    assert first_cut_union_find(repeated, 7) == 40
+    assert first_cut_binary_search(repeated, 7) == 40
+
+
+if __name__ == "__main__":
+    all_blocked_ps = parse_blocked(resolve_path("data/day18.txt", __file__))
+    print(part_1(all_blocked_ps))
+    print(part_2(all_blocked_ps))
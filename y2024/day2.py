@@ -1,12 +1,10 @@
-DATA_FILE = "./data/day2.txt"
+from utils import iter_lines, resolve_path
 
+DATA_FILE = resolve_path("data/day2.txt", __file__)
 
-def get_input() -> list[list[int]]:
-    numbers = []
-    with open(DATA_FILE, "r") as f:
-        for line in f:
-            numbers.append([int(x) for x in line.split()])
-    return numbers
+
+def get_input(fname: str = DATA_FILE) -> list[list[int]]:
+    return [[int(x) for x in line.split()] for line in iter_lines(fname)]
 
 
 def is_level_safe(levels: list[int]) -> bool:
@@ -42,16 +40,27 @@ def is_level_safe_with_dampener(levels: list[int]) -> bool:
     return False
 
 
-assert is_level_safe([])
-assert is_level_safe([1])
-assert is_level_safe([1, 2, 3])
-assert is_level_safe([3, 2, 1])
-assert not is_level_safe([1, 1])
-assert not is_level_safe([1, 2, 1])
-assert not is_level_safe([1, 2, 1])
-assert not is_level_safe([1, 5])
-assert not is_level_safe([5, 1])
+def part_1(number_lists: list[list[int]]) -> int:
+    return len([x for x in number_lists if is_level_safe(x)])
+
+
+def part_2(number_lists: list[list[int]]) -> int:
+    return len([x for x in number_lists if is_level_safe_with_dampener(x)])
+
+
+def test_is_level_safe():
+    assert is_level_safe([])
+    assert is_level_safe([1])
+    assert is_level_safe([1, 2, 3])
+    assert is_level_safe([3, 2, 1])
+    assert not is_level_safe([1, 1])
+    assert not is_level_safe([1, 2, 1])
+    assert not is_level_safe([1, 2, 1])
+    assert not is_level_safe([1, 5])
+    assert not is_level_safe([5, 1])
+
 
-number_lists = get_input()
-print(len([x for x in number_lists if is_level_safe(x)]))
-print(len([x for x in number_lists if is_level_safe_with_dampener(x)]))
+if __name__ == "__main__":
+    number_lists = get_input()
+    print(part_1(number_lists))
+    print(part_2(number_lists))
@@ -1,336 +1,148 @@
 from dataclasses import dataclass, field
-from utils import V2, Direction, Grid
-from collections import defaultdict, deque
-import math
+from utils import (
+    V2,
+    Adjacency,
+    Grid,
+    build_adjacency,
+    read_grid,
+    resolve_path,
+)
+import numpy as np
 import copy
 
+MIN_SAVING = 100
+
 
 @dataclass
 class MazeSolver:
     maze: Grid
     start: V2 = field(init=False)
     end: V2 = field(init=False)
-    start_dists: dict[V2, int] = field(init=False)
-    end_dists: dict[V2, int] = field(init=False)
+    # (height, width) distances along the track, -1 for walls
+    start_dists: np.ndarray = field(init=False)
+    end_dists: np.ndarray = field(init=False)
+    adjacency: Adjacency = field(init=False)
 
     def __post_init__(self):
         self.start = self.maze.find("S")[0]
         self.end = self.maze.find("E")[0]
         self.maze.update(self.start, ".")
         self.maze.update(self.end, ".")
+        self.adjacency = build_adjacency(self.maze, lambda c: c == ".")
         self.start_dists = self._build_dists(self.start)
         self.end_dists = self._build_dists(self.end)
 
-    def _build_dists(self, start: V2):
-        queue = deque([(start, 0)])
-        visited = set([start])
-        dists = dict()
-        while len(queue) > 0:
-            p, dist = queue.popleft()
-            dists[p] = dist
-            for direction in Direction.ALL:
-                next_p = p + direction
-                if (
-                    next_p not in visited
-                    and self.maze.is_inbounds(next_p)
-                    and self.maze.at(next_p) == "."
-                ):
-                    visited.add(next_p)
-                    queue.append((next_p, dist + 1))
-
-        return dists
-
-    def find_dist(self, cheat_p: V2, cheat_direction: Direction):
-        maze = self.maze
-        assert maze.is_inbounds(cheat_p)
-        assert maze.is_inbounds(cheat_p + cheat_direction)
-        assert maze.is_inbounds(cheat_p - cheat_direction)
-        assert maze.at(cheat_p) == "#"
-        assert maze.at(cheat_p + cheat_direction) == "."
-        assert maze.at(cheat_p - cheat_direction) == "."
-
-        return (
-            self.start_dists[cheat_p - cheat_direction]
-            + self.end_dists[cheat_p + cheat_direction]
-            + 2
-        )
-
-    def find_dist_v2(self, cheat_start: V2, cheat_dist: int):
-        maze = self.maze
-        assert maze.is_inbounds(cheat_start)
-        assert maze.at(cheat_start) == "."
-        # cheat dists can be allocated vertically or horizonally
-        min_dist = 999999999
-        for x_dist in range(0, cheat_dist + 1):
-            y_dist = cheat_dist - x_dist
-            for dx in [-x_dist, x_dist]:
-                for dy in [-y_dist, y_dist]:
-                    cheat_end = cheat_start + V2(dx, dy)
-                    if maze.is_inbounds(cheat_end) and maze.at(cheat_end) == ".":
-                        min_dist = min(
-                            min_dist,
-                            self.start_dists[cheat_start]
-                            + self.end_dists[cheat_end]
-                            + cheat_dist,
-                        )
-        return min_dist
-
-    def dist_saved_v2(self, cheat_start: V2, cheat_dist: int) -> int:
-        dist = self.find_dist_v2(cheat_start, cheat_dist)
-        return self.start_dists[self.end] - dist
+    def _build_dists(self, start: V2) -> np.ndarray:
+        adjacency = self.adjacency
+        return adjacency.to_array(adjacency.bfs(adjacency.node(start)))
+
+    @property
+    def baseline_dist(self) -> int:
+        return int(self.start_dists[self.end.x, self.end.y])
+
+    def cheat_savings(self, max_cheat_dist: int) -> np.ndarray:
+        """
+        number of cheats by time saved, for cheats of up to max_cheat_dist
+        moves between two track cells. A cheat is fixed by its start and end
+        cell, so for every offset between them the savings of all starts are
+        taken at once from the distance arrays shifted by that offset.
+        """
+        height, width = self.start_dists.shape
+        baseline = self.baseline_dist
+        pad = max_cheat_dist
+        end_dists = np.pad(self.end_dists, pad, constant_values=-1)
+        on_track = self.start_dists >= 0
+        # time left after each start cell, less the cheat's own moves below
+        remaining = np.where(on_track, baseline - self.start_dists, -1)
+        counts = np.zeros(baseline + 1, dtype=np.int64)
+        for dx in range(-max_cheat_dist, max_cheat_dist + 1):
+            max_dy = max_cheat_dist - abs(dx)
+            for dy in range(-max_dy, max_dy + 1):
+                cheat_dist = abs(dx) + abs(dy)
+                if cheat_dist < 2:
+                    # moving one cell never passes through a wall
+                    continue
+                ends = end_dists[
+                    pad + dx : pad + dx + height, pad + dy : pad + dy + width
+                ]
+                saved = remaining - ends - cheat_dist
+                saved = saved[on_track & (ends >= 0) & (saved > 0)]
+                counts += np.bincount(saved, minlength=baseline + 1)
+        return counts
+
+
+def count_cheats(maze: Grid, max_cheat_dist: int, min_saving: int = MIN_SAVING) -> int:
+    solver = MazeSolver(copy.deepcopy(maze))
+    return int(solver.cheat_savings(max_cheat_dist)[min_saving:].sum())
 
-    def cheat_dists(self, cheat_start: V2, max_cheat_dist: int) -> dict:
-        maze = self.maze
-        dists = defaultdict(int)
-        assert maze.is_inbounds(cheat_start)
-        assert maze.at(cheat_start) == "."
-        cheat_used = set()
-        # cheat dists can be allocated vertically or horizonally
-        for cheat_dist in range(max_cheat_dist):
-            for x_dist in range(0, cheat_dist + 1):
-                y_dist = cheat_dist - x_dist
-                for dx in [-x_dist, x_dist]:
-                    for dy in [-y_dist, y_dist]:
-                        cheat_end = cheat_start + V2(dx, dy)
-                        if maze.is_inbounds(cheat_end) and maze.at(cheat_end) == ".":
-                            dist = (
-                                self.start_dists[cheat_start]
-                                + self.end_dists[cheat_end]
-                                + cheat_dist
-                            )
-                            if (cheat_start, cheat_end, dist) not in cheat_used:
-                                dists[dist] += 1
-                                cheat_used.add((cheat_start, cheat_end, dist))
-        return dists
 
+TEST_MAZE = Grid(
+    [
+        "###############",
+        "#...#...#.....#",
+        "#.#.#.#.#.###.#",
+        "#S#...#.#.#...#",
+        "#######.#.#.###",
+        "#######.#.#...#",
+        "#######.#.###.#",
+        "###..E#...#...#",
+        "###.#######.###",
+        "#...###...#...#",
+        "#.#####.#.###.#",
+        "#.#...#.#.#...#",
+        "#.#.#.#.#.#.###",
+        "#...#...#...###",
+        "###############",
+    ]
+)
 
-def test_all_cheat_dists():
-    maze = Grid(
-        [
-            "###############",
-            "#...#...#.....#",
-            "#.#.#.#.#.###.#",
-            "#S#...#.#.#...#",
-            "#######.#.#.###",
-            "#######.#.#...#",
-            "#######.#.###.#",
-            "###..E#...#...#",
-            "###.#######.###",
-            "#...###...#...#",
-            "#.#####.#.###.#",
-            "#.#...#.#.#...#",
-            "#.#.#.#.#.#.###",
-            "#...#...#...###",
-            "###############",
-        ]
-    )
-    cheat_dists = defaultdict(int)
-    solver = MazeSolver(copy.deepcopy(maze))
-    for x in range(maze.height):
-        for y in range(maze.width):
-            cheat_start = V2(x, y)
-            if maze.at(cheat_start) == ".":
-                dists = solver.cheat_dists(cheat_start, 20)
-                for dist, count in dists.items():
-                    cheat_dists[dist] += count
 
-    for cheat, count in cheat_dists.items():
-        if cheat <= 84 - 50:
-            print(f"there are {count} cheats taht save {84-cheat}")
+def test_cheat_savings():
+    solver = MazeSolver(copy.deepcopy(TEST_MAZE))
+    assert solver.baseline_dist == 84
+    savings = solver.cheat_savings(2)
+    assert {s: int(c) for s, c in enumerate(savings) if c > 0} == {
+        2: 14,
+        4: 14,
+        6: 2,
+        8: 4,
+        10: 2,
+        12: 3,
+        20: 1,
+        36: 1,
+        38: 1,
+        40: 1,
+        64: 1,
+    }
+    savings = solver.cheat_savings(20)
+    assert savings[50:77:2].tolist() == [
+        32,
+        31,
+        29,
+        39,
+        25,
+        23,
+        20,
+        19,
+        12,
+        14,
+        12,
+        22,
+        4,
+        3,
+    ]
+    assert count_cheats(TEST_MAZE, 20, 76) == 3
 
 
-def test_find_dist_with_cheat_1():
-    maze = Grid(
-        [
-            "###############",
-            "#...#...#.....#",
-            "#.#.#.#.#.###.#",
-            "#S#...#.#.#...#",
-            "#######.#.#.###",
-            "#######.#.#...#",
-            "#######.#.###.#",
-            "###..E#...#...#",
-            "###.#######.###",
-            "#...###...#...#",
-            "#.#####.#.###.#",
-            "#.#...#.#.#...#",
-            "#.#.#.#.#.#.###",
-            "#...#...#...###",
-            "###############",
-        ]
-    )
-    solver = MazeSolver(maze)
-    assert solver.find_dist(V2(1, 8), Direction.RIGHT) == 72
+def part1(maze):
+    return count_cheats(maze, 2)
 
 
-def part1(maze):
-    solver = MazeSolver(copy.deepcopy(maze))
-    baseline_dist = solver.start_dists[solver.end]
-    count = 0
-    for i in range(maze.height):
-        for j in range(maze.width):
-            cheat_p = V2(i, j)
-            for cheat_direction in Direction.ALL:
-                if (
-                    maze.is_inbounds(cheat_p)
-                    and maze.is_inbounds(cheat_p + cheat_direction)
-                    and maze.is_inbounds(cheat_p - cheat_direction)
-                    and maze.at(cheat_p) == "#"
-                    and maze.at(cheat_p + cheat_direction) == "."
-                    and maze.at(cheat_p - cheat_direction) == "."
-                ):
-                    if (
-                        baseline_dist - solver.find_dist(cheat_p, cheat_direction)
-                        >= 100
-                    ):
-                        count += 1
-    print(count)
+def part2(maze):
+    return count_cheats(maze, 20)
 
 
-maze = Grid(
-    [
-        "#############################################################################################################################################",
-        "#.........#...#...###...###...#.............###...#...#...#.....#...#...#...###...#.....#.....#.....###.....#...#...#...#...#...........#...#",
-        "#.#######.#.#.#.#.###.#.###.#.#.###########.###.#.#.#.#.#.#.###.#.#.#.#.#.#.###.#.#.###.#.###.#.###.###.###.#.#.#.#.#.#.#.#.#.#########.#.#.#",
-        "#...#...#...#.#.#.#...#...#.#.#.........#...#...#.#.#.#.#...#...#.#.#.#...#...#.#...#...#...#.#.#...#...#...#.#.#.#.#.#...#...#.......#...#.#",
-        "###.#.#.#####.#.#.#.#####.#.#.#########.#.###.###.#.#.#.#####.###.#.#.#######.#.#####.#####.#.#.#.###.###.###.#.#.#.#.#########.#####.#####.#",
-        "###...#.....#.#.#.#.....#.#.#.#...###...#...#.#...#.#.#.....#.#...#.#.....#...#.....#.......#.#.#...#...#.....#...#.#.....#.....#...#.....#.#",
-        "###########.#.#.#.#####.#.#.#.#.#.###.#####.#.#.###.#.#####.#.#.###.#####.#.#######.#########.#.###.###.###########.#####.#.#####.#.#####.#.#",
-        "#...#...#...#.#.#.#...#.#.#.#.#.#...#.#.....#.#.###.#.#...#.#.#.#...###...#...#...#.........#.#.#...#...#...#.......#...#.#.......#...###...#",
-        "#.#.#.#.#.###.#.#.#.#.#.#.#.#.#.###.#.#.#####.#.###.#.#.#.#.#.#.#.#####.#####.#.#.#########.#.#.#.###.###.#.#.#######.#.#.###########.#######",
-        "#.#...#.#...#.#.#.#.#...#.#.#.#...#.#.#.###...#.#...#.#.#...#...#.#...#...#...#.#.#.......#.#...#...#.#...#...###.....#...#...#.....#.......#",
-        "#.#####.###.#.#.#.#.#####.#.#.###.#.#.#.###.###.#.###.#.#########.#.#.###.#.###.#.#.#####.#.#######.#.#.#########.#########.#.#.###.#######.#",
-        "#.#...#.....#.#.#.#.....#.#.#.#...#.#.#...#...#.#...#.#.........#.#.#...#.#.#...#.#...#...#.......#...#.........#.....#.....#...###.#...#...#",
-        "#.#.#.#######.#.#.#####.#.#.#.#.###.#.###.###.#.###.#.#########.#.#.###.#.#.#.###.###.#.#########.#############.#####.#.###########.#.#.#.###",
-        "#...#.......#...#.#.....#.#.#.#...#.#.#...#...#...#.#.###...#...#...#...#.#.#...#.#...#.#.........#.......#...#.#.....#.#.....#...#...#...###",
-        "###########.#####.#.#####.#.#.###.#.#.#.###.#####.#.#.###.#.#.#######.###.#.###.#.#.###.#.#########.#####.#.#.#.#.#####.#.###.#.#.###########",
-        "###...#...#.....#.#...#...#.#...#.#...#...#...#...#.#...#.#.#...#.....#...#.#...#.#.#...#.#.......#.#...#...#...#.#...#.#.#...#.#.....###...#",
-        "###.#.#.#.#####.#.###.#.###.###.#.#######.###.#.###.###.#.#.###.#.#####.###.#.###.#.#.###.#.#####.#.#.#.#########.#.#.#.#.#.###.#####.###.#.#",
-        "#...#...#.......#.....#...#...#.#...#...#...#.#...#...#.#.#...#.#.....#...#.#.#...#.#.###...#.....#...#...###...#...#.#...#.....#...#.....#.#",
-        "#.#######################.###.#.###.#.#.###.#.###.###.#.#.###.#.#####.###.#.#.#.###.#.#######.###########.###.#.#####.###########.#.#######.#",
-        "#.#.............#.......#.#...#...#...#.#...#.#...###.#.#...#.#.#.....###.#...#...#.#...#...#.....#.....#...#.#.###...#...........#.#.......#",
-        "#.#.###########.#.#####.#.#.#####.#####.#.###.#.#####.#.###.#.#.#.#######.#######.#.###.#.#.#####.#.###.###.#.#.###.###.###########.#.#######",
-        "#...#...........#.#...#.#...#...#.#...#.#.....#.......#.#...#...#...###...#.....#.#...#.#.#...#...#.###.....#.#.#...#...#.........#...#.....#",
-        "#####.###########.#.#.#.#####.#.#.#.#.#.###############.#.#########.###.###.###.#.###.#.#.###.#.###.#########.#.#.###.###.#######.#####.###.#",
-        "#...#...........#.#.#...#...#.#.#...#...#.........#.....#...#...#...#...#...###.#.#...#...#...#...#.#...#.....#.#...#...#.#.......#...#.#...#",
-        "#.#.###########.#.#.#####.#.#.#.#########.#######.#.#######.#.#.#.###.###.#####.#.#.#######.#####.#.#.#.#.#####.###.###.#.#.#######.#.#.#.###",
-        "#.#...........#...#.......#...#.#...#...#.......#.#.....###...#.#.#...#...#...#...#.....#...#...#.#...#.#.#...#...#...#...#.........#...#.###",
-        "#.###########.#################.#.#.#.#.#######.#.#####.#######.#.#.###.###.#.#########.#.###.#.#.#####.#.#.#.###.###.###################.###",
-        "#...........#.#...#...#...#...#...#...#.#.......#.......#...#...#...#...#...#...###...#.#.###.#...#.....#...#.#...#...#...#...#.....#...#...#",
-        "###########.#.#.#.#.#.#.#.#.#.#########.#.###############.#.#.#######.###.#####.###.#.#.#.###.#####.#########.#.###.###.#.#.#.#.###.#.#.###.#",
-        "#...........#...#...#...#...#...........#.....#...###...#.#.#...#.....###.#.....#...#...#...#.....#...#...###.#.###.#...#...#...###...#...#.#",
-        "#.###########################################.#.#.###.#.#.#.###.#.#######.#.#####.#########.#####.###.#.#.###.#.###.#.###################.#.#",
-        "#.........#.......#...#.................#.....#.#.#...#.#.#.#...#.....#...#...#...#.........#...#.#...#.#.#...#.....#.........#...#.....#...#",
-        "#########.#.#####.#.#.#.###############.#.#####.#.#.###.#.#.#.#######.#.#####.#.###.#########.#.#.#.###.#.#.#################.#.#.#.###.#####",
-        "#.........#...###...#.#.#.....#...#...#.#.#...#.#.#...#.#.#.#...#.....#...#...#...#.#...#...#.#.#.#.###.#.#.#.....#...........#.#.#...#.....#",
-        "#.###########.#######.#.#.###.#.#.#.#.#.#.#.#.#.#.###.#.#.#.###.#.#######.#.#####.#.#.#.#.#.#.#.#.#.###.#.#.#.###.#.###########.#.###.#####.#",
-        "#.............#...###...#...#...#...#...#.#.#...#.#...#.#.#.#...#.#.....#.#.#...#.#.#.#...#.#.#.#.#.#...#...#...#.#.............#.....#...#.#",
-        "###############.#.#########.#############.#.#####.#.###.#.#.#.###.#.###.#.#.#.#.#.#.#.#####.#.#.#.#.#.#########.#.#####################.#.#.#",
-        "#...............#.....#...#.....#.....###.#...###.#...#.#.#...###.#...#.#.#.#.#.#.#...#.....#.#.#.#...#.........#.....#...#...#...#.....#...#",
-        "#.###################.#.#.#####.#.###.###.###.###.###.#.#.#######.###.#.#.#.#.#.#.#####.#####.#.#.#####.#############.#.#.#.#.#.#.#.#########",
-        "#...#...#...#.......#...#...###...#...#...#...#...#...#...#.......#...#.#.#.#.#.#...#...#...#.#.#.#...#.............#.#.#.#.#...#.#.#...#...#",
-        "###.#.#.#.#.#.#####.#######.#######.###.###.###.###.#######.#######.###.#.#.#.#.###.#.###.#.#.#.#.#.#.#############.#.#.#.#.#####.#.#.#.#.#.#",
-        "###...#...#...#.....#.....#.........#...#...###...#.....###...#...#...#.#.#...#.#...#...#.#.#.#...#.#...#.......#...#...#.#.....#...#.#...#.#",
-        "###############.#####.###.###########.###.#######.#####.#####.#.#.###.#.#.#####.#.#####.#.#.#.#####.###.#.#####.#.#######.#####.#####.#####.#",
-        "#...............#...#.###...........#.....#.....#.#.....#.....#.#.#...#.#.....#.#...#...#.#.#.....#...#...#...#...#.....#.....#.#.....#.....#",
-        "#.###############.#.#.#############.#######.###.#.#.#####.#####.#.#.###.#####.#.###.#.###.#.#####.###.#####.#.#####.###.#####.#.#.#####.#####",
-        "#.........#.....#.#.#.#.............#.......#...#.#.....#.....#.#.#.###...#...#...#.#.#...#.#...#.#...#...#.#.......#...#...#...#.#.....#...#",
-        "#########.#.###.#.#.#.#.#############.#######.###.#####.#####.#.#.#.#####.#.#####.#.#.#.###.#.#.#.#.###.#.#.#########.###.#.#####.#.#####.#.#",
-        "#.......#...###...#...#...............#...#...###.#...#...#...#.#.#.....#.#.....#.#.#.#.###.#.#...#.....#...#...#.....#...#.......#.......#.#",
-        "#.#####.###############################.#.#.#####.#.#.###.#.###.#.#####.#.#####.#.#.#.#.###.#.###############.#.#.#####.###################.#",
-        "#.....#.#...#...#...#...#.......#.......#.#.....#...#.#...#.....#.#...#.#.#...#.#.#.#...#...#.#...............#.#.......#...#.....#.......#.#",
-        "#####.#.#.#.#.#.#.#.#.#.#.#####.#.#######.#####.#####.#.#########.#.#.#.#.#.#.#.#.#.#####.###.#.###############.#########.#.#.###.#.#####.#.#",
-        "#.....#...#.#.#.#.#.#.#.#.....#.#.......#.......#...#.#.........#.#.#...#.#.#.#.#...#...#...#.#...#...#.......#.....#.....#.#.#...#.....#...#",
-        "#.#########.#.#.#.#.#.#.#####.#.#######.#########.#.#.#########.#.#.#####.#.#.#.#####.#.###.#.###.#.#.#.#####.#####.#.#####.#.#.#######.#####",
-        "#.........#.#.#...#...#.......#.........#...#...#.#.#.#.....#...#...#...#...#.#...#...#.....#...#...#...#...#...###.#...###...#.#.....#...###",
-        "#########.#.#.###########################.#.#.#.#.#.#.#.###.#.#######.#.#####.###.#.###########.#########.#.###.###.###.#######.#.###.###.###",
-        "#.........#...#...#...#...#...............#...#...#.#...###.#.........#...#...#...#.............#...#.....#...#...#...#.....#...#...#...#...#",
-        "#.#############.#.#.#.#.#.#.#######################.#######.#############.#.###.#################.#.#.#######.###.###.#####.#.#####.###.###.#",
-        "#...#...#.....#.#.#.#...#...#.......................###...#.........#.....#...#.#.........#.....#.#...#...###.....###.......#.#...#...#.#...#",
-        "###.#.#.#.###.#.#.#.#########.#########################.#.#########.#.#######.#.#.#######.#.###.#.#####.#.###################.#.#.###.#.#.###",
-        "###...#...###...#...#...#...#...............###.........#.........#.#.......#.#.#...#...#.#...#.#.#.....#...................#.#.#...#.#.#...#",
-        "#####################.#.#.#.###############.###.#################.#.#######.#.#.###.#.#.#.###.#.#.#.#######################.#.#.###.#.#.###.#",
-        "#.........#.......#...#...#...............#.#...#.......#...#.....#.........#.#.#...#.#.#...#.#.#...#...#...#...#.....#.....#...###...#...#.#",
-        "#.#######.#.#####.#.#####################.#.#.###.#####.#.#.#.###############.#.#.###.#.###.#.#.#####.#.#.#.#.#.#.###.#.#################.#.#",
-        "#.......#.#.....#.#.....................#...#.#...#...#...#.#.........#.....#.#.#...#.#...#...#.###...#...#...#...###.#.......#...#...#...#.#",
-        "#######.#.#####.#.#####################.#####.#.###.#.#####.#########.#.###.#.#.###.#.###.#####.###.#################.#######.#.#.#.#.#.###.#",
-        "#.......#.....#.#.......................#...#.#.#...#...###.......#...#...#.#.#.###...###.#...#.....#.......#...#...#.........#.#.#.#.#...#.#",
-        "#.###########.#.#########################.#.#.#.#.#####.#########.#.#####.#.#.#.#########.#.#.#######.#####.#.#.#.#.###########.#.#.#.###.#.#",
-        "#...........#.#.#...#...#.....#...........#...#...#...#...#.....#...#...#.#.#...#...#...#...#.......#.#.....#.#...#.#.....#...#.#...#...#.#.#",
-        "###########.#.#.#.#.#.#.#.###.#.###################.#.###.#.###.#####.#.#.#.#####.#.#.#.###########.#.#.#####.#####.#.###.#.#.#.#######.#.#.#",
-        "#...###...#.#.#...#...#.#.###...#.......#...#.......#.....#.#...#...#.#.#.#...#...#...#...#.......#...#.......#...#.#.#...#.#.#.#.......#...#",
-        "#.#.###.#.#.#.#########.#.#######.#####.#.#.#.#############.#.###.#.#.#.#.###.#.#########.#.#####.#############.#.#.#.#.###.#.#.#.###########",
-        "#.#.....#...#...###...#...#.....#...###.#.#.#...............#...#.#.#.#.#.#...#.......#...#.....#.............#.#...#.#.#...#...#...#...#...#",
-        "#.#############.###.#.#####.###.###.###.#.#.###################.#.#.#.#.#.#.#########.#.#######.#############.#.#####.#.#.#########.#.#.#.#.#",
-        "#...........#...#...#.....#...#.###...#...#.#.....#...#...#.....#.#...#...#.....#.....#.........#.....#...###...###...#...#.......#.#.#.#.#.#",
-        "###########.#.###.#######.###.#.#####.#####.#.###.#.#.#.#.#.#####.#############.#.###############.###.#.#.#########.#######.#####.#.#.#.#.#.#",
-        "###...#...#.#...#.......#.#...#.#.....#...#...###...#...#.#.#...#.#...#...#.....#.................###...#.....#...#.....#...#...#...#.#...#.#",
-        "###.#.#.#.#.###.#######.#.#.###.#.#####.#.###############.#.#.#.#.#.#.#.#.#.#################################.#.#.#####.#.###.#.#####.#####.#",
-        "#...#...#.#...#...#...#.#.#...#.#.......#.............#...#.#.#...#.#...#...###...#.............###...###.....#.#.###...#...#.#.......#...#.#",
-        "#.#######.###.###.#.#.#.#.###.#.#####################.#.###.#.#####.###########.#.#.###########.###.#.###.#####.#.###.#####.#.#########.#.#.#",
-        "#.......#.###...#...#...#.....#.#...........#.........#.....#...#...#...#.....#.#.#.......#...#.....#.....#.....#...#.....#.#.#.........#...#",
-        "#######.#.#####.###############.#.#########.#.#################.#.###.#.#.###.#.#.#######.#.#.#############.#######.#####.#.#.#.#############",
-        "#.......#.#...#.#...#.........#.#.........#.#.........#...#.....#.#...#.#...#.#.#...#.....#.#.#...#...#.....#.......#...#.#...#...........###",
-        "#.#######.#.#.#.#.#.#.#######.#.#########.#.#########.#.#.#.#####.#.###.###.#.#.###.#.#####.#.#.#.#.#.#.#####.#######.#.#.###############.###",
-        "#.......#...#.#...#.#.#.......#...#.......#.....#.....#.#.#.....#.#.#...###.#.#...#.#.....#.#.#.#...#...#.....#.......#...#.....#.......#...#",
-        "#######.#####.#####.#.#.#########.#.###########.#.#####.#.#####.#.#.#.#####.#.###.#.#####.#.#.#.#########.#####.###########.###.#.#####.###.#",
-        "###...#.#...#...###...#.........#...#...###...#...#.....#.#...#.#...#.#.....#.....#...###...#...#.........#...#...#.........#...#.....#...#.#",
-        "###.#.#.#.#.###.###############.#####.#.###.#.#####.#####.#.#.#.#####.#.#############.###########.#########.#.###.#.#########.#######.###.#.#",
-        "#...#.#...#...#.....#.....#.....#.....#...#.#...###...#...#.#.#.#.....#.......#.......#.....#..E#...#.......#.....#.......###.........###.#.#",
-        "#.###.#######.#####.#.###.#.#####.#######.#.###.#####.#.###.#.#.#.###########.#.#######.###.#.#####.#.###################.###############.#.#",
-        "#...#.#.....#...#...#...#...#.....#.......#.#...#...#.#.#...#.#.#.#...###.....#.#...#...#...#.###...#.#.....#...#...#...#...#.....###...#.#.#",
-        "###.#.#.###.###.#.#####.#####.#####.#######.#.###.#.#.#.#.###.#.#.#.#.###.#####.#.#.#.###.###.###.###.#.###.#.#.#.#.#.#.###.#.###.###.#.#.#.#",
-        "###.#.#...#.....#.....#.....#.....#.#.......#...#.#.#.#.#...#.#.#.#.#...#.....#.#.#.#...#.#...###...#.#...#.#.#.#.#.#.#...#.#.#...#...#.#...#",
-        "###.#.###.###########.#####.#####.#.#.#########.#.#.#.#.###.#.#.#.#.###.#####.#.#.#.###.#.#.#######.#.###.#.#.#.#.#.#.###.#.#.#.###.###.#####",
-        "#...#...#...........#.#.....#.....#...#...#...#.#.#...#.#...#...#.#.#...#.....#.#.#...#.#.#.#######...###.#...#.#.#.#.###.#...#...#...#.#...#",
-        "#.#####.###########.#.#.#####.#########.#.#.#.#.#.#####.#.#######.#.#.###.#####.#.###.#.#.#.#############.#####.#.#.#.###.#######.###.#.#.#.#",
-        "#.#...#.............#...#.....###.......#...#...#...#...#.....#...#.#...#.....#.#.#...#.#.#.###.....#...#...#...#.#.#...#...#...#.###.#...#.#",
-        "#.#.#.###################.#######.#################.#.#######.#.###.###.#####.#.#.#.###.#.#.###.###.#.#.###.#.###.#.###.###.#.#.#.###.#####.#",
-        "#.#.#.#.....#...#...#...#.#.....#...............#...#.......#.#...#...#.###...#...#...#.#...###...#...#.....#.....#.#...#...#.#.#.....#.....#",
-        "#.#.#.#.###.#.#.#.#.#.#.#.#.###.###############.#.#########.#.###.###.#.###.#########.#.#########.#################.#.###.###.#.#######.#####",
-        "#.#.#.#.#...#.#.#.#.#.#...#...#.###...#.........#.........#.#.#...###.#...#...#.......#.#########.................#...###.#...#.#.....#...###",
-        "#.#.#.#.#.###.#.#.#.#.#######.#.###.#.#.#################.#.#.#.#####.###.###.#.#######.#########################.#######.#.###.#.###.###.###",
-        "#.#.#.#.#.#...#...#...###.....#.....#...#.....#...#.....#.#.#.#.#...#...#...#.#...#...#.###...#...#...#.....#...#.....#...#...#.#...#...#...#",
-        "#.#.#.#.#.#.#############.###############.###.#.#.#.###.#.#.#.#.#.#.###.###.#.###.#.#.#.###.#.#.#.#.#.#.###.#.#.#####.#.#####.#.###.###.###.#",
-        "#...#...#...#...#.........#...#.....#...#.#...#.#.#...#.#.#.#.#.#.#.###.#...#.#...#.#.#.###.#.#.#.#.#.#...#...#.......#.......#.....###.#...#",
-        "#############.#.#.#########.#.#.###.#.#.#.#.###.#.###.#.#.#.#.#.#.#.###.#.###.#.###.#.#.###.#.#.#.#.#.###.#############################.#.###",
-        "#...#...#.....#...#.......#.#.#...#.#.#.#.#.#...#.#...#.#.#.#.#.#.#.#...#.#...#.#...#.#.###.#.#.#.#.#...#...........................#...#...#",
-        "#.#.#.#.#.#########.#####.#.#.###.#.#.#.#.#.#.###.#.###.#.#.#.#.#.#.#.###.#.###.#.###.#.###.#.#.#.#.###.###########################.#.#####.#",
-        "#.#...#.#...........#.....#.#.#...#.#.#...#.#...#.#...#.#.#.#.#.#.#...#...#.###.#.#...#.###.#.#.#.#...#.#...........................#...#...#",
-        "#.#####.#############.#####.#.#.###.#.#####.###.#.###.#.#.#.#.#.#.#####.###.###.#.#.###.###.#.#.#.###.#.#.#############################.#.###",
-        "#.....#...#...###...#.#.....#.#.###.#...###.....#.#...#.#.#.#.#.#...###...#...#.#.#.#...#S#.#.#.#...#.#.#.........................#.....#...#",
-        "#####.###.#.#.###.#.#.#.#####.#.###.###.#########.#.###.#.#.#.#.###.#####.###.#.#.#.#.###.#.#.#.###.#.#.#########################.#.#######.#",
-        "#...#...#.#.#.#...#...#...#...#.#...#...#.........#...#.#.#.#.#...#.#.....#...#...#.#.###.#.#...###.#.#...#.....#.................#.....#...#",
-        "#.#.###.#.#.#.#.#########.#.###.#.###.###.###########.#.#.#.#.###.#.#.#####.#######.#.###.#.#######.#.###.#.###.#.#####################.#.###",
-        "#.#.....#...#...#.....#...#...#.#.#...#...#...#...#...#.#.#.#.#...#.#.#...#.....#...#...#.#.###.....#.#...#...#.#.......###.........#...#...#",
-        "#.###############.###.#.#####.#.#.#.###.###.#.#.#.#.###.#.#.#.#.###.#.#.#.#####.#.#####.#.#.###.#####.#.#####.#.#######.###.#######.#.#####.#",
-        "#.#...#...#...#...#...#.....#.#.#.#.###.#...#...#.#...#.#.#...#.....#...#.#...#.#...#...#...#...#.....#.#.....#...#...#.....#.......#.......#",
-        "#.#.#.#.#.#.#.#.###.#######.#.#.#.#.###.#.#######.###.#.#.###############.#.#.#.###.#.#######.###.#####.#.#######.#.#.#######.###############",
-        "#.#.#...#.#.#.#...#...#...#.#...#...#...#...#.....#...#...###.............#.#.#.#...#.....#...#...#.....#.......#.#.#.#.....#.###...#...#...#",
-        "#.#.#####.#.#.###.###.#.#.#.#########.#####.#.#####.#########.#############.#.#.#.#######.#.###.###.###########.#.#.#.#.###.#.###.#.#.#.#.#.#",
-        "#...#.....#.#.#...###...#.#.....###...#...#.#.#...#.........#.#...#.....#...#.#.#.#...#...#...#...#...#.....#...#...#.#.#...#...#.#.#.#.#.#.#",
-        "#####.#####.#.#.#########.#####.###.###.#.#.#.#.#.#########.#.#.#.#.###.#.###.#.#.#.#.#.#####.###.###.#.###.#.#######.#.#.#####.#.#.#.#.#.#.#",
-        "#...#.....#.#...#.........#...#...#...#.#.#.#.#.#...#...#...#.#.#...###.#...#.#.#.#.#...#...#.#...#...#.###.#.......#.#.#...#...#.#.#.#...#.#",
-        "#.#.#####.#.#####.#########.#.###.###.#.#.#.#.#.###.#.#.#.###.#.#######.###.#.#.#.#.#####.#.#.#.###.###.###.#######.#.#.###.#.###.#.#.#####.#",
-        "#.#.......#...###...#.....#.#...#...#.#.#.#.#.#.#...#.#...###...#...#...#...#...#.#.....#.#.#.#...#.#...#...#.......#...###.#.....#...#.....#",
-        "#.###########.#####.#.###.#.###.###.#.#.#.#.#.#.#.###.###########.#.#.###.#######.#####.#.#.#.###.#.#.###.###.#############.###########.#####",
-        "#.#...#.....#.....#...###.#...#...#.#.#.#...#...#.#...#...........#...#...#...###.....#.#.#.#.#...#...###...#...#.........#.#.....#...#.#...#",
-        "#.#.#.#.###.#####.#######.###.###.#.#.#.#########.#.###.###############.###.#.#######.#.#.#.#.#.###########.###.#.#######.#.#.###.#.#.#.#.#.#",
-        "#...#.#...#.#...#...#.....#...#...#.#.#.#.........#.#...#.....#.......#.....#.......#...#.#...#.###...#...#...#...#...#...#.#...#.#.#.#...#.#",
-        "#####.###.#.#.#.###.#.#####.###.###.#.#.#.#########.#.###.###.#.#####.#############.#####.#####.###.#.#.#.###.#####.#.#.###.###.#.#.#.#####.#",
-        "#.....#...#.#.#.#...#.#...#.###.....#...#.#.......#.#.#...#...#.#.....#.....#.......###...#...#.....#...#...#...#...#.#...#...#.#.#.#.#...#.#",
-        "#.#####.###.#.#.#.###.#.#.#.#############.#.#####.#.#.#.###.###.#.#####.###.#.#########.###.#.#############.###.#.###.###.###.#.#.#.#.#.#.#.#",
-        "#.....#...#.#.#.#...#...#.#...........#...#.#...#...#.#.#...#...#...#...###...###...#...#...#.#.............#...#.###.#...#...#.#.#.#.#.#.#.#",
-        "#####.###.#.#.#.###.#####.###########.#.###.#.#.#####.#.#.###.#####.#.###########.#.#.###.###.#.#############.###.###.#.###.###.#.#.#.#.#.#.#",
-        "#.....#...#...#...#.#.....#.......#...#...#.#.#.......#.#...#.#.....#.###.....#...#...#...#...#.............#...#...#.#...#...#.#...#.#.#...#",
-        "#.#####.#########.#.#.#####.#####.#.#####.#.#.#########.###.#.#.#####.###.###.#.#######.###.###############.###.###.#.###.###.#.#####.#.#####",
-        "#...#...#####...#...#.....#.....#...#...#...#...#.....#...#...#.#...#...#.#...#.....#...###...#...#.....#...###...#.#.#...#...#.###...#...###",
-        "###.#.#######.#.#########.#####.#####.#.#######.#.###.###.#####.#.#.###.#.#.#######.#.#######.#.#.#.###.#.#######.#.#.#.###.###.###.#####.###",
-        "#...#.....#...#...........#...#.......#.#.......#.#...#...#.....#.#...#...#.....#...#.....#...#.#.#...#.#...#.....#.#.#.#...#...#...#...#...#",
-        "#.#######.#.###############.#.#########.#.#######.#.###.###.#####.###.#########.#.#######.#.###.#.###.#.###.#.#####.#.#.#.###.###.###.#.###.#",
-        "#.........#.................#...........#.........#.....###.......###...........#.........#.....#.....#.....#.......#...#.....###.....#.....#",
-        "#############################################################################################################################################",
-    ]
-)
-# part1(maze)
-# print(part2(maze))
+if __name__ == "__main__":
+    maze = read_grid(resolve_path("data/day20.txt", __file__))
+    print(part1(maze))
+    print(part2(maze))
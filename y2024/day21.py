@@ -1,7 +1,11 @@
 from enum import StrEnum
-from utils import V2
-import abc
+from utils import V2, iter_lines, resolve_path, track_cache
 import attrs
+import functools
+
+# directional keypads in the chain, the one you press and those robots press
+PART_1_DIRECTIONAL = 3
+PART_2_DIRECTIONAL = 26
 
 
 class KeyStroke(StrEnum):
@@ -13,48 +17,39 @@ class KeyStroke(StrEnum):
 
 
 @attrs.define
-class Keypad(abc.ABC):
+class Keypad:
     grid: list[str]
     coords: dict[str, V2] = attrs.field(init=False)
-    p: V2 = attrs.field(init=False)
+    gap: V2 = attrs.field(init=False)
 
     def __attrs_post_init__(self):
         self.coords = dict()
         for i, row in enumerate(self.grid):
             for j, c in enumerate(row):
-                if c != " ":
-                    self.coords[self.grid[i][j]] = V2(i, j)
-        self.p = self.coords["A"]
-
-    @abc.abstractmethod
-    def _calculate_move_instruction(self, start: V2, end: V2) -> list[KeyStroke]:
-        x_keystroke = KeyStroke.RIGHT if start.y <= end.y else KeyStroke.LEFT
-        y_keystroke = KeyStroke.DOWN if start.x <= end.x else KeyStroke.UP
-        dx = abs(start.x - end.x)
-        dy = abs(start.y - end.y)
-
-        # calculate sequence of keystroke to type in input code from current position
-        # for numeric keyboard, we bias left before down
-        # and up before right to avoid the gapin bottom left.
-        if start.y <= end.y:
-            return [y_keystroke for _ in range(dy)] + [x_keystroke for _ in range(dx)]
-        else:
-            return [x_keystroke for _ in range(dx)] + [y_keystroke for _ in range(dy)]
-
-    def calculate_instruction(self, code: str) -> str:
-        p = self.p
-        instructions = []
-        for c in code:
-            next_p = self.coords[c]
-            instructions.extend(self._calculate_move_instruction(p, next_p))
-            instructions.append(KeyStroke.A)
-            p = next_p
-        return "".join(instructions)
-
-    def apply_code(self, code: str) -> str:
-        instructions = self.calculate_instruction(code)
-        self.p = self.coords[code[-1]]
-        return instructions
+                if c == " ":
+                    self.gap = V2(i, j)
+                else:
+                    self.coords[c] = V2(i, j)
+
+    def move_options(self, start_key: str, end_key: str) -> list[str]:
+        """
+        keystrokes that move from start_key to end_key and press it. Turning
+        more than once never helps the keypad above, so the options are all
+        vertical moves first or all horizontal moves first, less any that
+        pass over the gap.
+        """
+        start, end = self.coords[start_key], self.coords[end_key]
+        x_keystroke = KeyStroke.DOWN if start.x <= end.x else KeyStroke.UP
+        y_keystroke = KeyStroke.RIGHT if start.y <= end.y else KeyStroke.LEFT
+        x_moves = x_keystroke * abs(start.x - end.x)
+        y_moves = y_keystroke * abs(start.y - end.y)
+        options = []
+        # vertical first turns at (end.x, start.y), horizontal first at (start.x, end.y)
+        if V2(end.x, start.y) != self.gap:
+            options.append(x_moves + y_moves + KeyStroke.A)
+        if V2(start.x, end.y) != self.gap and len(x_moves) > 0 and len(y_moves) > 0:
+            options.append(y_moves + x_moves + KeyStroke.A)
+        return options
 
 
 @attrs.define
@@ -69,17 +64,6 @@ class NumericKeypad(Keypad):
         ],
     )
 
-    def _calculate_move_instruction(self, start: V2, end: V2) -> list[KeyStroke]:
-        x_keystroke = KeyStroke.RIGHT if start.y <= end.y else KeyStroke.LEFT
-        y_keystroke = KeyStroke.DOWN if start.x <= end.x else KeyStroke.UP
-        dx = abs(start.x - end.x)
-        dy = abs(start.y - end.y)
-
-        if start.x <= end.x:
-            return [y_keystroke for _ in range(dy)] + [x_keystroke for _ in range(dx)]
-        else:
-            return [x_keystroke for _ in range(dx)] + [y_keystroke for _ in range(dy)]
-
 
 @attrs.define
 class DirectionalKeypad(Keypad):
@@ -91,28 +75,97 @@ class DirectionalKeypad(Keypad):
         ],
     )
 
-    def _calculate_move_instruction(self, start: V2, end: V2) -> list[KeyStroke]:
-        x_keystroke = KeyStroke.RIGHT if start.y <= end.y else KeyStroke.LEFT
-        y_keystroke = KeyStroke.DOWN if start.x <= end.x else KeyStroke.UP
-        dx = abs(start.x - end.x)
-        dy = abs(start.y - end.y)
-
-        if start.x <= end.x:
-            return [x_keystroke for _ in range(dx)] + [y_keystroke for _ in range(dy)]
-        else:
-            return [y_keystroke for _ in range(dy)] + [x_keystroke for _ in range(dx)]
-
-
-def part1(codes: list[str]):
-    keyboards = [
-        NumericKeypad(),
-        DirectionalKeypad(),
-        DirectionalKeypad(),
-        DirectionalKeypad(),
-    ]
-    p_keystrokes = ""
-    for code in codes:
-        for keyboard in keyboards:
-            code = keyboard.apply_code(code)
-        p_keystrokes += code
-    return p_keystrokes
+
+NUMERIC = NumericKeypad()
+DIRECTIONAL = DirectionalKeypad()
+
+
+@track_cache("day21.press_cost")
+@functools.cache
+def press_cost(start_key: str, end_key: str, depth: int, numeric: bool = False) -> int:
+    """
+    your presses for a keypad's robot at start_key to press end_key, with
+    depth directional keypads between you and that keypad. Each depth only
+    needs the costs of the depth below it, so the table has depth * keys^2
+    entries however long the typed sequences grow.
+    """
+    if depth == 0:
+        return 1
+    keypad = NUMERIC if numeric else DIRECTIONAL
+    return min(
+        sequence_cost(option, depth - 1)
+        for option in keypad.move_options(start_key, end_key)
+    )
+
+
+def sequence_cost(keys: str, depth: int, numeric: bool = False) -> int:
+    """your presses for a keypad to type keys, starting and ending on A"""
+    return sum(
+        press_cost(start_key, end_key, depth, numeric)
+        for start_key, end_key in zip(KeyStroke.A + keys, keys)
+    )
+
+
+def best_sequence(keys: str, depth: int, numeric: bool = False) -> str:
+    """
+    the keystrokes you type for one cheapest way to type keys, for debugging
+    as its length grows exponentially with depth
+    """
+    if depth == 0:
+        return keys
+    keypad = NUMERIC if numeric else DIRECTIONAL
+    sequence = []
+    for start_key, end_key in zip(KeyStroke.A + keys, keys):
+        option = min(
+            keypad.move_options(start_key, end_key),
+            key=lambda option: sequence_cost(option, depth - 1),
+        )
+        sequence.append(best_sequence(option, depth - 1))
+    return "".join(sequence)
+
+
+def complexity(codes: list[str], n_directional: int) -> int:
+    return sum(
+        sequence_cost(code, n_directional, numeric=True) * int(code[:-1])
+        for code in codes
+    )
+
+
+def parse_codes(fname: str) -> list[str]:
+    return [line for line in iter_lines(fname) if line]
+
+
+def part1(codes: list[str]) -> int:
+    return complexity(codes, PART_1_DIRECTIONAL)
+
+
+def part2(codes: list[str]) -> int:
+    return complexity(codes, PART_2_DIRECTIONAL)
+
+
+TEST_CODES = ["029A", "980A", "179A", "456A", "379A"]
+
+
+def test_move_options():
+    assert NUMERIC.move_options("A", "1") == ["^<<A"]
+    assert NUMERIC.move_options("7", "0") == [">vvvA"]
+    assert sorted(DIRECTIONAL.move_options("A", "v")) == ["<vA", "v<A"]
+    assert DIRECTIONAL.move_options("A", "A") == ["A"]
+
+
+def test_sequence_cost():
+    assert sequence_cost("029A", 1, numeric=True) == len("<A^A>^^AvvvA")
+    assert sequence_cost("029A", PART_1_DIRECTIONAL, numeric=True) == 68
+    sequence = best_sequence("379A", PART_1_DIRECTIONAL, numeric=True)
+    assert len(sequence) == 64
+
+
+def test_parts():
+    assert part1(TEST_CODES) == 126384
+    assert part2(TEST_CODES) == 154115708116294
+
+
+if __name__ == "__main__":
+    codes = parse_codes(resolve_path("data/day21.txt", __file__))
+    print(part1(codes))
+    print(part2(codes))
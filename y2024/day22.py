@@ -1,4 +1,15 @@
-from collections import defaultdict
+import numpy as np
+
+from utils import read_ints, resolve_path
+
+N_STEPS = 2000
+MASK = (1 << 24) - 1
+# price changes run from -9 to 9, a window of 4 is a base 19 number
+N_CHANGES = 19
+WINDOW = 4
+N_WINDOWS = N_CHANGES**WINDOW
+# buyers whose prices and windows are held at once
+BUYER_CHUNK = 512
 
 
 def next_secret_number(s0: int) -> int:
@@ -8,59 +19,111 @@ def next_secret_number(s0: int) -> int:
     return s3
 
 
-def nth_secret_number(s0: int, n: int) -> int:
-    for _ in range(n):
-        s0 = next_secret_number(s0)
-    return s0
+def next_secret_numbers(secrets: np.ndarray) -> None:
+    """advances a uint32 array of secrets a step in place, as shifts and masks"""
+    secrets ^= (secrets << 6) & MASK
+    secrets ^= secrets >> 5
+    # bits shifted out of the uint32 are masked off anyway
+    secrets ^= (secrets << 11) & MASK
 
 
-def secret_number_seq(s0, n: int) -> list[int]:
-    if n == 0:
-        return []
-    seq = [s0]
+def nth_secret_numbers(numbers: list[int], n: int) -> np.ndarray:
+    secrets = np.array(numbers, dtype=np.uint32)
     for _ in range(n):
-        seq.append(next_secret_number(seq[-1]))
-    return seq
-
-
-def calculate_max_bananas(numbers):
-    seqs = [secret_number_seq(s, 2_000) for s in numbers]
-    prices = [get_price(s) for s in seqs]
-    price_diffs = [calculate_price_diff(s) for s in prices]
-
-    code_values = defaultdict(int)
-    for price, price_diff in zip(prices, price_diffs):
-        assert len(price) == len(price_diff) + 1
-        for i in range(0, len(price_diff) - 3):
-            key = tuple(price_diff[i : i + 4])
-            code_values[key] += price[i + 4]
-
-
-def calculate_code_values(s):
-    seq = secret_number_seq(s, 2_000)
-    prices = [n % 10 for n in seq]
-    price_diffs = [prices[i] - prices[i + 1] for i in range(len(prices) - 1)]
-    code_values = dict()
-    for i in range(0, len(price_diffs) - 3):
-        key = tuple(price_diffs[i : i + 4])
-        if key not in code_values:
-            code_values[key] = prices[i + 4]
-    return code_values
-
-
-def part1():
-    with open("data/day22.txt") as f:
-        numbers = [int(l.strip()) for l in f]
-    total = sum([nth_secret_number(s, 2000) for s in numbers])
-    print(total)
-
-
-def part2():
-    with open("data/day22.txt") as f:
-        numbers = [int(l.strip()) for l in f]
-    all_code_values = [calculate_code_values(s) for s in numbers]
-    merged_code_values = defaultdict(int)
-    for code_values in all_code_values:
-        for k, v in code_values.items():
-            merged_code_values[k] += v
-    print(sorted(merged_code_values.items(), key=lambda x: -x[1])[0])
+        next_secret_numbers(secrets)
+    return secrets
+
+
+def prices(numbers: list[int], n: int) -> np.ndarray:
+    """(n + 1, n_buyers) last digits of each buyer's secrets"""
+    secrets = np.array(numbers, dtype=np.uint32)
+    digits = np.empty((n + 1, len(secrets)), dtype=np.int8)
+    digits[0] = secrets % 10
+    for i in range(1, n + 1):
+        next_secret_numbers(secrets)
+        digits[i] = secrets % 10
+    return digits
+
+
+def window_indices(digits: np.ndarray) -> np.ndarray:
+    """base 19 index of the 4 changes ending at each price from the 5th on"""
+    changes = np.diff(digits, axis=0).astype(np.int32) + 9
+    indices = np.zeros((len(changes) - WINDOW + 1, changes.shape[1]), dtype=np.int32)
+    for i in range(WINDOW):
+        indices *= N_CHANGES
+        indices += changes[i : len(changes) - WINDOW + 1 + i]
+    return indices
+
+
+def sequence_totals(numbers: list[int], n: int = N_STEPS) -> np.ndarray:
+    """
+    bananas bought with each window of changes, indexed by window_indices.
+    Buyers sell the first time a window comes up. A stamp per window holds
+    the last buyer that saw it, packed with how early that buyer saw it, so
+    a buyer's first sightings win over its later ones and no flags are ever
+    cleared between buyers. Each chunk's first sales are summed in one
+    bincount.
+    """
+    n_sales = n - WINDOW + 1
+    assert len(numbers) * n_sales < np.iinfo(np.int32).max, "stamps overflow"
+    totals = np.zeros(N_WINDOWS, dtype=np.int64)
+    stamp = np.full(N_WINDOWS, -1, dtype=np.int32)
+    # larger for earlier steps, so the maximum is a window's first sighting
+    steps_left = np.arange(n_sales - 1, -1, -1, dtype=np.int32)
+    for start in range(0, len(numbers), BUYER_CHUNK):
+        digits = prices(numbers[start : start + BUYER_CHUNK], n)
+        # one row per buyer
+        indices = np.ascontiguousarray(window_indices(digits).T)
+        sold_at = digits[WINDOW:].T
+        is_first = np.empty(indices.shape, dtype=bool)
+        for i, keys in enumerate(indices):
+            stamps = (start + i) * n_sales + steps_left
+            np.maximum.at(stamp, keys, stamps)
+            np.equal(stamp[keys], stamps, out=is_first[i])
+        totals += np.bincount(
+            indices[is_first], weights=sold_at[is_first], minlength=N_WINDOWS
+        ).astype(np.int64)
+    return totals
+
+
+def parse_numbers(fname: str) -> list[int]:
+    return read_ints(fname).tolist()
+
+
+def part1(numbers: list[int]) -> int:
+    return int(nth_secret_numbers(numbers, N_STEPS).sum(dtype=np.int64))
+
+
+def part2(numbers: list[int]) -> int:
+    return int(sequence_totals(numbers).max())
+
+
+def test_next_secret_numbers():
+    secrets = nth_secret_numbers([123], 10)
+    s = 123
+    for _ in range(10):
+        s = next_secret_number(s)
+    assert secrets.tolist() == [s] == [5908254]
+
+
+def test_parts():
+    assert part1([1, 10, 100, 2024]) == 37327623
+    assert part2([1, 2, 3, 2024]) == 23
+    # -2,1,-1,3 is the best window
+    index = (((-2 + 9) * 19 + (1 + 9)) * 19 + (-1 + 9)) * 19 + (3 + 9)
+    assert sequence_totals([1, 2, 3, 2024])[index] == 23
+
+
+def test_first_sale_only():
+    digits = prices([123], 9)
+    assert digits[:, 0].tolist() == [3, 0, 6, 5, 4, 4, 6, 4, 4, 2]
+    # changes -3,6,-1,-1 then 0,2,-2,0 and so on, every window is seen once
+    totals = sequence_totals([123], 9)
+    assert totals.sum() == sum([4, 4, 6, 4, 4, 2])
+    assert sequence_totals([123, 123], 9).max() == 12
+
+
+if __name__ == "__main__":
+    numbers = parse_numbers(resolve_path("data/day22.txt", __file__))
+    print(part1(numbers))
+    print(part2(numbers))
@@ -1,59 +1,168 @@
 from collections import defaultdict
-import math
-import functools
-import networkx as nx
+from dataclasses import dataclass
+from typing import Iterator
+
+from utils import iter_lines, resolve_path
 
 Graph = dict[str, set[str]]
 
 
-def to_nx_graph(graph):
-    nx_graph = nx.Graph()
-    for node, adj_nodes in graph.items():
-        nx_graph.add_node(node)
-        nx_graph.add_edges_from([(node, adj_node) for adj_node in adj_nodes])
-    return nx_graph
+def _bits(x: int) -> Iterator[int]:
+    """indices of the set bits of x, lowest first"""
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+
+def _above(i: int) -> int:
+    """mask of the bits above bit i, up to any width"""
+    return -1 << (i + 1)
+
+
+@dataclass
+class LanGraph:
+    """nodes numbered in sorted name order, sets of nodes are int bitsets"""
+
+    names: list[str]
+    # bit j of adjacency[i] is set when i and j are linked
+    adjacency: list[int]
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "LanGraph":
+        names = sorted(graph.keys() | {n for adj in graph.values() for n in adj})
+        ids = {name: i for i, name in enumerate(names)}
+        adjacency = [0] * len(names)
+        for node, adj_nodes in graph.items():
+            for adj_node in adj_nodes:
+                adjacency[ids[node]] |= 1 << ids[adj_node]
+                adjacency[ids[adj_node]] |= 1 << ids[node]
+        return cls(names, adjacency)
 
+    @property
+    def all_nodes(self) -> int:
+        return (1 << len(self.names)) - 1
 
-def get_filtered_graph(graph, filter_fn):
-    new_graph = dict()
+    def nodes_where(self, keep) -> int:
+        mask = 0
+        for i, name in enumerate(self.names):
+            if keep(name):
+                mask |= 1 << i
+        return mask
 
-    for node, adj_nodes in graph.items():
-        if filter_fn(node):
-            new_graph[node] = {e for e in adj_nodes if filter_fn(e)}
-    return new_graph
+    def triangles(self, nodes: int = -1) -> Iterator[tuple[int, int, int]]:
+        """every triangle within nodes once, as i < j < k"""
+        adjacency = self.adjacency
+        for i in _bits(nodes & self.all_nodes):
+            later = adjacency[i] & nodes & _above(i)
+            for j in _bits(later):
+                for k in _bits(later & adjacency[j] & _above(j)):
+                    yield i, j, k
+
+    def count_triangles(self, nodes: int = -1) -> int:
+        """len(list(triangles(nodes))) without building the triangles"""
+        adjacency = self.adjacency
+        total = 0
+        for i in _bits(nodes & self.all_nodes):
+            later = adjacency[i] & nodes & _above(i)
+            for j in _bits(later):
+                total += (later & adjacency[j] & _above(j)).bit_count()
+        return total
+
+    def max_clique(self) -> int:
+        """
+        Bron-Kerbosch over bitsets, pivoting on the candidate or excluded
+        node with the most candidate neighbors so only candidates outside
+        its neighborhood are branched on. Branches that cannot beat the
+        best clique so far are cut.
+        """
+        adjacency = self.adjacency
+        best, best_size = 0, 0
+
+        def expand(clique: int, size: int, candidates: int, excluded: int) -> None:
+            nonlocal best, best_size
+            if candidates == 0:
+                if size > best_size:
+                    best, best_size = clique, size
+                return
+            if size + candidates.bit_count() <= best_size:
+                return
+            pivot = max(
+                _bits(candidates | excluded),
+                key=lambda u: (candidates & adjacency[u]).bit_count(),
+            )
+            for v in _bits(candidates & ~adjacency[pivot]):
+                bit = 1 << v
+                expand(
+                    clique | bit,
+                    size + 1,
+                    candidates & adjacency[v],
+                    excluded & adjacency[v],
+                )
+                candidates &= ~bit
+                excluded |= bit
+
+        expand(0, 0, self.all_nodes, 0)
+        return best
 
 
 def read_graph_from_file(fname):
     graph = defaultdict(set)
-    with open(fname) as f:
-        for line in f:
-            line = line.strip()
-            n1 = line[:2]
-            n2 = line[3:]
-            graph[n1].add(n2)
-            graph[n2].add(n1)
+    for line in iter_lines(fname):
+        n1 = line[:2]
+        n2 = line[3:]
+        graph[n1].add(n2)
+        graph[n2].add(n1)
     return graph
 
 
-def count_special_cliques(graph):
-    # a special clique is a clique of size 3 in which at least 1 node starts with t
-    nx_graph = to_nx_graph(graph)
-    total = 0
-    cliques = list(nx.find_cliques(nx_graph))
-    for clique in cliques:
-        n_nodes = len(clique)
-        if n_nodes > 3:
-            n_t_nodes = len([x for x in clique if x[0] == "t"])
-            for i in range(1, min(n_t_nodes, 3) + 1):
-                total += math.comb(n_t_nodes, i) * math.comb(n_nodes - n_t_nodes, 3 - i)
-    return total
+def part1(graph):
+    # triangles with a t node are all triangles less those without one
+    lan = LanGraph.from_graph(graph)
+    without_t = lan.nodes_where(lambda name: name[0] != "t")
+    return lan.count_triangles() - lan.count_triangles(without_t)
 
 
-def part1(graph):
-    def filter_fn(node, graph):
-        return node[0] == "t" or any([n[0] == "t" for n in graph[node]])
+def part2(graph):
+    lan = LanGraph.from_graph(graph)
+    return ",".join(lan.names[i] for i in _bits(lan.max_clique()))
+
+
+TEST_EDGES = """
+kh-tc qp-kh de-cg ka-co yn-aq qp-ub cg-tb vc-aq tb-ka wh-tc yn-cg kh-ub ta-co
+de-co tc-td tb-wq wh-td ta-ka td-qp aq-cg wq-ub ub-vc de-ta wq-aq wq-vc wh-yn
+ka-de kh-ta co-tc wh-qp tb-vc td-yn
+"""
+
+
+def _test_graph() -> Graph:
+    graph = defaultdict(set)
+    for edge in TEST_EDGES.split():
+        n1, n2 = edge.split("-")
+        graph[n1].add(n2)
+        graph[n2].add(n1)
+    return graph
+
+
+def test_triangles():
+    lan = LanGraph.from_graph(_test_graph())
+    triangles = [",".join(lan.names[i] for i in t) for t in lan.triangles()]
+    assert len(triangles) == lan.count_triangles() == 12
+    assert "aq,cg,yn" in triangles
+    assert part1(_test_graph()) == 7
+
+
+def test_max_clique():
+    assert part2(_test_graph()) == "co,de,ka,ta"
+    # two 4-cliques sharing a node, the maximal clique of 5 wins
+    graph = defaultdict(set)
+    for clique in ["abcd", "aefg", "hijkl"]:
+        for n1 in clique:
+            graph[n1] |= set(clique) - {n1}
+    assert part2(graph) == "h,i,j,k,l"
+
 
-    filtered_graph = get_filtered_graph(
-        graph, functools.partial(filter_fn, graph=graph)
-    )
-    print(count_special_cliques(filtered_graph))
+if __name__ == "__main__":
+    graph = read_graph_from_file(resolve_path("data/day23.txt", __file__))
+    print(part1(graph))
+    print(part2(graph))
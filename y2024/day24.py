@@ -3,6 +3,8 @@ import abc
 from typing import Literal
 import re
 
+from utils import parse_ints, read_text, resolve_path
+
 
 class Node(abc.ABC):
     @abc.abstractmethod
@@ -46,37 +48,37 @@ class NoopNode:
 
 def parse_nodes(fname) -> dict[str, Node]:
     nodes = dict()
-    with open(fname) as f:
-        for line in f:
-            name, new_node = None, None
-            if (match := re.match(r"([a-z0-9]{3}): ([0,1])", line)) is not None:
-                name, val = match.groups()
-                new_node = ValNode(int(val))
-            elif (
-                match := re.match(
-                    r"([a-z0-9]{3}) (XOR|AND|OR) ([a-z0-9]{3}) -> ([a-z0-9]{3})", line
-                )
-            ) is not None:
-                lhs, operator, rhs, name = match.groups()
-                if lhs not in nodes:
-                    nodes[lhs] = NoopNode()
-                if rhs not in nodes:
-                    nodes[rhs] = NoopNode()
-                new_node = OpNode(nodes[lhs], nodes[rhs], operator)
-            if name is not None:
-                if name not in nodes:
-                    nodes[name] = new_node
-                else:
-                    assert isinstance(nodes[name], NoopNode)
-                    nodes[name].node = new_node
+    wires_str, gates_str = read_text(fname).split("\n\n")
+    # "x00: 1" lines, each gives the wire's number and then its value
+    names = re.findall(r"^([a-z0-9]{3}):", wires_str, re.MULTILINE)
+    values = parse_ints(wires_str, n_cols=2)[:, 1].tolist()
+    for name, val in zip(names, values, strict=True):
+        nodes[name] = ValNode(val)
+    for match in re.finditer(
+        r"([a-z0-9]{3}) (XOR|AND|OR) ([a-z0-9]{3}) -> ([a-z0-9]{3})", gates_str
+    ):
+        lhs, operator, rhs, name = match.groups()
+        if lhs not in nodes:
+            nodes[lhs] = NoopNode()
+        if rhs not in nodes:
+            nodes[rhs] = NoopNode()
+        new_node = OpNode(nodes[lhs], nodes[rhs], operator)
+        if name not in nodes:
+            nodes[name] = new_node
+        else:
+            assert isinstance(nodes[name], NoopNode)
+            nodes[name].node = new_node
     for name, node in nodes.items():
         if isinstance(node, NoopNode):
             assert node.node is not None
     return nodes
 
 
-def part_1():
-    nodes = parse_nodes("./data/day24.txt")
+def part_1(nodes: dict[str, Node]) -> int:
     z_node_names = sorted([n for n in nodes if n[0] == "z"], reverse=True)
     z_values = [nodes[n].value() for n in z_node_names]
-    print(int("".join([str(i) for i in z_values]), 2))
+    return int("".join([str(i) for i in z_values]), 2)
+
+
+if __name__ == "__main__":
+    print(part_1(parse_nodes(resolve_path("data/day24.txt", __file__))))
@@ -1,6 +1,6 @@
 from typing import List
 import itertools
-from utils import V2
+from utils import V2, iter_lines, resolve_path
 
 Grid = List[str]
 
@@ -71,9 +71,19 @@ def find_xmas_count(grid: Grid):
     return count
 
 
-grid = []
-with open("data/day4.txt") as f:
-    grid = [line.strip() for line in f]
+def parse_grid(fname: str) -> Grid:
+    return list(iter_lines(fname))
 
-find_word_count("XMAS", grid)
-print(find_xmas_count(grid))
+
+def part_1(grid: Grid) -> int:
+    return find_word_count("XMAS", grid)
+
+
+def part_2(grid: Grid) -> int:
+    return find_xmas_count(grid)
+
+
+if __name__ == "__main__":
+    grid = parse_grid(resolve_path("data/day4.txt", __file__))
+    print(part_1(grid))
+    print(part_2(grid))
@@ -3,6 +3,9 @@ import functools
 from typing import Tuple
 import re
 
+from utils import iter_lines, resolve_path
+
+
 @dataclass(frozen=True)
 class PageRule:
     n1: int
@@ -26,21 +29,23 @@ def sort_update(
     return sorted(updates, key=functools.cmp_to_key(cmp))
 
 
-assert sort_update([1, 2], []) == [1, 2]
-assert sort_update([1, 2], [PageRule(2, 1)]) == [2, 1]
-assert sort_update([1, 2], [PageRule(2, 1)]) == [2, 1]
+def test_sort_update():
+    assert sort_update([1, 2], []) == [1, 2]
+    assert sort_update([1, 2], [PageRule(2, 1)]) == [2, 1]
+    assert sort_update([1, 2], [PageRule(2, 1)]) == [2, 1]
 
 
-def read_inputs() -> Tuple[list[PageRule], list[list[int]]]:
+def read_inputs(
+    fname: str = resolve_path("data/day5.txt", __file__),
+) -> Tuple[list[PageRule], list[list[int]]]:
     rules, updates = [], []
-    with open("data/day5.txt") as f:
-        for line in f:
-            if (match := re.match(r"(\d+)\|(\d+)", line)) is not None:
-                n1, n2 = match.groups()
-                rules.append(PageRule(int(n1), int(n2)))
-            elif re.match(r"[\d,]+\d", line) is not None:
-                nums = line.split(",")
-                updates.append([int(n) for n in nums])
+    for line in iter_lines(fname):
+        if (match := re.match(r"(\d+)\|(\d+)", line)) is not None:
+            n1, n2 = match.groups()
+            rules.append(PageRule(int(n1), int(n2)))
+        elif re.match(r"[\d,]+\d", line) is not None:
+            nums = line.split(",")
+            updates.append([int(n) for n in nums])
     return rules, updates
 
 
@@ -53,7 +58,8 @@ def is_valid_page_order(updates: list[int], rules: list[PageRule]) -> bool:
     return True
 
 
-def part_1(updates: list[list[int]], rules: list[PageRule]):
+def part_1(problem: Tuple[list[PageRule], list[list[int]]]):
+    rules, updates = problem
     total = 0
     for update in updates:
         if is_valid_page_order(update, rules):
@@ -61,7 +67,8 @@ def part_1(updates: list[list[int]], rules: list[PageRule]):
     return total
 
 
-def part_2(updates: list[list[int]], rules: list[PageRule]):
+def part_2(problem: Tuple[list[PageRule], list[list[int]]]):
+    rules, updates = problem
     total = 0
     for update in updates:
         if not is_valid_page_order(update, rules):
@@ -70,5 +77,5 @@ def part_2(updates: list[list[int]], rules: list[PageRule]):
     return total
 
 
-rules, updates = read_inputs()
-print(part_2(updates, rules))
+if __name__ == "__main__":
+    print(part_2(read_inputs()))
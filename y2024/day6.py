@@ -1,6 +1,10 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from enum import StrEnum
 from typing import Tuple
-from utils import V2, Grid
+
+from utils import V2, Grid, counted, iter_lines, phase, resolve_path
 
 
 class Direction(StrEnum):
@@ -44,6 +48,7 @@ def find_guard(grid: Grid) -> Tuple[Direction, V2]:
     raise ValueError("Not found")
 
 
+@counted("day6.segments_walked")
 def traverse(
     direction: Direction,
     position: V2,
@@ -76,39 +81,155 @@ def count_visited_positions(grid: Grid) -> int:
     return len({x[1] for x in visited})
 
 
-def is_valid_loop(grid: Grid) -> bool:
-    direction, position = find_guard(grid)
-    visited = set()
-    is_inbound = True
-    while (direction, position) not in visited and is_inbound:
-        visited_positions, is_inbound = traverse(direction, position, grid)
-        for visited_position in visited_positions:
-            visited.add((direction, visited_position))
-        position = visited_positions[-1]
-        direction = rotate(direction)
-    return is_inbound
+# rotation order of the guard, turning right moves one index on
+TURN_ORDER = [Direction.UP, Direction.RIGHT, Direction.DOWN, Direction.LEFT]
+OPEN, WALL, EXIT = 0, 1, 2
 
 
-def replace_char(s: str, idx: int, c: str) -> str:
-    return s[:idx] + c + s[idx + 1 :]
+@dataclass
+class GuardMap:
+    """
+    the grid packed row major with a ring of EXIT cells around it, so every
+    walk ends on a cell instead of an index check. A guard state is
+    cell * 4 + index into TURN_ORDER.
+    """
 
+    width: int
+    kinds: bytearray
+    # cell offset of one step in each TURN_ORDER direction
+    steps: list[int]
+    # jumps[d][cell], the last cell before a wall going in direction d or
+    # the exit cell if there is none
+    jumps: list[list[int]]
+    start: int
 
-def count_potential_loops(grid: Grid) -> int:
-    count = 0
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            print(i, j)
-            if grid[i][j] == ".":
-                grid[i] = replace_char(grid[i], j, "#")
-                if is_valid_loop(grid):
-                    count += 1
-                grid[i] = replace_char(grid[i], j, ".")
-    return count
-
-
-with open("data/day6.txt") as f:
-    grid = [r.strip() for r in f]
-test_grid = [
+    @classmethod
+    def from_grid(cls, grid: Grid) -> "GuardMap":
+        direction, position = find_guard(grid)
+        width = len(grid[0]) + 2
+        kinds = bytearray([EXIT]) * (width * (len(grid) + 2))
+        for i, row in enumerate(grid):
+            offset = (i + 1) * width + 1
+            kinds[offset : offset + len(row)] = bytes(
+                WALL if c == "#" else OPEN for c in row
+            )
+        steps = [-width, 1, width, -1]
+        jumps = []
+        for step in steps:
+            jump = list(range(len(kinds)))
+            # cells are filled after the cell one step ahead of them
+            order = range(len(kinds) - 1, -1, -1) if step > 0 else range(len(kinds))
+            for cell in order:
+                if kinds[cell] != OPEN:
+                    continue
+                ahead = cell + step
+                if kinds[ahead] == OPEN:
+                    jump[cell] = jump[ahead]
+                elif kinds[ahead] == EXIT:
+                    jump[cell] = ahead
+            jumps.append(jump)
+        start = ((position.x + 1) * width + position.y + 1) * 4
+        return cls(width, kinds, steps, jumps, start + TURN_ORDER.index(direction))
+
+    def obstacle_candidates(self) -> dict[int, int]:
+        """
+        cells on the guard's path, except the start, mapped to the state
+        the guard is in right before first stepping onto them. Only these
+        cells change the path when blocked, and the walk up to that state
+        is the same with the obstacle.
+        """
+        kinds, steps = self.kinds, self.steps
+        cell, d = divmod(self.start, 4)
+        candidates = {}
+        while True:
+            ahead = cell + steps[d]
+            if kinds[ahead] == WALL:
+                d = (d + 1) & 3
+                continue
+            if kinds[ahead] == EXIT:
+                return candidates
+            if ahead != self.start // 4 and ahead not in candidates:
+                candidates[ahead] = cell * 4 + d
+            cell = ahead
+
+
+@counted("day6.loop_checks")
+def loops_with_obstacle(
+    guard_map: GuardMap,
+    state: int,
+    obstacle: int,
+    seen: bytearray,
+) -> bool:
+    """
+    jumps wall to wall from state with an extra wall at obstacle until the
+    guard exits or repeats a turn. seen is a zeroed bitmap over all states,
+    it is zeroed again before returning.
+    """
+    jumps, steps, kinds = guard_map.jumps, guard_map.steps, guard_map.kinds
+    width = guard_map.width
+    cell, d = divmod(state, 4)
+    touched = []
+    is_loop = False
+    while True:
+        step = steps[d]
+        end = jumps[d][cell]
+        if step > 0:
+            blocked = cell < obstacle <= end
+        else:
+            blocked = end <= obstacle < cell
+        # a vertical jump only spans one column of the packed range
+        if blocked and (step in (1, -1) or (obstacle - cell) % width == 0):
+            end = obstacle - step
+        if kinds[end] == EXIT:
+            break
+        cell, d = end, (d + 1) & 3
+        state = cell * 4 + d
+        if seen[state]:
+            is_loop = True
+            break
+        seen[state] = 1
+        touched.append(state)
+    for state in touched:
+        seen[state] = 0
+    return is_loop
+
+
+def count_loops(guard_map: GuardMap, trials: list[tuple[int, int]]) -> int:
+    """trials are (obstacle, state before it) pairs"""
+    seen = bytearray(len(guard_map.kinds) * 4)
+    return sum(
+        loops_with_obstacle(guard_map, state, obstacle, seen)
+        for obstacle, state in trials
+    )
+
+
+def count_potential_loops(grid: Grid, processes: int | None = 1) -> int:
+    """processes=None uses every core"""
+    with phase("jump_tables"):
+        guard_map = GuardMap.from_grid(grid)
+    trials = list(guard_map.obstacle_candidates().items())
+    with phase("obstacle_trials"):
+        if processes == 1:
+            return count_loops(guard_map, trials)
+        n_chunks = 4 * (processes or os.cpu_count() or 1)
+        chunks = [trials[i::n_chunks] for i in range(n_chunks)]
+        with ProcessPoolExecutor(processes) as pool:
+            return sum(pool.map(count_loops, [guard_map] * n_chunks, chunks))
+
+
+def parse_grid(fname: str) -> Grid:
+    return list(iter_lines(fname))
+
+
+def part_1(grid: Grid) -> int:
+    return count_visited_positions(grid)
+
+
+def part_2(grid: Grid) -> int:
+    return count_potential_loops(grid)
+
+
+TEST_GRID = [
     "....#.....",
     ".........#",
     "..........",
@@ -120,9 +241,25 @@ test_grid = [
     "#.........",
     "......#...",
 ]
-assert count_visited_positions(test_grid) == 41
-assert count_visited_positions(grid) == 5131
 
 
-print(count_potential_loops(test_grid))
-print(count_potential_loops(grid))
+def test_count_visited_positions():
+    assert count_visited_positions(TEST_GRID) == 41
+
+
+def test_count_potential_loops():
+    assert count_potential_loops(TEST_GRID) == 6
+    assert count_potential_loops(TEST_GRID, processes=2) == 6
+
+
+def test_obstacle_candidates():
+    guard_map = GuardMap.from_grid(TEST_GRID)
+    # every visited cell but the start
+    assert len(guard_map.obstacle_candidates()) == 40
+
+
+if __name__ == "__main__":
+    grid = parse_grid(resolve_path("data/day6.txt", __file__))
+    assert count_visited_positions(grid) == 5131
+
+    print(count_potential_loops(grid, processes=None))
@@ -1,6 +1,8 @@
 from typing import Literal
 from dataclasses import dataclass
 
+from utils import iter_lines, resolve_path
+
 
 @dataclass
 class Problem:
@@ -41,9 +43,10 @@ def find_valid_equation(
     return sub_equation
 
 
-assert find_valid_equation(190, [10, 19]) == ["*"]
-assert find_valid_equation(292, [11, 6, 16, 20]) == ["+", "*", "+"]
-assert find_valid_equation(3267, [81, 40, 27]) == ["*", "+"]
+def test_find_valid_equation():
+    assert find_valid_equation(190, [10, 19]) == ["*"]
+    assert find_valid_equation(292, [11, 6, 16, 20]) == ["+", "*", "+"]
+    assert find_valid_equation(3267, [81, 40, 27]) == ["*", "+"]
 
 
 def part_1(problems: list[Problem]) -> int:
@@ -54,13 +57,16 @@ def part_1(problems: list[Problem]) -> int:
     return total
 
 
-problems = []
-with open("data/day7.txt") as f:
-    for line in f:
+def parse_problems(fname: str) -> list[Problem]:
+    problems = []
+    for line in iter_lines(fname):
         target, numbers = line.split(": ")
         target = int(target)
         numbers = numbers.split(" ")
         numbers = [int(n) for n in numbers]
         problems.append(Problem(target, numbers))
+    return problems
+
 
-print(part_1(problems))
+if __name__ == "__main__":
+    print(part_1(parse_problems(resolve_path("data/day7.txt", __file__))))
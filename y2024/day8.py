@@ -1,4 +1,4 @@
-from utils import V2, Grid, is_inbounds
+from utils import V2, Grid, is_inbounds, iter_lines, resolve_path
 from collections import defaultdict
 
 
@@ -74,8 +74,21 @@ test_grid = [
     "............",
     "............",
 ]
-with open("data/day8.txt") as f:
-    grid = [line.strip() for line in f]
 
-# print(len(get_all_antinode_positions(grid)))
-print(len(get_all_antinode_positions_v2(grid)))
+
+def parse_grid(fname: str) -> Grid:
+    return list(iter_lines(fname))
+
+
+def part_1(grid: Grid) -> int:
+    return len(get_all_antinode_positions(grid))
+
+
+def part_2(grid: Grid) -> int:
+    return len(get_all_antinode_positions_v2(grid))
+
+
+if __name__ == "__main__":
+    grid = parse_grid(resolve_path("data/day8.txt", __file__))
+    # print(part_1(grid))
+    print(part_2(grid))
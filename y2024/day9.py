@@ -1,139 +1,111 @@
-from dataclasses import dataclass
+import heapq
 from typing import Tuple
-import bisect
-import copy
-
-
-@dataclass(frozen=True)
-class Space:
-    start: int
-    length: int
-
-    def split(self, length: int) -> Tuple["Space", "Space"]:
-        assert 0 < length < self.length
-        return (
-            Space(self.start, length),
-            Space(self.start + length, self.length - length),
-        )
-
-
-@dataclass(frozen=True)
-class File:
-    id: int
-    space: Space
-
-    def checksum(self) -> int:
-        id, space = self.id, self.space
-        return id * sum(range(space.start, space.start + space.length))
-
-
-def parse_compact_format(disk_map: str) -> Tuple[list[File], list[Space]]:
-    files = []
-    free_spaces = []
-    file_id = 0
-    offset = 0
-    is_file = True
-    for length in disk_map:
-        length = int(length)
-        if length > 0:
-            space = Space(offset, length)
-            offset += length
-            if is_file:
-                files.append(File(file_id, space))
-                file_id += 1
-            else:
-                free_spaces.append(space)
-        is_file = not is_file
-    return files, free_spaces
-
-
-def move_files(files: list[File], spaces: list[Space]) -> list[File]:
-    while (
-        len(files) > 0 and len(spaces) > 0 and files[-1].space.start >= spaces[0].start
+
+import numpy as np
+
+from utils import read_text, resolve_path
+
+# gaps are a single digit long
+MAX_GAP = 9
+
+
+def span_checksum(file_id: int, start: int, length: int) -> int:
+    """file_id times the sum of the block positions start..start+length-1"""
+    return file_id * (length * start + length * (length - 1) // 2)
+
+
+def parse_lengths(disk_map: str) -> Tuple[list[int], list[int], list[int]]:
+    """file lengths, gap lengths and every file's start block"""
+    lengths = np.frombuffer(disk_map.encode(), dtype=np.uint8) - ord("0")
+    starts = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    return lengths[0::2].tolist(), lengths[1::2].tolist(), starts[0::2].tolist()
+
+
+def compact_blocks_checksum(disk_map: str) -> int:
+    """
+    fills gaps from the left with single blocks of the right most file,
+    walking both ends towards each other
+    """
+    file_lengths, gap_lengths, _ = parse_lengths(disk_map)
+    right = len(file_lengths) - 1
+    remaining = file_lengths[right]
+    total = 0
+    position = 0
+    for left in range(len(file_lengths)):
+        if left == right:
+            total += span_checksum(left, position, remaining)
+            break
+        total += span_checksum(left, position, file_lengths[left])
+        position += file_lengths[left]
+        gap = gap_lengths[left]
+        while gap > 0 and right > left:
+            moved = min(gap, remaining)
+            total += span_checksum(right, position, moved)
+            position += moved
+            gap -= moved
+            remaining -= moved
+            if remaining == 0:
+                right -= 1
+                remaining = file_lengths[right]
+        if left >= right:
+            break
+    return total
+
+
+def compact_files_checksum(disk_map: str) -> int:
+    """
+    moves whole files, right most first, into the left most gap that fits
+    them. Gap starts are kept in one min heap per gap length, so the left
+    most fitting gap is the smallest top of heaps[length:].
+    """
+    file_lengths, gap_lengths, file_starts = parse_lengths(disk_map)
+    heaps: list[list[int]] = [[] for _ in range(MAX_GAP + 1)]
+    for file_start, file_length, gap_length in zip(
+        file_starts, file_lengths, gap_lengths
     ):
-        space = spaces.pop(0)  # allocating first available space
-        file = files.pop()  # moving file from the back
-
-        if file.space.length < space.length:
-            new_file_space, new_space = space.split(file.space.length)
-            bisect.insort(
-                files, File(file.id, new_file_space), key=lambda x: x.space.start
-            )
-            bisect.insort(spaces, new_space, key=lambda x: x.start)
-        elif file.space.length == space.length:
-            bisect.insort(files, File(file.id, space), key=lambda x: x.space.start)
-        else:
-            old_file_space, _ = file.space.split(file.space.length - space.length)
-            bisect.insort(
-                files, File(file.id, old_file_space), key=lambda x: x.space.start
-            )
-            bisect.insort(files, File(file.id, space), key=lambda x: x.space.start)
-    return files
-
-
-def move_files_2(files: list[File], spaces: list[Space]) -> list[File]:
-    final_files = []
-    for file in reversed(files):  # moving right most files first
-        new_file = file
-        for i, space in enumerate(spaces):
-            if space.start < file.space.start:
-                if space.length == file.space.length:
-                    spaces.pop(i)
-                    new_file = File(file.id, space)
-                    break
-                elif space.length > file.space.length:
-                    spaces.pop(i)
-                    new_file_space, new_space = space.split(file.space.length)
-                    new_file = File(file.id, new_file_space)
-                    bisect.insort(spaces, new_space, key=lambda x: x.start)
-                    break
-        final_files.append(new_file)
-    final_files.sort(key=lambda x: x.space.start)
-    return final_files
-
-
-def merge_continuous_files(files: list[File]):
-    if len(files) == 0:
-        return []
-
-    output_files = []
-    current_file = files[0]
-    for file in files[1:]:
-        if current_file.id == file.id:
-            current_file = File(
-                current_file.id,
-                Space(
-                    current_file.space.start,
-                    current_file.space.length + file.space.length,
-                ),
-            )
-        else:
-            output_files.append(current_file)
-            current_file = file
-    output_files.append(current_file)
-    return output_files
-
-
-def compute_checksum(files: list[File]) -> int:
-    return sum([x.checksum() for x in files])
-
-
-test_compact = "2333133121414131402"
-files, spaces = parse_compact_format(test_compact)
-moved_files = move_files(files, spaces)
-print(compute_checksum(moved_files))
-
-with open("data/day9.txt") as f:
-    full_compact = f.read().strip()
-files, spaces = parse_compact_format(full_compact)
-moved_files = move_files(files, spaces)
-print(compute_checksum(moved_files))
-
-
-files, spaces = parse_compact_format(test_compact)
-moved_files = move_files_2(files, spaces)
-print(compute_checksum(moved_files))
-
-files, spaces = parse_compact_format(full_compact)
-moved_files = move_files_2(files, spaces)
-print(compute_checksum(moved_files))
+        # gaps are pushed left to right, so every list is already a heap
+        heaps[gap_length].append(file_start + file_length)
+
+    total = 0
+    for file_id in range(len(file_lengths) - 1, -1, -1):
+        length, start = file_lengths[file_id], file_starts[file_id]
+        best_gap, best_start = 0, start
+        for gap in range(max(length, 1), MAX_GAP + 1):
+            heap = heaps[gap]
+            if len(heap) > 0 and heap[0] < best_start:
+                best_gap, best_start = gap, heap[0]
+        if best_gap > 0:
+            heapq.heappop(heaps[best_gap])
+            if best_gap > length:
+                heapq.heappush(heaps[best_gap - length], best_start + length)
+        total += span_checksum(file_id, best_start, length)
+    return total
+
+
+def read_disk_map(fname: str) -> str:
+    return read_text(fname).strip()
+
+
+def part_1(disk_map: str) -> int:
+    return compact_blocks_checksum(disk_map)
+
+
+def part_2(disk_map: str) -> int:
+    return compact_files_checksum(disk_map)
+
+
+TEST_COMPACT = "2333133121414131402"
+
+
+def test_move_files():
+    assert part_1(TEST_COMPACT) == 1928
+    assert part_2(TEST_COMPACT) == 2858
+    assert part_1("12345") == 60
+    assert part_2("12345") == 132
+
+
+if __name__ == "__main__":
+    full_compact = read_disk_map(resolve_path("data/day9.txt", __file__))
+    print(part_1(full_compact))
+    print(part_2(full_compact))
@@ -1,116 +1,46 @@
-from dataclasses import dataclass
-from enum import Enum, auto
-
-
-@dataclass(frozen=True)
-class V2:
-    x: int
-    y: int
-
-    def __add__(self, that: "V2") -> "V2":
-        return V2(self.x + that.x, self.y + that.y)
-
-    def __sub__(self, that: "V2") -> "V2":
-        return V2(self.x - that.x, self.y - that.y)
-
-    def __neg__(self) -> "V2":
-        return V2(-self.x, -self.y)
-
-    def __mul__(self, that) -> "V2":
-        if isinstance(that, int):
-            return V2(self.x * that, self.y * that)
-        raise NotImplementedError
-
-    def __rmul__(self, that) -> "V2":
-        return self * that
-
-    def __hash__(self) -> int:
-        return hash(f"V2({self.x}, {self.y})")
-
-
-class Direction:
-    DOWN = V2(1, 0)
-    UP = V2(-1, 0)
-    LEFT = V2(0, -1)
-    RIGHT = V2(0, 1)
-
-    ALL = [DOWN, UP, LEFT, RIGHT]
-
-
-class DirectionEnum(Enum):
-    NORTH = auto()
-    WEST = auto()
-    EAST = auto()
-    SOUTH = auto()
-
-    def to_v2(self) -> V2:
-        match self:
-            case DirectionEnum.NORTH:
-                return V2(-1, 0)
-            case DirectionEnum.SOUTH:
-                return V2(1, 0)
-            case DirectionEnum.EAST:
-                return V2(0, 1)
-            case DirectionEnum.WEST:
-                return V2(0, -1)
-            case _:
-                raise ValueError
-
-    def clockwise(self) -> "DirectionEnum":
-        match self:
-            case DirectionEnum.NORTH:
-                return DirectionEnum.EAST
-            case DirectionEnum.SOUTH:
-                return DirectionEnum.WEST
-            case DirectionEnum.EAST:
-                return DirectionEnum.SOUTH
-            case DirectionEnum.WEST:
-                return DirectionEnum.NORTH
-            case _:
-                raise ValueError
-
-    def counter_clockwise(self) -> "DirectionEnum":
-        return self.clockwise().clockwise().clockwise()
-
-
-class Grid(list[str]):
-    def __post_init__(self) -> None:
-        assert len(self) > 0
-        # TODO assert all the  str length are the same
-
-    @property
-    def height(self) -> int:
-        return len(self)
-
-    @property
-    def width(self) -> int:
-        return len(self[0])
-
-    def is_inbounds(self, position: V2) -> bool:
-        return 0 <= position.x < self.height and 0 <= position.y < self.width
-
-    def at(self, position: V2) -> str:
-        return self[position.x][position.y]
-
-    def update(self, position: V2, s: str) -> None:
-        assert len(s) == 1
-        row = self[position.x]
-        self[position.x] = row[: position.y] + s + row[position.y + 1 :]
-
-    def find(self, target: str) -> list[V2]:
-        ps = []
-        for i in range(self.height):
-            for j in range(self.width):
-                p = V2(i, j)
-                if self.at(p) == target:
-                    ps.append(p)
-        return ps
-
-
-def is_inbounds(position: V2, grid: Grid) -> bool:
-    return 0 <= position.x < len(grid) and 0 <= position.y < len(grid[0])
-
-
-def read_grid(fname) -> Grid:
-    with open(fname) as f:
-        return Grid([x.strip() for x in f])
+"""
+Compatibility shim, the implementation lives in the geometry package and
+the shared modules at the repo root. They are imported as installed
+packages, so install the repo (`uv sync` or `pip install -e .`) before
+running a y2024 solver from this directory.
+"""
+
+from geometry import (  # noqa: F401
+    DIRECTION_OFFSETS,
+    Adjacency,
+    DenseGrid,
+    Direction,
+    DirectionEnum,
+    Grid,
+    GridV2,
+    SearchResult,
+    V2,
+    adjacency_neighbors,
+    build_adjacency,
+    is_inbounds,
+    neighbor_offsets,
+    passable_mask,
+    read_grid,
+    read_grid_dense,
+    read_grid_v2,
+    search,
+)
+
+from instrument import (  # noqa: F401
+    count,
+    counted,
+    phase,
+    timed,
+    track_cache,
+)
+
+from os_utils import (  # noqa: F401
+    iter_lines,
+    parse_ints,
+    read_ints,
+    read_text,
+    resolve_path,
+)
+
+# older solvers were written against this name
+Grid2 = Grid